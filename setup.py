@@ -63,6 +63,7 @@ setup(
     package_dir={'': 'src'},
     dependency_links=[],
     install_requires=requirements(),
+    extras_require={'numpy': ['numpy']},
     test_require=requirements('requirements-test.txt'),
     test_suite='tests',
     scripts=[
@@ -74,8 +75,8 @@ setup(
         'Programming Language :: Python :: 3.7',
         'Topic :: Software Development :: Interpreters',
     ],
-    keywords='brainfuck interpreter brainf'
+    keywords='brainfuck interpreter brainf',
     #include_package_data=True,
-    #package_data={},
+    package_data={'brainf': ['benchmarks/*.b']},
     #zip_safe=True
 )
@@ -26,6 +26,40 @@ Brainfuck interpreter written in Python.
 
 __version__ = '0.0.1'
 
-from .code import SourceCode
-from .memory import Memory
-from .interpreter import run, interpret
+import importlib
+
+# Public names and the modules defining them, which are only imported on
+# first use so that clients forwarding commands to a daemon start quickly
+_EXPORTS = {
+    'SourceCode': 'code',
+    'Memory': 'memory',
+    'GrowableMemory': 'memory',
+    'PagedMemory': 'memory',
+    'MappedMemory': 'memory',
+    'Program': 'compiler',
+    'run': 'interpreter',
+    'interpret': 'interpreter',
+    'execute': 'interpreter',
+    'LimitExceeded': 'limits',
+    'run_async': 'asynchronous',
+}
+
+
+def __getattr__(name):
+    """Import a public name or a submodule on first access."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'{__name__}.{_EXPORTS[name]}'), name)
+    else:
+        try:
+            value = importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return names including public ones which are yet to be imported."""
+    return sorted(set(globals()) | set(_EXPORTS))
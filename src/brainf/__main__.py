@@ -29,8 +29,13 @@ $ python -m brainf /path/to/file.b
 
 import sys
 
-from brainf.cli import main
+import brainf.client
 
 
 if __name__ == '__main__':
-    sys.exit(main())
+    # Forward to a daemon before importing the engines, which it has warm
+    status = brainf.client.main()
+    if status is None:
+        import brainf.cli
+        status = brainf.cli.main()
+    sys.exit(status)
@@ -0,0 +1,113 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Engine for running many programs concurrently on an asyncio event loop.
+
+Each program is a coroutine which awaits input only when it runs out of
+data, batches output and yields to the event loop every so many jumps
+back to the start of a loop. Sessions which wait for input cost nothing
+but their memory, so a single process can serve thousands of them.
+"""
+
+from brainf import Memory, Program, dispatch
+from brainf.compiler import IN
+from brainf.limits import Budget
+from brainf.streams import Input, Output
+
+YIELD_INTERVAL = 2**12
+
+BUFFER_SIZE = 8192
+
+BLOCK_SIZE = 2**16
+
+
+class Sink:
+    """
+    Binary sink which hands output over to an asyncio stream writer.
+    """
+
+    def __init__(self, writer):
+        """Wrap a writer, whose drain() the engine awaits."""
+        self.writer = writer
+
+    def write(self, data):
+        """Write a copy of the data to the writer."""
+        self.writer.write(bytes(data))
+
+    def flush(self):
+        """Leave flow control to the engine awaiting drain()."""
+
+
+class Source:
+    """
+    Binary source serving a block read from an asyncio stream reader.
+    """
+
+    def __init__(self):
+        """Start with no data."""
+        self.data = b''
+
+    def read(self, size):
+        """Return the block read last, which is empty at the end of input."""
+        data, self.data = self.data, b''
+        return data
+
+
+async def run_async(code, reader, writer, memory=None, eof=None, stats=None,
+                    max_steps=None, timeout=None, interval=YIELD_INTERVAL,
+                    buffer_size=BUFFER_SIZE):
+    """Run source code or a compiled program on the event loop.
+
+    Input comes from an asyncio.StreamReader, or anything with a read()
+    coroutine, which is awaited only when the program reads past the
+    data it got so far. At the end of input the cell becomes eof, or is
+    left unchanged if that is None. Output is collected into a buffer
+    written to an asyncio.StreamWriter, or anything with write() and a
+    drain() coroutine, when full, before waiting for input, when yielding
+    to the event loop every interval steps and at the end. Memory is a
+    new brainf.Memory by default. Limits are the same as in
+    brainf.execute(), including the number of steps recorded in stats.
+    """
+
+    # Imported here, which keeps it off the start-up path of the command line
+    import asyncio
+
+    program = code if isinstance(code, Program) else Program(code)
+    memory = Memory() if memory is None else memory
+    output = Output(Sink(writer), buffer_size, line_buffering=False, flush_on_input=False)
+    source = Source()
+    input = Input(source, eof, BLOCK_SIZE)
+    budget = Budget(max_steps, timeout, interval)
+
+    try:
+        for event in dispatch.run(program, memory, output, input, budget, cooperative=True):
+            output.flush()
+            await writer.drain()
+            if event == IN:
+                source.data = await reader.read(BLOCK_SIZE)
+            else:
+                await asyncio.sleep(0)
+    finally:
+        if stats is not None and budget.limited:
+            stats['steps'] = budget.steps
+    await writer.drain()
@@ -0,0 +1,125 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Batch runner which executes many programs in a pool of processes.
+
+Each job runs a program with input from an optional file and captures
+its output, error message, exit status and timing in a result dict.
+Workers keep up to brainf.cache.MAX_PROGRAMS compiled programs, so jobs
+which share an unchanged source file neither parse nor hash it again.
+"""
+
+import collections
+import concurrent.futures
+import io
+import os
+import shlex
+import time
+
+from brainf import Program, cache
+from brainf.interpreter import ENGINES
+from brainf.limits import EXIT_STATUS, LimitExceeded
+from brainf.memory import open_memory
+from brainf.streams import Input
+
+Job = collections.namedtuple('Job', 'path input_path')
+
+_programs = {}
+
+
+def read_manifest(path):
+    """Return jobs listed in a manifest file.
+
+    Each line names a program and optionally its input file, relative to
+    the manifest's directory. Blank lines and comments are skipped.
+    """
+    directory = os.path.dirname(path)
+    jobs = []
+    with open(path) as file_object:
+        for line in file_object:
+            fields = [os.path.join(directory, field) for field in shlex.split(line, comments=True)]
+            if len(fields) > 2:
+                raise ValueError(f'expected program and input in manifest line: {line.strip()}')
+            if fields:
+                jobs.append(Job(fields[0], fields[1] if len(fields) > 1 else None))
+    return jobs
+
+
+def run(jobs, max_workers=None, ordered=False, **options):
+    """Yield results of jobs executed in a process pool.
+
+    Results come in completion order unless ordered is true, in which case
+    they follow the order of jobs. Options are passed on to run_job().
+    """
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(run_job, index, job, **options)
+                   for index, job in enumerate(jobs)]
+        if not ordered:
+            futures = concurrent.futures.as_completed(futures)
+        for future in futures:
+            yield future.result()
+
+
+def run_job(index, job, cell_bits=8, eof=None, engine='ir', use_cache=True, tape='fixed',
+            **options):
+    """Return the result of running a single job with captured output.
+
+    Exit status is 0 on success, brainf.limits.EXIT_STATUS when the program
+    exceeded a limit or 1 when it could not be loaded or failed, in which
+    case stderr holds the error message. Extra options, such as max_steps
+    and timeout, are passed on to the engine. Steps are reported when
+    there is a limit.
+    """
+    output = io.BytesIO()
+    status, stderr = 0, ''
+    stats = {}
+    started = time.perf_counter()
+    try:
+        if use_cache:
+            program = cache.load(job.path, programs=_programs)
+        else:
+            program = Program.from_file(job.path)
+        if job.input_path is None:
+            input = Input(io.BytesIO(), eof)
+        else:
+            input = Input.from_file(job.input_path, eof)
+        memory = open_memory(tape, cell_bits)
+        try:
+            ENGINES[engine](program, memory, output, input, stats, **options)
+        finally:
+            memory.close()
+    except LimitExceeded as error:
+        status, stderr = EXIT_STATUS, f'{type(error).__name__}: {error}'
+    except Exception as error:
+        status, stderr = 1, f'{type(error).__name__}: {error}'
+    return {
+        'index': index,
+        'path': job.path,
+        'input': job.input_path,
+        'status': status,
+        'stdout': output.getvalue().decode('utf-8', 'replace'),
+        'stderr': stderr,
+        'steps': stats.get('steps'),
+        'time': time.perf_counter() - started,
+    }
+
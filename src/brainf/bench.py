@@ -0,0 +1,159 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Benchmarks of the execution engines on a bundled corpus of programs.
+
+Every benchmark runs on each engine in a separate process, first a few
+times to warm up and then repeatedly to take measurements. Results include
+wall times, instructions per second and peak memory of the process, and
+can be saved as JSON to compare against a later run.
+"""
+
+import collections
+import concurrent.futures
+import io
+import os
+import platform
+import statistics
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from brainf import Memory, Program, __version__, jit, transpiler
+from brainf.interpreter import ENGINES
+
+CORPUS = os.path.join(os.path.dirname(__file__), 'benchmarks')
+
+Benchmark = collections.namedtuple('Benchmark', 'name path input instructions')
+
+
+def _no_input():
+    """Return empty input."""
+    return b''
+
+
+def _text_input():
+    """Return several kilobytes of text for the ROT13 filter."""
+    return (b'Sphinx of black quartz, judge my vow! ' * 4 + b'\n') * 50
+
+
+def _program_input():
+    """Return the ROT13 filter followed by its input for the self-interpreter."""
+    with open(os.path.join(CORPUS, 'rot13.b'), 'rb') as file_object:
+        return file_object.read() + b'!Hello, World!\n'
+
+
+BENCHMARKS = {
+    benchmark.name: benchmark for benchmark in [
+        Benchmark('mandelbrot', os.path.join(CORPUS, 'mandelbrot.b'), _no_input, 518252177),
+        Benchmark('sieve', os.path.join(CORPUS, 'sieve.b'), _no_input, 41656438),
+        Benchmark('hanoi', os.path.join(CORPUS, 'hanoi.b'), _no_input, 139340461),
+        Benchmark('selfint', os.path.join(CORPUS, 'selfint.b'), _program_input, 124424121),
+        Benchmark('rot13', os.path.join(CORPUS, 'rot13.b'), _text_input, 21141754),
+    ]
+}
+
+
+def available_engines():
+    """Return names of engines which can run natively on this machine.
+
+    Skip engines which would otherwise fall back to another one.
+    """
+    engines = list(ENGINES)
+    if transpiler.find_compiler() is None:
+        engines.remove('c')
+    if not jit.is_supported():
+        engines.remove('jit')
+    return engines
+
+
+def run(names=None, engines=None, warmup=1, repeat=3):
+    """Yield results of benchmarks on engines, each in a fresh process."""
+    for name in names or BENCHMARKS:
+        for engine in engines or available_engines():
+            with concurrent.futures.ProcessPoolExecutor(1) as executor:
+                yield executor.submit(measure, BENCHMARKS[name], engine, warmup, repeat).result()
+
+
+def measure(benchmark, engine, warmup=1, repeat=3):
+    """Return a dict with measurements of a benchmark on the given engine.
+
+    Wall time of each trial includes compilation by the engine, but not
+    parsing. Peak memory is that of the whole process in kilobytes.
+    """
+    program = Program.from_file(benchmark.path)
+    data = benchmark.input()
+
+    def trial():
+        started = time.perf_counter()
+        ENGINES[engine](program, Memory(), io.BytesIO(), io.BytesIO(data))
+        return time.perf_counter() - started
+
+    for _ in range(warmup):
+        trial()
+    times = [trial() for _ in range(repeat)]
+    return {
+        'benchmark': benchmark.name,
+        'engine': engine,
+        'times': times,
+        'best': min(times),
+        'mean': statistics.mean(times),
+        'instructions_per_second': benchmark.instructions / min(times),
+        'peak_memory': peak_memory(),
+    }
+
+
+def peak_memory():
+    """Return maximum resident set size of this process in kilobytes."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage // 1024 if platform.system() == 'Darwin' else usage
+
+
+def report(results):
+    """Return a dict with results and a description of the environment."""
+    return {
+        'version': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'results': list(results),
+    }
+
+
+def compare(previous, current):
+    """Yield (benchmark, engine, previous best, current best) pairs of results.
+
+    Results missing from either report are skipped.
+    """
+    baseline = {(result['benchmark'], result['engine']): result['best']
+                for result in previous['results']}
+    for result in current['results']:
+        key = (result['benchmark'], result['engine'])
+        if key in baseline:
+            yield key + (baseline[key], result['best'])
@@ -0,0 +1,281 @@
+Towers of Hanoi with 16 disks solved iteratively with a binary counter
+printing each of the 65535 moves as a pair of peg letters
+
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-]+[<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>
++<[[-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[
+-]>>>>+<[[-]>>>>+<[[-]>>>>+<[[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
+>>>>>>>>>>>>+<<<+<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>
+>>]<<<++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++.[-]<<<<<<<<<++[->>>>>>>>>>>>+<<<<<<+<<<<<<]>>>>>>>>>>>>[
+-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<[-]>>>>>>>->
+]<<->+<[>-]>[<<<<<<<[-]+>>>>>>>->]<<++++[-]<<<<<<[->>>>>>>>>>>>+
+<<<+<<<<<<<<<]>>>>>>>>>>>>[-<<<<<<<<<<<<+>>>>>>>>>>>>]<<<+++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++.[-]++
+++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>[->>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>]<<<++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++.[-]<<<<<<<<<<<<+[->>>>>>>>>>>>>>>+<<
+<<<<+<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]
+<<<<<<--->+<[>-]>[<<<<<<<<<<[-]>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<
+<<[-]+>>>>>>>>>>->]<<++++[-]<<<<<<<<<[->>>>>>>>>>>>>>>+<<<+<<<<<
+<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]<<<++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++.[-
+]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>[->>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]<<<+++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++.[-]<<<<<<<<<<<<
+<<<++[->>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<
+<<<<<<<[-]>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<[-]+>>>>>>>>>
+>>>>->]<<++++[-]<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<
+<<<<]>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]<
+<<++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++.[-]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>]<<<+++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++.[-]<<<<<<<<<<<<<<<<<<+[->>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<
+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>
+>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<<<<<<<<[-]>>>>>>>>>>
+>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<[-]+>>>>>>>>>>>>>>>>->]<<++
+++[-]<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<
+<<]>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>
+>>>>>]<<<+++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++.[-]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<
+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<
+<<<+>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<++[->>
+>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>
+>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>]<<<
+<<<--->+<[>-]>[<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>->]<<->+
+<[>-]>[<<<<<<<<<<<<<<<<<<<[-]+>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<
+<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<
+<<<]>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
+>>>>>>>>>>>>>>>]<<<+++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++.[-]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>
+>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>[
+-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++.[-
+]<<<<<<<<<<<<<<<<<<<<<<<<+[->>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<
+<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<
+<<<<<<<<<<<<<<<<[-]+>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<<<<
+<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<
+<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>
+>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++.[-]++++++++++.[-]<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<
+<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>]<<<+++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<++[->>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<<<<<<<<<<<<
+<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<
+<<<<<<<<<[-]+>>>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<<<<<<<<
+<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<
+<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++.[-]++++++++++.[-]<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<+++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++.[-]<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<+[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
++<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<[-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<<<<<<<<<<<
+<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<+++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++.[-]
+++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
++<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+++[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<
+<<<<<--->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+[-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>]<<<+++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++.[-]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++.
+[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+[->>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<
+[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-
+]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++.[-]++++++++++.[-]<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<+++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<++[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<
+<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
++>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[
+-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++++.[-]+++++
++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>]<<<+++++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+[->>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<[-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>]<<<+++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++.[-]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<
+<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++
++++++++++++++++++++++++++++++++++++++++++++++++++++++.[-]<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<++[->>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<[-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-
+]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<+++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++.[-]++++++++++.[-]<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<+[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<[-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>->
+]<<++++[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<
+<<++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
++++.[-]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>
+[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>]<<<+++++++++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<++[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+
+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<[-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>->]<<++++[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<
+<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<++++++++++++++++++++++++++++++++
++++++++++++++++++++++++++++++++++.[-]++++++++++.[-]<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<>->]<<<<-]>[<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<+++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++.[
+-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+[->>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<--->+<[>-]>[<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>->]<<->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>->]<<++++[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<+
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+.[-]++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]
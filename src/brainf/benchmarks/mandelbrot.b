@@ -0,0 +1,217 @@
+Mandelbrot set rendered as ASCII art on a grid of 41 by 21 characters
+with up to 16 iterations per point
+
+Numbers are fixed point pairs of sign and magnitude with four
+fractional bits so that all arithmetic fits in 8 bit cells
+
+[-]+++++++++++++++++++++>>>[-]++++++++++++++++++++++++++++++++++
+++++++++++++++++++<<<[>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>]<<<[-]++++++++++++++++++++++++++++++++>>>[-]<<
+<<<+<[>>>>+<[>>>+<<-]>[<>->]<<<<-]>[<>->]<<>>>>>>[<<<<<<->>>->>>
+[-]<<<<<+<[>>>>+<[>>>+<<-]>[<>->]<<<<-]>[<>->]<<>>>>>>]<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<[
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>-]
+>[<>->]<<<<<[-<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>]
+>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]<<<[-]+++++++++++++++++++
+++++++++++++++++++++++[>>>[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<[-]+++++
++++++++++++++++++++++++++++>>>[-]<<<<<+<[>>>>+<[>>>+<<-]>[<>->]<
+<<<-]>[<>->]<<>>>>>>[<<<<<<->>>->>>[-]<<<<<+<[>>>>+<[>>>+<<-]>[<
+>->]<<<<-]>[<>->]<<>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<[<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>-]>[<>-
+>]<<<<<[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>]>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>[-]>>>[-]>>>[-]>>>
+[-]>>>[-]+[>>>[-]<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>+<<<<<<<<<<<<+<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>]<<<<<<<<<[-]+++++++++++++++++++++++++++++++++>>>>>
+>>>>[-]<<<<<<<<<<<+<[>>>>+<[>>>>>>>>>+<<<<<<<<-]>[<>->]<<<<-]>[<
+>->]<<>>>>>>>>>>>>[<<<<<<<<<<<<->>>->>>>>>>>>[-]<<<<<<<<<<<+<[>>
+>>+<[>>>>>>>>>+<<<<<<<<-]>[<>->]<<<<-]>[<>->]<<>>>>>>>>>>>>]<<<<
+<<[-]>>>[-]<<<<<+<[>>>+<<-]>[<>->]<<<<<[->>>>>>>>>+<<<<<<<<<]>>>
+[->>>>>>+<<<<<<]>>>>>>[-]<<<<<<<<<<<<[-]+>>>>>>>>>>+<[<<<<<<<<<-
+>>>>>>>>>>-]>[<>->]<<[-]<<<<<<<<<[-<<<+>>>]<<<<<<<<<<<<[->>>>>>>
+>>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>
+>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>
+>>>>>>]<<<<<<<<<[-]+++++++++++++++++++++++++++++++++>>>>>>>>>[-]
+<<<<<<<<<<<+<[>>>>+<[>>>>>>>>>+<<<<<<<<-]>[<>->]<<<<-]>[<>->]<<>
+>>>>>>>>>>>[<<<<<<<<<<<<->>>->>>>>>>>>[-]<<<<<<<<<<<+<[>>>>+<[>>
+>>>>>>>+<<<<<<<<-]>[<>->]<<<<-]>[<>->]<<>>>>>>>>>>>>]<<<<<<[-]>>
+>[-]<<<<<+<[>>>+<<-]>[<>->]<<<<<[->>>>>>>>>+<<<<<<<<<]>>>[->>>>>
+>+<<<<<<]>>>>>>[-]<<<<<<<<<<<<[-]+>>>>>>>>>>+<[<<<<<<<<<->>>>>>>
+>>>-]>[<>->]<<[-]<<<<<<<<<[-<<<+>>>]<<+<[<<<[-]>>>>-]>[<>>>>>>[-
+]>>>>>>>>>[-]++++++++++++++++<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>]<<<[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<
+<<[-<<<->+<[>-]>[<[-]++++++++++++++++<<<<<<<<<+>>>>>>>>>>->]<<>>
+>]>>>]<<<<<<[-]<<<<<<[-]>>>>>>[-]++++++++++++++++<<<<<<<<<<<<<<<
+<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<[-<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<
+<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>]<<<<<<[-<<<->+<[>-]>[<[-]++++++++++++++++<<<<<<+>>>>>>>-
+>]<<>>>]>>>]<<<<<<[-]<<<<<<<<<[->>>>>>>>>+<<<+<<<<<<]>>>>>>>>>[-
+<<<<<<<<<+>>>>>>>>>]<<<<<<[->>>>>>+<<<+<<<]>>>>>>[-<<<<<<+>>>>>>
+]<<<[->>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<+<<<<<<]>>>>>>>>>>>>>>>>>>[
+-<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>]<<<<<<<<<[-]+++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++>>>>>>>>>[-]
+<<<<<<<<<<<+<[>>>>+<[>>>>>>>>>+<<<<<<<<-]>[<>->]<<<<-]>[<>->]<<>
+>>>>>>>>>>>[<<<<<<<<<<<<->>>->>>>>>>>>[-]<<<<<<<<<<<+<[>>>>+<[>>
+>>>>>>>+<<<<<<<<-]>[<>->]<<<<-]>[<>->]<<>>>>>>>>>>>>]<<<<<<[-]>>
+>[-]<<<<<+<[>>>+<<-]>[<>->]<<<<<[->>>>>>>>>+<<<<<<<<<]>>>[->>>>>
+>+<<<<<<]>>>>>>[-]<<<<<<<<<<<<[-]+>>>>>>>>>>+<[<<<<<<<<<->>>>>>>
+>>>-]>[<>->]<<[-]<<<<<<<<<<<<[-]>>>>+<[<<<<<<<<<<<<<<<<<<[-]>>>>
+>>>>>>>>>>>>>>>-]>[<>>>[-]>>>>>>>>>>>>>>>>>>[-]++++++++<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<[-
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<[-<<<->+<[>-
+]>[<[-]++++++++<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>->]<<>>>]>>
+>]<<<<<<[-]<<<<<<<<<<<<<<<[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<+<[>>>>>>>+<[>-]>[<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<>->]<<<<<<<-]>[<>>>>>>>+<[>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<-]>[<>->]<<
+<<<<<<>->]<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+<[>>>>+<[>>>>>>>>>>>>>>>>>>>>
+>>>>>>>+<<<<<<<<<<<<<<<<<<<<<<<<<<-]>[<>->]<<<<-]>[<>->]<<>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<->>>->>>>
+>>>>>>>>>>>>>>>>>>>>>>>[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+<[>>>>+<
+[>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<<<<<<<<-]>[<>->]
+<<<<-]>[<>->]<<>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<[-]>>>
+[-]<<<<<<<<<<<<<<<<<+<[>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<-]>[<>->]<<
+<<<[->>>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<<<]>>>[->>>>>>>>>>
+>>>>>>>>+<<<<<<<<<<<<<<<<<<]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>+<<<<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>[-]<<<<<<<<<<<+<[>>>>>>>+<[>-]>[<>>>>>>+<<<<<<>->]<<<
+<<<<-]>[<>>>>>>>+<[>>>>>>+<<<<<-]>[<>->]<<<<<<<<>->]<<>>>>>>>>>>
+>>>+<[<<<<<<<<<<<+<[>>>>>>>>>>>>>>>[-]<<<<<+<[<<<<<+<[>>>>>>>>>>
+>>+<<<<<<<<<<<-]>[<>->]<<>>>>>>>-]>[<>->]<<>>>>>>[<<<<<<-<<<<<<-
+>>>>>>>>>>>>[-]<<<<<+<[<<<<<+<[>>>>>>>>>>>>+<<<<<<<<<<<-]>[<>->]
+<<>>>>>>>-]>[<>->]<<>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>+<[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>-]>[<>->]<<>>>>>>[-<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<-]>[
+<>>>>>>>>>>>>>>>[-]<<<<<<<<<<<+<[>>>>>>>+<[>>>>>>+<<<<<-]>[<>->]
+<<<<<<<-]>[<>->]<<>>>>>>>>>>>>[<<<<<<<<<<<<->>>>>>->>>>>>[-]<<<<
+<<<<<<<+<[>>>>>>>+<[>>>>>>+<<<<<-]>[<>->]<<<<<<<-]>[<>->]<<>>>>>
+>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<[<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>-]>[<>->]<<<<<<<<[-<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>]>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<
+<<>->]<<[-]>>>>>>[-]>>>>>>>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]>>>>>>[-]<<<[-<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>]>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]>>>>->]<<[-]<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<<<<+<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[->>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>[-
+]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-]<<<<<<<<<<<<<<+
+<[>>>>>>>>>>+<[>-]>[<>>>>>>+<<<<<<>->]<<<<<<<<<<-]>[<>>>>>>>>>>+
+<[>>>>>>+<<<<<-]>[<>->]<<<<<<<<<<<>->]<<>>>>>>>>>>>>>>>>+<[<<<<<
+<<<<<<<<<+<[>>>>>>>>>>>>>>>>>>[-]<<<<<+<[<<<<<<<<<<<<<<+<[>>>>>>
+>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<<<<-]>[<>->]<<>>>>>>>>>>>>>>>>-
+]>[<>->]<<>>>>>>[<<<<<<-<<<<<<<<<<<<<<<->>>>>>>>>>>>>>>>>>>>>[-]
+<<<<<+<[<<<<<<<<<<<<<<+<[>>>>>>>>>>>>>>>>>>>>>+<<<<<<<<<<<<<<<<<
+<<<-]>[<>->]<<>>>>>>>>>>>>>>>>-]>[<>->]<<>>>>>>]<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>+<[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>-]>[<>->]<<>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<
+<<<<<<<<<<[-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>
+>>>]>>>>-]>[<>>>>>>>>>>>>>>>>>>[-]<<<<<<<<<<<<<<<<<<<<+<[>>>>>>>
+>>>>>>>>>+<[>>>>>>+<<<<<-]>[<>->]<<<<<<<<<<<<<<<<-]>[<>->]<<>>>>
+>>>>>>>>>>>>>>>>>[<<<<<<<<<<<<<<<<<<<<<->>>>>>>>>>>>>>>->>>>>>[-
+]<<<<<<<<<<<<<<<<<<<<+<[>>>>>>>>>>>>>>>>+<[>>>>>>+<<<<<-]>[<>->]
+<<<<<<<<<<<<<<<<-]>[<>->]<<>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>[-]>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>+<[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>-]>[<>->]
+<<<<<<<<<<<<<<<<<[-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>
+>>>>>>>>>>]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<>-
+>]<<[-]>>>>>>>>>[-]>>>>>>>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<[-]>>>[-]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]>>>>
+>>>>>[-]<<<<<<<<<<<<[-<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>
+>>>>>>>>>>>>>]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]>>>>->]<<[-
+]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+[->>>>>>>>>>>>>>>>>>
+>>>>>>+<<<<<<<<<<<<<<<+<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<
+<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>]<<<<<<<<<<<<<<<----
+------------>+<[>-]>[<<<<<<<->>>>>>>->]<<[-]>>>>>>>>>>>>>->]<<[-
+]<<<<<<<<<[-]>>>[-]<<<<<<<<<>->]<<[-]<<<]<<<[->>>>>>>>>>>>>>>+<<
+<<<<+<<<<<<<<<]>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>]
+<<<<<+<[>-]>[<>>>[-]++++++++++++++++++++++++++++++++<<<>->]<<->+
+<[>-]>[<>>>[-]++++++++++++++++++++++++++++++++<<<>->]<<->+<[>-]>
+[<>>>[-]++++++++++++++++++++++++++++++++++++++++++++++<<<>->]<<-
+>+<[>-]>[<>>>[-]++++++++++++++++++++++++++++++++++++++++++++++<<
+<>->]<<->+<[>-]>[<>>>[-]++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]
++++++++++++++++++++++++++++++++++++++++++++++<<<>->]<<->+<[>-]>[
+<>>>[-]+++++++++++++++++++++++++++++++++++++++++++++<<<>->]<<->+
+<[>-]>[<>>>[-]++++++++++++++++++++++++++++++++++++++++++++++++++
++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]+++++++++++++++++++++++++++
+++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]++++++++++++++++++++++
++++++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]+++++++++++++++++
++++++++++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]+++++++++++++
++++++++++++++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]+++++++++
+++++++++++++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]++++++++++
++++++++++++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]+++++++++++
+++++++++++++++++++++++++<<<>->]<<->+<[>-]>[<>>>[-]++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++<<<>->]<<-[-]>
+>>.[-]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+<<<-]>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>++++++++++.[-]<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<--<<<-]
@@ -0,0 +1,29 @@
+ROT13 filter which reads characters until the end of input
+Taken from Wikipedia
+
+-,+[
+    -[
+        >>++++[>++++++++<-]
+        <+<-[
+            >+>+>-[>>>]
+            <[[>+<-]>>+>]
+            <<<<<-
+        ]
+    ]>>>[-]+
+    >--[-[<->+++[-]]]<[
+        ++++++++++++<[
+            >-[>+>>]
+            >[+[<+>-]>+>>]
+            <<<<<-
+        ]
+        >>[<+>-]
+        >[
+            -[
+                -<<[-]>>
+            ]<<[<<->>-]>>
+        ]<<[<<+>>-]
+    ]
+    <[-]
+    <.[-]
+    <-,+
+]
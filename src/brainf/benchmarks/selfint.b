@@ -0,0 +1,37 @@
+Brainfuck interpreter written in Brainfuck
+
+Reads a program from input up to an exclamation mark and runs it
+with the rest of input
+
+Every instruction and data cell occupies a slot of ten cells with a rail
+cell which is cleared at the instruction pointer and at the data pointer
+so that the interpreter can scan back and forth between them
+
+>>>>>>>>>>>>>>>>>>[-]+[[-]<<<<<<,>>>>>>+<<<<<+<[>-]>[<>>>>>>[-]<
+<<<<<>->]<<--------------------------------->+<[>-]>[<>>>>>>[-]<
+<<<<<>->]<<---------->+<[>-]>[<<[-]+>>->]<<->+<[>-]>[<<[-]++++++
+++>>->]<<->+<[>-]>[<<[-]++>>->]<<->+<[>-]>[<<[-]+++++++>>->]<<--
+------------>+<[>-]>[<<[-]+++>>->]<<-->+<[>-]>[<<[-]++++>>->]<<-
+---------------------------->+<[>-]>[<<[-]+++++>>->]<<-->+<[>-]>
+[<<[-]++++++>>->]<<+++++++++++++++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++[-]<[<+>>>>>>>>[
+->>>>>>>>>>+<<<<<<<<<<]>>>]>>>>>>>]<<<<<<<<[-]+[<<<<<<<<<<]>>>>>
+>>>>>[-]>[[->+<<+>]<[->+<]>>->+<[>-]>[<<<>>>>>>>>>>[>>>>>>>>>>]>
++<<<<<<<<<<<[<<<<<<<<<<]>>>->]<<->+<[>-]>[<<<>>>>>>>>>>[>>>>>>>>
+>>]>-<<<<<<<<<<<[<<<<<<<<<<]>>>->]<<->+<[>-]>[<<<>>>>>>>>>>[>>>>
+>>>>>>]+<<<<<<<<<<[-]<<<<<<<<<<[<<<<<<<<<<]>>>->]<<->+<[>-]>[<<<
+>>>>>>>>>>[>>>>>>>>>>]+>>>>>>>>>>[-]<<<<<<<<<<[<<<<<<<<<<]>>>->]
+<<->+<[>-]>[<>>>>[-]+<<<<<<>>>>>>>>>>[>>>>>>>>>>]>[->>>>+<<<<<+>
+]<[->+<]>>>>>>[-]+<[[-]>[-]<<<<<<<<<<<<<<<<[<<<<<<<<<<]>>>>>>-]>
+[<>[-]<<<<<<<<<<<<<<<<[<<<<<<<<<<]>>>>>>>>[-]+<<<>->]<<<<<>->]<<
+->+<[>-]>[<>>>>[-]+<<<<<<>>>>>>>>>>[>>>>>>>>>>]>[->>>>+<<<<<+>]<
+[->+<]>>>>>>[-]+<[[-]>[-]<<<<<<<<<<<<<<<<[<<<<<<<<<<]>>>>>>>>>[-
+]+<<<<>-]>[<>[-]<<<<<<<<<<<<<<<<[<<<<<<<<<<]>>>>>>->]<<<<<>->]<<
+->+<[>-]>[<<<>>>>>>>>>>[>>>>>>>>>>]>.<<<<<<<<<<<[<<<<<<<<<<]>>>-
+>]<<->+<[>-]>[<<<>>>>>>>>>>[>>>>>>>>>>]>,<<<<<<<<<<<[<<<<<<<<<<]
+>>>->]<<++++++++[-]>>>>>>[[-]<<<[-]+[<<<<<+>>>>>>>>>>[-]<<<<<[->
+>>>>>>>>>+<<<<<<<<<<]>>>>>>[->+<<+>]<[->+<]>>----->+<[>-]>[<>>>+
+<<<>->]<<->+<[>-]>[<>>>-<<<>->]<<++++++[-]>>>]>>>]>[[-]<<<<[-]+[
+<<<<<+<<<<<<<<<<[-]>>>>>>>>>>>>>>>[-<<<<<<<<<<+>>>>>>>>>>]<<<<<<
+<<<<<<<<[->+<<+>]<[->+<]>>------>+<[>-]>[<>>>+<<<>->]<<+>+<[>-]>
+[<>>>-<<<>->]<<+++++[-]>>>]>>>>]<<<<<<<<<+>>>>>>>>>>[-]>]
@@ -0,0 +1,68 @@
+Prime numbers up to 10000 found with an incremental sieve of Eratosthenes
+
+Every prime up to 100 keeps a countdown in a list of records on the tape
+which is walked for each candidate number
+
+[-]++>>>>>>>>>>>>>>>[-]++>>>[-]+++++++++++++++++++++++++++++++++
+++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+++>>>>>>[-]+++++++++++++++++++++++++++++++++++++++>>>[-]++++++++
++++++++>>>[-]+[>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>[>->+<[>-]>[<<[->+>>>>+<<<<<]>>>>>[-<<<<<+>>>>>
+]<[-]+<<<>->]<<>>>[->>>>>>+<<<<<<]>>]<<<<<<[>>>>>>>>>>[-<<<<<<+>
+>>>>>]<<<<<<<<<<<<<<<<]>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<+<[>-]>[<<<<<<<<<+<[>>>>>>>>>>>>>>>>>>>>>[-]+<<
+<<<<<<<<<<<<<<<<<<-]>[<>->]<<>>>>>>>>>>>>>>>>>>>>>>+<[<<<<<<<<<<
+<<<<<<<<<<<++++++++++++++++++++++++++++++++++++++++++++++++.----
+-------------------------------------------->>>>>>>>>>>>>>>>>>>>
+>>-]>[<>->]<<<<<<<<<<<<<<<<<<<<<<<<<+<[>>>>>>>>>>>>>>>>>>>>>>>>[
+-]+<<<<<<<<<<<<<<<<<<<<<<<-]>[<>->]<<>>>>>>>>>>>>>>>>>>>>>>>>>+<
+[<<<<<<<<<<<<<<<<<<<<<<<<+++++++++++++++++++++++++++++++++++++++
++++++++++.------------------------------------------------>>>>>>
+>>>>>>>>>>>>>>>>>>>-]>[<>->]<<<<<<<<<<<<<<<<<<<<<<<<<<<<+<[>>>>>
+>>>>>>>>>>>>>>>>>>>>>>[-]+<<<<<<<<<<<<<<<<<<<<<<<<<<-]>[<>->]<<>
+>>>>>>>>>>>>>>>>>>>>>>>>>>>+<[<<<<<<<<<<<<<<<<<<<<<<<<<<<+++++++
++++++++++++++++++++++++++++++++++++++++++.----------------------
+-------------------------->>>>>>>>>>>>>>>>>>>>>>>>>>>>-]>[<>->]<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+<[>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[
+-]+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<-]>[<>->]<<>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>+<[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+++++++++++++++++++++
++++++++++++++++++++++++++++.------------------------------------
+------------>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>-]>[<>->]<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<+++++++++++++++++++++++++++++++++++++++++
++++++++.------------------------------------------------>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>>>[-]>>>>>>++++++++++.[-]<<<<<<<<<<<<<<<<
+<<<<+<[<<<[->>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<]>>>>>>>
+>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>]<<<[
+->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>>[>>>>>[->>>>>>+<<<<<<]>]>>>>>[-<<<<<+>+>>>>]<<<<<[<<<<
+<<]<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<-]>[<>->]<<>>>>->]<<[-]<<+<[-<<<+>>>>-]>[<>->]<<<<<<<<
+<<<<<<<<<<<<+[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>>>>>]<<<---------->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+<<[-]>>>+[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>>>>>]<<<---------->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-
+]>>>+[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+>]<<<---------->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>
++[->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<
+<---------->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>+[->
+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>+<<<+<<<<<<<<<<<<<<<<<<<<<<<<
+<<<<<<<<<]>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>[-<<<<<<<<<<<<<<<<
+<<<<<<<<<<<<<<<<<<<<+>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>]<<<---
+------->+<[>-]>[<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<[-]>>>>>>>>>>>
+>>>>>>>>>>>>>>>>>>>>>>>->]<<++++++++++[-]<<<>->]<<++++++++++[-]<
+<<>->]<<++++++++++[-]<<<>->]<<++++++++++[-]<<<>->]<<++++++++++[-
+]<<<<<+<[>-]>[<<<<->>>>->]<<->>>[-]<<+<[>>>[-]+<<-]>[<>->]<<<<+<
+[>>>>>>[-]+<<<<<-]>[<>->]<<>>>>>>]
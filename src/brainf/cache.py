@@ -0,0 +1,190 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+On-disk cache of compiled programs.
+
+Programs are serialized into compact binary files named after a hash of
+the raw source, the package version, the optimization level and the byte
+order, so that running an unchanged file skips parsing and compilation
+altogether. The cache is bounded in size and evicts the least recently
+used files first.
+"""
+
+import array
+import glob
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from brainf import Program, __version__
+
+MAGIC = b'BFC\x04'
+COUNT = struct.Struct('=I')
+TYPECODES = 'Biii'
+MAX_SIZE = 16 * 2**20
+MAX_PROGRAMS = 256
+
+
+def load(path, optimize=True, stats=None, programs=None):
+    """Return compiled program from the given file, reusing a cached one.
+
+    Given a dict, also keep up to MAX_PROGRAMS programs in it, keyed by the
+    file's path and status, so that a long-running process skips hashing
+    files which have not changed since. Record whether the program was
+    found in either cache in stats.
+    """
+    if not os.path.isfile(path):
+        # Pipes can only be read once, which leaves nothing to hash
+        if stats is not None:
+            stats['program_cached'] = False
+        return Program.from_file(path, optimize)
+    if programs is not None:
+        status = os.stat(path)
+        memo_key = (os.path.abspath(path), status.st_dev, status.st_ino,
+                    status.st_size, status.st_mtime_ns, optimize)
+        program = programs.get(memo_key)
+        if program is not None:
+            if stats is not None:
+                stats['program_cached'] = True
+            return program
+        program = load(path, optimize, stats)
+        if len(programs) >= MAX_PROGRAMS:
+            del programs[next(iter(programs))]
+        programs[memo_key] = program
+        return program
+    with open(path, 'rb') as file_object:
+        try:
+            with mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                digest = key(source, optimize)
+        except ValueError:
+            # Empty files cannot be mapped
+            digest = key(file_object.read(), optimize)
+    directory = program_directory()
+    cache_path = os.path.join(directory, f'{digest}.bfc')
+    program = read(cache_path)
+    if stats is not None:
+        stats['program_cached'] = program is not None
+    if program is None:
+        program = Program.from_file(path, optimize)
+        try:
+            write(cache_path, program)
+            evict(directory)
+        except OSError:
+            pass
+    return program
+
+
+def key(source, optimize=True):
+    """Return hex digest identifying compiled source code."""
+    digest = hashlib.sha256(f'{__version__}:{int(optimize)}:{sys.byteorder}:'.encode('ascii'))
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def dumps(program):
+    """Return binary representation of the program in native byte order."""
+    arrays = (program.opcodes, program.offsets, program.arguments, program.positions)
+    return MAGIC + COUNT.pack(len(program)) + b''.join(values.tobytes() for values in arrays)
+
+
+def loads(data):
+    """Return program from its binary representation."""
+    header = len(MAGIC) + COUNT.size
+    if data[:len(MAGIC)] != MAGIC or len(data) < header:
+        raise ValueError('invalid compiled program')
+    count, = COUNT.unpack_from(data, len(MAGIC))
+    arrays = [array.array(typecode) for typecode in TYPECODES]
+    if len(data) != header + count * sum(values.itemsize for values in arrays):
+        raise ValueError('invalid compiled program')
+    start = header
+    for values in arrays:
+        values.frombytes(data[start:start + count * values.itemsize])
+        start += count * values.itemsize
+    return Program.from_arrays(*arrays)
+
+
+def read(path):
+    """Return cached program or None if missing or invalid."""
+    try:
+        with open(path, 'rb') as file_object:
+            program = loads(file_object.read())
+    except (OSError, ValueError):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        # Read-only caches still serve programs, only without eviction order
+        pass
+    return program
+
+
+def write(path, program):
+    """Atomically store program in the cache."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as file_object:
+            file_object.write(dumps(program))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def evict(directory, max_size=MAX_SIZE, pattern='*.bfc'):
+    """Remove least recently used files until the cache fits max_size.
+
+    Only files matching the glob pattern, compiled programs by default,
+    count towards the size.
+    """
+    entries = []
+    for path in glob.glob(os.path.join(directory, pattern)):
+        try:
+            status = os.stat(path)
+        except OSError:
+            continue
+        entries.append((status.st_mtime, status.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        total -= size
+
+
+def cache_directory():
+    """Return directory where cached artifacts are kept."""
+    root = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(root, 'brainf')
+
+
+def program_directory():
+    """Return directory where compiled programs are kept."""
+    return os.path.join(cache_directory(), 'programs')
@@ -29,24 +29,288 @@ $ brainf.py /path/to/file.b
 or
 
 $ python -m brainf /path/to/file.b
+
+To run many programs in parallel with results printed as JSON lines:
+$ brainf.py batch --jobs 8 /path/to/*.b
+
+To benchmark the engines:
+$ brainf.py bench --save results.json
+
+To keep warm workers in a daemon, which runs commands of clients that
+have BRAINF_SOCKET set to the path of its socket:
+$ brainf.py serve /path/to/socket
 """
 
 import argparse
+import json
+import os
+import sys
+
 import brainf
+import brainf.batch
+import brainf.bench
+import brainf.limits
+import brainf.memory
+import brainf.profiler
+import brainf.sampler
+import brainf.server
+import brainf.snapshot
 
+EOF_VALUES = {
+    'unchanged': None,
+    '0': 0,
+    '-1': -1,
+}
 
-def parse_args():
+
+def parse_args(argv=None):
     """Parse command line arguments."""
     parser = argparse.ArgumentParser()
     parser.add_argument('path')
-    return parser.parse_args()
+    parser.add_argument('--text', action='store_true',
+                        help='use platform-specific newlines')
+    parser.add_argument('--input', metavar='PATH',
+                        help='read input from a file instead of stdin')
+    parser.add_argument('--stats', action='store_true',
+                        help='print execution statistics on stderr')
+    parser.add_argument('--profile', action='store_true',
+                        help='interpret the source code and print the hottest loops '
+                             'and a heatmap on stderr')
+    parser.add_argument('--profile-json', metavar='PATH',
+                        help='interpret the source code and save its profile as JSON')
+    parser.add_argument('--sample', metavar='PATH',
+                        help='sample the running engine and save collapsed stacks '
+                             'of loops for flame graphs')
+    parser.add_argument('--sample-interval', type=float, default=brainf.sampler.INTERVAL,
+                        metavar='SECONDS', help='time between samples (default: %(default)s)')
+    parser.add_argument('--tape-file', metavar='PATH',
+                        help='save cells of the mapped tape to a file for inspection')
+    parser.add_argument('--snapshot', metavar='PATH',
+                        help='save a snapshot and stop on SIGTERM with exit status {}'.format(
+                            brainf.snapshot.EXIT_STATUS))
+    parser.add_argument('--snapshot-every', type=int, metavar='N',
+                        help='also save a snapshot every N loop iterations')
+    parser.add_argument('--resume', metavar='PATH',
+                        help='resume the program from a snapshot')
+    add_engine_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.tape_file and args.tape != 'mapped':
+        parser.error('--tape-file requires --tape mapped')
+    if args.snapshot_every and not args.snapshot:
+        parser.error('--snapshot-every requires --snapshot')
+    if (args.snapshot or args.resume) and args.engine != 'ir':
+        parser.error('snapshots require --engine ir')
+    return args
+
+
+def parse_batch_args(argv):
+    """Parse command line arguments of the batch mode."""
+    parser = argparse.ArgumentParser(prog='brainf batch')
+    parser.add_argument('paths', nargs='*', metavar='path')
+    parser.add_argument('--manifest', metavar='PATH',
+                        help='file listing a program and an optional input file per line')
+    parser.add_argument('--input', metavar='PATH',
+                        help='read input of programs given as arguments from a file')
+    parser.add_argument('--jobs', type=int, metavar='N',
+                        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--ordered', action='store_true',
+                        help='print results in input order instead of completion order')
+    parser.add_argument('--output', metavar='PATH',
+                        help='write results to a file instead of stdout')
+    add_engine_arguments(parser)
+    args = parser.parse_args(argv)
+    if not args.paths and not args.manifest:
+        parser.error('expected program paths or a manifest')
+    return args
+
+
+def parse_bench_args(argv):
+    """Parse command line arguments of the bench mode."""
+    parser = argparse.ArgumentParser(prog='brainf bench')
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help='benchmarks to run out of {} (default: all)'.format(
+                            ', '.join(brainf.bench.BENCHMARKS)))
+    parser.add_argument('--engine', action='append', choices=brainf.interpreter.ENGINES,
+                        help='engine to benchmark, can be repeated (default: all available)')
+    parser.add_argument('--warmup', type=int, default=1, metavar='N',
+                        help='untimed runs before measuring (default: 1)')
+    parser.add_argument('--repeat', type=int, default=3, metavar='N',
+                        help='timed runs (default: 3)')
+    parser.add_argument('--save', metavar='PATH',
+                        help='save results as JSON')
+    parser.add_argument('--compare', metavar='PATH',
+                        help='compare against results saved earlier')
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in brainf.bench.BENCHMARKS:
+            parser.error(f'unknown benchmark: {name}')
+    return args
+
+
+def parse_serve_args(argv):
+    """Parse command line arguments of the serve mode."""
+    parser = argparse.ArgumentParser(prog='brainf serve')
+    parser.add_argument('socket', help='path of the Unix socket to listen on')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='number of worker processes (default: number of CPUs)')
+    return parser.parse_args(argv)
+
+
+def add_engine_arguments(parser):
+    """Add arguments controlling how programs are compiled and executed."""
+    parser.add_argument('--cell-bits', type=int, choices=(8, 16, 32), default=8,
+                        help='width of memory cells (default: 8)')
+    parser.add_argument('--tape', choices=brainf.memory.TAPES, default='fixed',
+                        help='memory of 65536 cells, one that grows in both directions '
+                             'or a sparse one allocated in pages, or a large memory map '
+                             '(default: fixed)')
+    parser.add_argument('--eof', choices=EOF_VALUES, default='unchanged',
+                        help='cell value on end of input (default: unchanged)')
+    parser.add_argument('--engine', choices=brainf.interpreter.ENGINES, default='ir',
+                        help='execution engine (default: ir)')
+    parser.add_argument('--tier-threshold', type=int, default=brainf.tiered.THRESHOLD,
+                        metavar='N', help='loop header executions before the tiered '
+                                          'engine compiles a loop (default: %(default)s)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='compile the program without the on-disk cache')
+    parser.add_argument('--max-steps', type=int, metavar='N',
+                        help='stop after N loop iterations with exit status {}'.format(
+                            brainf.limits.EXIT_STATUS))
+    parser.add_argument('--timeout', type=float, metavar='SECONDS',
+                        help='stop after running for SECONDS with exit status {}'.format(
+                            brainf.limits.EXIT_STATUS))
+
+
+def engine_options(args):
+    """Return keyword arguments for brainf.run() based on parsed arguments."""
+    options = {
+        'cell_bits': args.cell_bits,
+        'tape': args.tape,
+        'eof': EOF_VALUES[args.eof],
+        'engine': args.engine,
+        'use_cache': not args.no_cache,
+        'max_steps': args.max_steps,
+        'timeout': args.timeout,
+    }
+    if args.engine == 'tiered':
+        options['threshold'] = args.tier_threshold
+    return options
+
+
+def main(argv=None, programs=None):
+    """Application entry point.
+
+    Given a dict of programs, keep compiled programs in it between calls.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['batch']:
+        return run_batch(parse_batch_args(argv[1:]))
+    if argv[:1] == ['bench']:
+        return run_bench(parse_bench_args(argv[1:]))
+    if argv[:1] == ['serve']:
+        return run_serve(parse_serve_args(argv[1:]))
+    args = parse_args(argv)
+    stats = {} if args.stats else None
+    profile = brainf.profiler.Profile() if args.profile or args.profile_json else None
+    sampler = brainf.sampler.Sampler(args.sample_interval) if args.sample else None
+    checkpoint = None
+    if args.snapshot:
+        checkpoint = brainf.snapshot.Checkpoint(args.snapshot, args.snapshot_every)
+    try:
+        resume = brainf.snapshot.Snapshot.load(args.resume) if args.resume else None
+        brainf.run(args.path, text=args.text, input_path=args.input, stats=stats,
+                   profile=profile, sampler=sampler, tape_path=args.tape_file,
+                   checkpoint=checkpoint, resume=resume, programs=programs,
+                   **engine_options(args))
+    except brainf.LimitExceeded as error:
+        print(f'{error} ({error.steps} steps executed)', file=sys.stderr)
+        return brainf.limits.EXIT_STATUS
+    except brainf.snapshot.Suspended as error:
+        print(error, file=sys.stderr)
+        return brainf.snapshot.EXIT_STATUS
+    finally:
+        if stats is not None:
+            for name, value in stats.items():
+                print(f'{name}: {value}', file=sys.stderr)
+        if profile is not None and profile.code is not None:
+            print_profile(profile, args)
+        if sampler is not None and sampler.program is not None:
+            save_samples(sampler, args)
+
+
+def print_profile(profile, args):
+    """Print profile report on stderr and save it as JSON if requested."""
+    if args.profile:
+        print(profile.report(), file=sys.stderr)
+        print(file=sys.stderr)
+        print(profile.heatmap(), file=sys.stderr)
+    if args.profile_json:
+        with open(args.profile_json, 'w') as file_object:
+            json.dump(profile.to_json(), file_object)
+
+
+def save_samples(sampler, args):
+    """Save collapsed stacks with loops named after their source positions."""
+    with open(args.path, 'rb') as file_object:
+        text = file_object.read().decode('utf-8', 'replace')
+    with open(args.sample, 'w') as file_object:
+        print(sampler.collapsed(os.path.basename(args.path), brainf.code.locate(text)),
+              file=file_object)
+
+
+def run_batch(args):
+    """Run programs in parallel and print results as JSON lines.
+
+    Return the exit status of the first result of a failed program, which
+    is brainf.limits.EXIT_STATUS if it exceeded a limit and 1 otherwise.
+    """
+    jobs = [brainf.batch.Job(path, args.input) for path in args.paths]
+    if args.manifest:
+        jobs.extend(brainf.batch.read_manifest(args.manifest))
+    results = brainf.batch.run(jobs, args.jobs, args.ordered, **engine_options(args))
+    output = open(args.output, 'w') if args.output else sys.stdout
+    status = 0
+    try:
+        for result in results:
+            print(json.dumps(result), file=output, flush=True)
+            status = status or result['status']
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return status
+
+
+def run_bench(args):
+    """Run benchmarks and print a row of measurements for each engine."""
+    previous = None
+    if args.compare:
+        with open(args.compare) as file_object:
+            previous = json.load(file_object)
+    results = []
+    print(f'{"benchmark":12} {"engine":8} {"best [s]":>9} {"mean [s]":>9} '
+          f'{"instr/s":>12} {"peak [KiB]":>11}' + (' change' if previous else ''))
+    for result in brainf.bench.run(args.names, args.engine, args.warmup, args.repeat):
+        results.append(result)
+        row = (f'{result["benchmark"]:12} {result["engine"]:8} {result["best"]:9.3f} '
+               f'{result["mean"]:9.3f} {result["instructions_per_second"]:12.4g} '
+               f'{result["peak_memory"] or "-":>11}')
+        if previous:
+            for *_, before, after in brainf.bench.compare(previous, brainf.bench.report([result])):
+                row += f' {(after - before) / before:+7.1%}'
+        print(row, flush=True)
+    if args.save:
+        with open(args.save, 'w') as file_object:
+            json.dump(brainf.bench.report(results), file_object, indent=2)
 
 
-def main():
-    """Application entry point."""
-    args = parse_args()
-    brainf.run(args.path)
+def run_serve(args):
+    """Serve commands on a Unix socket until terminated."""
+    try:
+        brainf.server.serve(args.socket, args.workers)
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
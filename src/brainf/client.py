@@ -0,0 +1,101 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Client forwarding commands to a daemon with a pool of warm workers.
+
+This module only depends on the standard library, so that entry points
+can hand a command over to the daemon before importing the engines.
+"""
+
+import array
+import json
+import os
+import socket
+import sys
+
+# Environment variable naming the socket which clients forward commands to
+SOCKET_VARIABLE = 'BRAINF_SOCKET'
+
+# Commands which always run locally
+LOCAL_COMMANDS = ('batch', 'bench', 'serve')
+
+# Exit status of a command interrupted with Ctrl+C
+INTERRUPTED = 130
+
+
+def main(argv=None):
+    """Forward the command to a daemon if BRAINF_SOCKET names its socket.
+
+    Return the exit status, or None if the command should run here instead
+    because nothing listens on the socket.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    path = os.environ.get(SOCKET_VARIABLE)
+    if not path or argv[:1] and argv[0] in LOCAL_COMMANDS:
+        return None
+    try:
+        return forward(path, argv)
+    except ConnectionError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+
+def forward(path, argv, fds=(0, 1, 2)):
+    """Run command line arguments by a daemon and return its exit status.
+
+    The daemon reads and writes the given descriptors of stdin, stdout and
+    stderr directly. Return None if there is no daemon listening on the
+    path. Raise ConnectionError if the daemon hangs up without a status.
+    On KeyboardInterrupt, hang up so that the worker aborts the command.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with client:
+        try:
+            client.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        reply = bytearray()
+        try:
+            send_request(client, argv, os.getcwd(), fds)
+            while True:
+                data = client.recv(64)
+                if not data:
+                    break
+                reply.extend(data)
+        except KeyboardInterrupt:
+            client.shutdown(socket.SHUT_RDWR)
+            return INTERRUPTED
+    try:
+        return int(reply)
+    except ValueError:
+        raise ConnectionError('daemon closed the connection without exit status') from None
+
+
+def send_request(connection, argv, cwd, fds):
+    """Send arguments and working directory with the descriptors attached."""
+    data = json.dumps({'argv': list(argv), 'cwd': cwd}).encode('utf-8') + b'\n'
+    ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds))]
+    sent = connection.sendmsg([data], ancillary)
+    if sent < len(data):
+        connection.sendall(data[sent:])
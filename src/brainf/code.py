@@ -24,8 +24,23 @@
 Abstract representation of Brainfuck source code.
 """
 
+import functools
+import mmap
 import re
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+INSTRUCTIONS = '.,<>+-[]'
+
+IGNORED = bytes(set(range(256)) - set(INSTRUCTIONS.encode('ascii')))
+
+CHUNK_SIZE = 2**20
+
+VECTORIZE_THRESHOLD = 1024
+
 
 class SourceCode:
     """
@@ -40,6 +55,7 @@ class SourceCode:
 
     def __init__(self, text):
         """Normalize and parse plain text."""
+        self.text = text
         self.instructions = normalize(text)
         self.jumps = parse(self.instructions)
 
@@ -51,14 +67,53 @@ class SourceCode:
         """Return instruction at the given index."""
         return self.instructions[index]
 
+    @property
+    def positions(self):
+        """Return (line, column) pairs of instructions in the plain text."""
+        return locate(self.text)
+
 
 def normalize(text):
     """Strip anything but valid instructions."""
     return re.sub(r'[^.,<>+\-\[\]]+', '', text)
 
 
+def read_instructions(path, chunk_size=CHUNK_SIZE):
+    """Yield chunks of valid instructions from a file without reading it whole.
+
+    Regular files are memory-mapped, while pipes and the like are read in
+    chunks. Anything but instructions is deleted from the raw bytes, which
+    is safe for UTF-8 and single-byte encodings, since their multi-byte
+    characters never contain ASCII bytes.
+    """
+    with open(path, 'rb') as file_object:
+        try:
+            source = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            chunks = iter(functools.partial(file_object.read, chunk_size), b'')
+        else:
+            chunks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+        for chunk in chunks:
+            yield chunk.translate(None, IGNORED).decode('ascii')
+
+
+def locate(text):
+    """Return (line, column) pairs of valid instructions, counted from one."""
+    positions = []
+    for line_number, line in enumerate(text.split('\n'), 1):
+        for column, character in enumerate(line, 1):
+            if character in INSTRUCTIONS:
+                positions.append((line_number, column))
+    return positions
+
+
 def parse(instructions):
-    """Return a dict with indices of matching brackets."""
+    """Return a dict with indices of matching brackets.
+
+    Long instructions are matched with NumPy when it's installed.
+    """
+    if numpy is not None and len(instructions) >= VECTORIZE_THRESHOLD:
+        return parse_vectorized(instructions)
     jumps = {}
     try:
         stack = []
@@ -70,5 +125,31 @@ def parse(instructions):
                 jumps[i], jumps[j] = j, i
     except IndexError:
         raise SyntaxError(f'unbalanced brackets at position {i}')
-    else:
-        return jumps
+    if stack:
+        raise SyntaxError(f'unbalanced brackets at position {stack[0]}')
+    return jumps
+
+
+def parse_vectorized(instructions):
+    """Return a dict with indices of matching brackets computed with NumPy.
+
+    The nesting depth follows from a cumulative sum over the brackets.
+    Sorting them stably by the depth inside each pair lines up every
+    opening bracket with its closing one, since brackets of the same
+    depth alternate. Errors point at the same position as parse() does.
+    """
+    codes = numpy.frombuffer(instructions.encode('ascii'), dtype=numpy.uint8)
+    indices = numpy.flatnonzero((codes == ord('[')) | (codes == ord(']')))
+    opening = codes[indices] == ord('[')
+    depths = numpy.cumsum(numpy.where(opening, 1, -1))
+    if len(depths) and depths.min() < 0:
+        position = indices[numpy.argmax(depths < 0)]
+        raise SyntaxError(f'unbalanced brackets at position {position}')
+    if len(depths) and depths[-1] != 0:
+        position = indices[numpy.flatnonzero(opening & (depths == 1))[-1]]
+        raise SyntaxError(f'unbalanced brackets at position {position}')
+    pairs = indices[numpy.argsort(depths + ~opening, kind='stable')]
+    starts, ends = pairs[0::2].tolist(), pairs[1::2].tolist()
+    jumps = dict(zip(starts, ends))
+    jumps.update(zip(ends, starts))
+    return jumps
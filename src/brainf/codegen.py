@@ -0,0 +1,202 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Engine which translates compiled programs into Python source code.
+
+The generated function runs under CPython's own bytecode loop, with loops
+as while statements and cells addressed relative to a local pointer.
+"""
+
+import time
+
+from brainf.compiler import ADD, MOVE, OUT, IN, OPEN, CLOSE, SET, MUL, SCAN, CHECK
+from brainf.limits import Budget
+from brainf.streams import open_input, open_output
+
+PARAMETERS = 'cells, pointer, size, mask, memory, output, write, read, budget'
+
+MAX_DEPTH = 16
+
+
+def execute(program, memory, output=None, input=None, stats=None, max_steps=None,
+            timeout=None):
+    """Run compiled program utilizing provided memory.
+
+    Steps are only counted when there is a limit. Record the time spent
+    on translation and the number of steps executed, if counted, in stats.
+    """
+    output = open_output(output)
+    input = open_input(input)
+    budget = Budget(max_steps, timeout)
+    started = time.perf_counter()
+    function = translate(program, count_steps=budget.limited)
+    if stats is not None:
+        stats['compile_time'] = time.perf_counter() - started
+    try:
+        memory.ensure(0, 0)
+        memory.pointer = function(memory.cells, memory.pointer, memory.extent,
+                                  memory.mask, memory, output, output.write, input.read,
+                                  budget)
+    finally:
+        output.flush()
+        if stats is not None and budget.limited:
+            stats['steps'] = budget.steps
+
+
+def translate(program, start=None, count_steps=False):
+    """Return a Python function equivalent to the compiled program.
+
+    Given the index of an OPEN, return a function running just that loop.
+    Either function takes PARAMETERS and returns the pointer.
+    """
+    namespace = {}
+    exec(compile(generate(program, start, count_steps), '<brainf>', 'exec'), namespace)
+    return namespace['main' if start is None else f'loop{start}']
+
+
+def generate(program, start=None, count_steps=False):
+    """Return Python source code of a function running the program.
+
+    Given the index of an OPEN, generate a function running that loop.
+    Loops nested deeper than MAX_DEPTH are moved to functions of their
+    own, which stays clear of the interpreter's limit on nested blocks.
+    Given count_steps, loop iterations are counted against the budget.
+    """
+    functions = []
+    ops = program.ops
+    if start is None:
+        _generate_function('main', ops, 0, len(ops), count_steps, functions)
+    else:
+        stop = ops[start][2] + 1
+        _generate_function(f'loop{start}', ops, start, stop, count_steps, functions)
+    return '\n\n'.join(functions) + '\n'
+
+
+def _generate_function(name, ops, start, stop, count_steps, functions):
+    """Append source of a function running ops[start:stop] to functions.
+
+    Steps, if counted, are kept in a local variable, which is handed
+    over through the budget on calls and returns.
+    """
+    lines = [f'def {name}({PARAMETERS}):']
+    if count_steps:
+        lines.append('    steps, limit = budget.steps, budget.limit')
+    depth = 1
+    i = start
+    while i < stop:
+        opcode, offset, argument = ops[i]
+        indent = '    ' * depth
+        if opcode == OPEN and depth > MAX_DEPTH:
+            loop = f'loop{i}'
+            _generate_function(loop, ops, i, argument + 1, count_steps, functions)
+            if count_steps:
+                lines.append(f'{indent}budget.steps = steps')
+            lines.append(f'{indent}pointer = {loop}({PARAMETERS})')
+            lines.append(f'{indent}size = memory.extent')
+            if count_steps:
+                lines.append(f'{indent}steps, limit = budget.steps, budget.limit')
+            i = argument + 1
+            continue
+        if opcode == OPEN:
+            lines.append(f'{indent}while cells[pointer]:')
+            depth += 1
+        elif opcode == CLOSE:
+            if count_steps:
+                lines.append(f'{indent}steps += 1')
+                lines.append(f'{indent}if steps >= limit:')
+                lines.append(f'{indent}    limit = budget.check(steps)')
+            elif ops[i - 1][0] == OPEN:
+                lines.append(f'{indent}pass')
+            depth -= 1
+        else:
+            lines.extend(indent + line for line in _generate_op(opcode, offset, argument))
+        i += 1
+    if count_steps:
+        lines.append('    budget.steps = steps')
+    lines.append('    return pointer')
+    functions.append('\n'.join(lines))
+
+
+def _generate_op(opcode, offset, argument):
+    """Return lines of source code for a single operation."""
+    address = _address(offset)
+    if opcode == ADD:
+        return [f'cells[{address}] = (cells[{address}] + {argument}) & mask']
+    if opcode == MOVE:
+        return _check(argument, argument) + [f'pointer += {argument}']
+    if opcode == SET:
+        return [f'cells[{address}] = {argument} & mask']
+    if opcode == MUL:
+        return [
+            'if cells[pointer]:',
+            *('    ' + line for line in _check(offset, offset)),
+            f'    cells[{address}] = (cells[{address}] + cells[pointer] * {argument}) & mask',
+        ]
+    if opcode == CHECK:
+        return _check(offset, argument)
+    if opcode == SCAN:
+        return [
+            'memory.pointer = pointer',
+            f'memory.scan({argument})',
+            'pointer, size = memory.pointer, memory.extent',
+        ]
+    if opcode == OUT:
+        return [f'write(cells[{address}])']
+    if opcode == IN:
+        return [
+            'if output.flush_on_input:',
+            '    output.flush()',
+            'value = read()',
+            'if value is not None:',
+            f'    cells[{address}] = value & mask',
+        ]
+    raise ValueError(f'unknown opcode: {opcode}')
+
+
+def _check(lowest, highest):
+    """Return lines ensuring that the offsets are in range.
+
+    The pointer itself is always in range, so only offsets beyond it
+    need checking. Addresses out of range go through memory.ensure(),
+    which either grows the memory or raises MemoryError.
+    """
+    conditions = []
+    if highest > 0:
+        conditions.append(f'{_address(highest)} >= size')
+    if lowest < 0:
+        conditions.append(f'{_address(lowest)} < 0')
+    if not conditions:
+        return []
+    return [
+        f'if {" or ".join(conditions)}:',
+        '    memory.pointer = pointer',
+        f'    memory.ensure({lowest}, {highest})',
+        '    pointer, size = memory.pointer, memory.extent',
+    ]
+
+
+def _address(offset):
+    """Return an expression for the cell at the given offset."""
+    if offset == 0:
+        return 'pointer'
+    return f'pointer {"+" if offset > 0 else "-"} {abs(offset)}'
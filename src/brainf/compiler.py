@@ -0,0 +1,328 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Compilation of Brainfuck source code into an intermediate representation.
+"""
+
+import array
+import itertools
+
+from brainf.code import read_instructions
+
+ADD, MOVE, OUT, IN, OPEN, CLOSE, SET, MUL, SCAN, CHECK = range(10)
+
+OPCODES = {
+    '+': ADD,
+    '-': ADD,
+    '>': MOVE,
+    '<': MOVE,
+    '.': OUT,
+    ',': IN,
+    '[': OPEN,
+    ']': CLOSE,
+}
+
+
+class Program:
+    """
+    Sequence of operations lowered from the source code.
+
+    Operations are kept in parallel arrays of opcodes, offsets and
+    arguments, which take a fraction of the memory of a list of tuples
+    and pickle into a handful of byte strings. Arguments of brackets are
+    indices of their matching brackets.
+
+    Positions hold the index of the source instruction each operation
+    came from, if known. Brackets map to themselves, while any other
+    operation maps to the first instruction of its basic block.
+    """
+
+    __slots__ = ('opcodes', 'offsets', 'arguments', 'positions')
+
+    @classmethod
+    def from_file(cls, path, optimize=True):
+        """Return instance of brainf.Program compiled from a file in chunks.
+
+        Peak memory depends on the size of the compiled program rather
+        than that of the source file.
+        """
+        program = cls.__new__(cls)
+        program._compile(read_instructions(path), optimize)
+        return program
+
+    @classmethod
+    def from_ops(cls, ops, positions=None):
+        """Return instance of brainf.Program with already linked operations."""
+        program = cls.__new__(cls)
+        program._store(ops, positions)
+        return program
+
+    @classmethod
+    def from_arrays(cls, opcodes, offsets, arguments, positions=None):
+        """Return instance of brainf.Program taking over the given arrays."""
+        program = cls.__new__(cls)
+        program.opcodes = opcodes
+        program.offsets = offsets
+        program.arguments = arguments
+        program.positions = positions
+        return program
+
+    def __init__(self, code, optimize=True):
+        """Lower, optionally optimize and link parsed source code."""
+        self._compile([code.instructions], optimize)
+
+    def _compile(self, chunks, optimize):
+        """Lower, optionally optimize and link chunks of instructions."""
+        ops = lower_chunks(chunks)
+        if optimize:
+            ops = defer_moves(fold_loops(ops))
+        self._store(link(ops), locate(ops))
+
+    def _store(self, ops, positions):
+        """Fill the arrays with operations and their source positions."""
+        self.opcodes = array.array('B', (op[0] for op in ops))
+        self.offsets = array.array('i', (op[1] for op in ops))
+        self.arguments = array.array('i', (op[2] for op in ops))
+        self.positions = None if positions is None else array.array('i', positions)
+
+    @property
+    def ops(self):
+        """Return a new list of (opcode, offset, argument) triples."""
+        return list(zip(self.opcodes, self.offsets, self.arguments))
+
+    def __len__(self):
+        """Return the total number of operations."""
+        return len(self.opcodes)
+
+    def __getitem__(self, index):
+        """Return operation at the given index."""
+        return self.opcodes[index], self.offsets[index], self.arguments[index]
+
+
+def lower(instructions):
+    """Return a list of (opcode, offset, argument) triples with folded runs.
+
+    Consecutive '+' and '-' become a single ADD with their net sum and
+    are dropped if they cancel out. Runs of '>' or '<' become a single
+    MOVE, but opposite runs are kept apart so that the pointer still
+    visits every address it would have. Other instructions map one-to-one.
+    """
+    ops = []
+    for instruction, group in itertools.groupby(instructions):
+        opcode = OPCODES[instruction]
+        if opcode in (ADD, MOVE):
+            count = sum(1 for _ in group)
+            if instruction in '-<':
+                count = -count
+            if opcode == ADD and ops and ops[-1][0] == ADD:
+                count += ops.pop()[2]
+            if count != 0:
+                ops.append((opcode, 0, count))
+        else:
+            ops.extend((opcode, 0, 0) for _ in group)
+    return ops
+
+
+def fold_loops(ops):
+    """Return a copy of ops with clear, multiply and scan loops replaced.
+
+    An innermost loop consisting of ADD and MOVE only, whose net pointer
+    movement is zero and which changes its own cell by one per pass,
+    runs exactly as many times as that cell's value says. Each of its
+    other cells therefore receives a multiple of the loop cell's value:
+
+    [-]          -> SET 0
+    [->+<]       -> MUL 1, 1; SET 0
+    [->++>+++<<] -> MUL 1, 2; MUL 2, 3; SET 0
+    [>>]         -> SCAN 2
+
+    MUL adds the loop cell's value times the factor to the target cell
+    at the given offset. Loops which count upwards get negated factors,
+    which is equivalent once cell values wrap around. SCAN moves the
+    pointer by the given stride until it finds a zero cell.
+    """
+    folded = []
+    for op in ops:
+        folded.append(op)
+        if op[0] == CLOSE:
+            start = len(folded) - 1
+            while start > 0 and folded[start - 1][0] in (ADD, MOVE):
+                start -= 1
+            if start > 0 and folded[start - 1][0] == OPEN:
+                replacement = _fold_loop(folded[start:-1])
+                if replacement is not None:
+                    del folded[start - 1:]
+                    folded.extend(replacement)
+    return folded
+
+
+def _fold_loop(body):
+    """Return ops equivalent to a loop with the given body or None."""
+    if len(body) == 1 and body[0][0] == MOVE:
+        return [(SCAN, 0, body[0][2])]
+    offset, deltas, visited = 0, {}, {0}
+    for opcode, _, argument in body:
+        if opcode == MOVE:
+            offset += argument
+            visited.add(offset)
+        else:
+            deltas[offset] = deltas.get(offset, 0) + argument
+    if offset != 0 or deltas.get(0) not in (-1, 1):
+        return None
+    if min(visited) < min(deltas) or max(visited) > max(deltas):
+        return None
+    step = -deltas.pop(0)
+    return [(MUL, target, factor * step)
+            for target, factor in deltas.items() if factor != 0] + [(SET, 0, 0)]
+
+
+def defer_moves(ops):
+    """Return a copy of ops with pointer moves hoisted out of basic blocks.
+
+    A basic block is a run of ADD, MOVE and SET ending with at most one OUT
+    or IN. Its cell accesses get an offset relative to the pointer and the
+    block's net movement is applied once with a single MOVE at the block's
+    start, whose range check also covers every cell in between. A CHECK of
+    the lowest and highest offset visited precedes blocks which reach
+    beyond that span:
+
+    >+>++<<- -> CHECK 0, 2; ADD 1, 1; ADD 2, 2; ADD 0, -1
+    >+>++    -> MOVE 2; ADD -1, 1; ADD 0, 2
+
+    Since I/O ends a block, moves after it are checked only once it has
+    happened, so a program running out of memory prints the same output as
+    it would without deferring. Arithmetic on the same cell is merged
+    within a block.
+    """
+    deferred, block = [], []
+    for op in ops:
+        if op[0] in (ADD, MOVE, SET):
+            block.append(op)
+        elif op[0] in (OUT, IN):
+            block.append(op)
+            deferred.extend(_defer_block(block))
+            block = []
+        else:
+            deferred.extend(_defer_block(block))
+            deferred.append(op)
+            block = []
+    deferred.extend(_defer_block(block))
+    return deferred
+
+
+def _defer_block(block):
+    """Return ops of a basic block addressed relative to its final pointer."""
+    shift, accesses, pending, visited = 0, [], {}, {0}
+    for opcode, _, argument in block:
+        if opcode == MOVE:
+            shift += argument
+            visited.add(shift)
+            continue
+        previous = pending.get(shift)
+        if opcode == ADD and previous is not None:
+            previous_opcode, _, value = accesses[previous]
+            accesses[previous] = (previous_opcode, shift, value + argument)
+        elif opcode == SET and previous is not None:
+            accesses[previous] = (SET, shift, argument)
+        else:
+            accesses.append((opcode, shift, argument))
+            if opcode in (ADD, SET):
+                pending[shift] = len(accesses) - 1
+            else:
+                pending.pop(shift, None)
+    accesses = [op for op in accesses if op[0] != ADD or op[2] != 0]
+    ops = []
+    visited.update(offset for _, offset, _ in accesses)
+    if min(visited) < min(0, shift) or max(visited) > max(0, shift):
+        ops.append((CHECK, min(visited), max(visited)))
+    if shift != 0:
+        ops.append((MOVE, 0, shift))
+    ops.extend((opcode, offset - shift, argument)
+               for opcode, offset, argument in accesses)
+    return ops
+
+
+def lower_chunks(chunks):
+    """Return ops with tagged brackets lowered from chunks of instructions.
+
+    Runs spanning two chunks are joined, so that the result is the same
+    as if the instructions were lowered at once.
+    """
+    ops, start, last = [], 0, None
+    for chunk in chunks:
+        lowered = tag_brackets(lower(chunk), chunk, start)
+        start += len(chunk)
+        if ops and lowered and ops[-1][0] == lowered[0][0]:
+            opcode, _, count = lowered[0]
+            # Moves only join when the run itself spans the chunks
+            if opcode == ADD or (opcode == MOVE and chunk[0] == last):
+                count += ops.pop()[2]
+                lowered[0:1] = [(opcode, 0, count)] if count != 0 else []
+        ops.extend(lowered)
+        if chunk:
+            last = chunk[-1]
+    return ops
+
+
+def tag_brackets(ops, instructions, start=0):
+    """Return a copy of ops with brackets carrying their source index.
+
+    Optimizations keep surviving brackets intact, so the index is still
+    there when link() overwrites it with the matching bracket's. Indices
+    are counted from start.
+    """
+    indices = (i for i, instruction in enumerate(instructions, start) if instruction in '[]')
+    return [(op[0], 0, next(indices)) if op[0] in (OPEN, CLOSE) else op for op in ops]
+
+
+def locate(ops):
+    """Return source index of every op in a list with tagged brackets."""
+    positions, start = [], 0
+    for opcode, _, argument in ops:
+        if opcode in (OPEN, CLOSE):
+            positions.append(argument)
+            start = argument + 1
+        else:
+            positions.append(start)
+    return positions
+
+
+def link(ops):
+    """Return a copy of ops with bracket targets resolved.
+
+    OPEN points at the index of its matching CLOSE and vice versa. Errors
+    point at the source index of the unbalanced bracket, like parse() does.
+    """
+    linked = list(ops)
+    stack = []
+    for i, (opcode, _, argument) in enumerate(linked):
+        if opcode == OPEN:
+            stack.append(i)
+        elif opcode == CLOSE:
+            if not stack:
+                raise SyntaxError(f'unbalanced brackets at position {argument}')
+            j = stack.pop()
+            linked[i], linked[j] = (CLOSE, 0, j), (OPEN, 0, i)
+    if stack:
+        raise SyntaxError(f'unbalanced brackets at position {ops[stack[0]][2]}')
+    return linked
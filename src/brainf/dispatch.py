@@ -0,0 +1,150 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Dispatch loop over compiled operations shared by the interpreting engines.
+
+The loop is a generator, so that the asyncio engine can suspend it when
+it runs out of input or time slice, while the ir and tiered engines run
+it to completion without it ever yielding.
+"""
+
+from brainf.compiler import ADD, MOVE, OUT, IN, OPEN, CLOSE, SET, MUL, SCAN, CHECK
+from brainf.limits import LimitExceeded
+
+# Operation of the tiered engine which calls a compiled loop
+CALL = -1
+
+
+def run(program, memory, output, input, budget, ops=None, counter=0, steps=0,
+        checkpoint=None, tier=None, cooperative=False):
+    """Run operations, starting at counter, until the program ends.
+
+    Cells and pointer are kept in local variables for speed. Operations
+    address cells relative to the pointer, which is written back to
+    memory on exit. Addresses beyond the memory's extent go through
+    memory.ensure(), which either extends it, grows the memory or raises
+    MemoryError, so that the extent covers every cell touched. Arithmetic
+    wraps around modulo the cell width. Steps are counted from the given
+    number and recorded in the budget, which is checked whenever they
+    reach its limit. Given a brainf.snapshot.Checkpoint, save snapshots
+    then too.
+
+    Ops default to those of the program. Given a tier callable, call it
+    with the index of every OPEN executed, including once per iteration,
+    and run that index again if it returns True, having replaced the op
+    with a CALL of a compiled loop. When cooperative, yield at limits
+    and before reading input which isn't there yet.
+    """
+    ops = program.ops if ops is None else ops
+    write = output.write
+    read = input.read
+    memory.ensure(0, 0)
+    cells = memory.cells
+    mask = memory.mask
+    size = memory.extent
+    pointer = memory.pointer
+    # Loops go back to their OPEN when it counts iterations
+    reentry = 1 if tier is None else 0
+    limit = budget.check(steps)
+    i = counter
+
+    try:
+        while i < len(ops):
+
+            opcode, offset, argument = ops[i]
+
+            if opcode == ADD:
+                address = pointer + offset
+                cells[address] = (cells[address] + argument) & mask
+            elif opcode == MOVE:
+                pointer += argument
+                if pointer >= size or pointer < 0:
+                    memory.pointer = pointer
+                    memory.ensure(0, 0)
+                    pointer, size = memory.pointer, memory.extent
+            elif opcode == OPEN:
+                if tier is not None and tier(i):
+                    continue
+                if cells[pointer] == 0:
+                    i = argument
+            elif opcode == CLOSE:
+                steps += 1
+                if steps >= limit:
+                    limit = budget.check(steps)
+                    if checkpoint is not None and checkpoint.due(steps):
+                        memory.pointer = pointer
+                        checkpoint.save(program, memory, argument + 1 if cells[pointer] else i + 1,
+                                        steps, output, input)
+                    if cooperative:
+                        yield CLOSE
+                if cells[pointer] != 0:
+                    i = argument - 1 + reentry
+            elif opcode == MUL:
+                value = cells[pointer]
+                if value != 0:
+                    target = pointer + offset
+                    if target >= size or target < 0:
+                        memory.pointer = pointer
+                        memory.ensure(offset, offset)
+                        pointer, size = memory.pointer, memory.extent
+                        target = pointer + offset
+                    cells[target] = (cells[target] + value * argument) & mask
+            elif opcode == SET:
+                cells[pointer + offset] = argument & mask
+            elif opcode == CHECK:
+                if pointer + argument >= size or pointer + offset < 0:
+                    memory.pointer = pointer
+                    memory.ensure(offset, argument)
+                    pointer, size = memory.pointer, memory.extent
+            elif opcode == SCAN:
+                memory.pointer = pointer
+                memory.scan(argument)
+                pointer, size = memory.pointer, memory.extent
+            elif opcode == OUT:
+                write(cells[pointer + offset])
+            elif opcode == IN:
+                if output.flush_on_input:
+                    output.flush()
+                if cooperative and input.blocking:
+                    yield IN
+                value = read()
+                if value is not None:
+                    cells[pointer + offset] = value & mask
+            elif opcode == CALL:
+                budget.steps = steps
+                pointer = argument(cells, pointer, size, mask, memory, output, write, read,
+                                   budget)
+                size = memory.extent
+                steps, limit = budget.steps, budget.limit
+                i = offset
+
+            i += 1
+    except LimitExceeded:
+        # The step which crossed the limit was not taken
+        steps = budget.steps
+        raise
+    finally:
+        memory.pointer = pointer
+        output.flush()
+        # Compiled loops which raise leave their count in the budget only
+        budget.steps = max(steps, budget.steps)
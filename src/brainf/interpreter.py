@@ -24,68 +24,177 @@
 Brainfuck interpreter.
 """
 
-import os
-import sys
-
-from brainf import SourceCode, Memory
-
-
-def run(path):
-    """Run interpreter against the given file using default memory."""
-    interpret(SourceCode.from_file(path), Memory())
+import time
+
+from brainf import SourceCode, Program, cache, codegen, dispatch, transpiler, jit, tiered
+from brainf.limits import Budget
+from brainf.memory import open_memory
+from brainf.streams import Input, open_input, open_output
+
+
+def run(path, cell_bits=8, text=False, input_path=None, eof=None, engine='ir',
+        stats=None, use_cache=True, profile=None, sampler=None, tape='fixed',
+        tape_path=None, checkpoint=None, resume=None, programs=None, **options):
+    """Run compiled program from the given file using default memory.
+
+    The program is loaded from the on-disk cache unless use_cache is false,
+    or from the programs dict of a long-running process, if given.
+    Memory is the given kind of tape, which a mapped one saves to tape_path
+    if given. Extra options, such as max_steps and timeout, are passed on
+    to the engine. Record the engine's name, the number of operations and
+    the time spent on running in stats, as well as the capacity of the
+    tape, which is the number of cells it holds without allocating more,
+    and its high-water mark, which is the number of cells touched rounded
+    up to the tape's extent or pages.
+    Given a profile, step through the source code with interpret() instead.
+    Given a brainf.sampler.Sampler, sample the engine while it runs.
+    Given a brainf.snapshot.Checkpoint, handle its signals while the engine
+    runs. Given a brainf.snapshot.Snapshot, resume from it on the same kind
+    of tape. Only the ir engine takes snapshots and resumes from them.
+    """
+    if input_path is None:
+        input = open_input(text=text, eof=eof)
+    else:
+        input = Input.from_file(input_path, eof, text)
+    if checkpoint is not None:
+        options['checkpoint'] = checkpoint
+    if resume is not None:
+        options['resume'] = resume
+        tape, cell_bits = resume.tape, resume.cell_bits
+    memory = open_memory(tape, cell_bits, tape_path)
+    try:
+        if profile is not None:
+            interpret(SourceCode.from_file(path), memory, open_output(text=text), input,
+                      profile, max_steps=options.get('max_steps'),
+                      timeout=options.get('timeout'))
+            return
+        if use_cache:
+            program = cache.load(path, stats=stats, programs=programs)
+        else:
+            program = Program.from_file(path)
+        if sampler is not None:
+            sampler.start(program)
+        if checkpoint is not None:
+            checkpoint.start()
+        started = time.perf_counter()
+        try:
+            ENGINES[engine](program, memory, open_output(text=text), input, stats, **options)
+        finally:
+            if checkpoint is not None:
+                checkpoint.stop()
+            if sampler is not None:
+                sampler.stop()
+            if stats is not None:
+                stats['engine'] = engine
+                stats['ops'] = len(program)
+                stats['time'] = time.perf_counter() - started
+                stats['capacity'] = memory.allocated
+                stats['high_water_mark'] = memory.high_water_mark
+    finally:
+        memory.close()
+
+
+def interpret(code, memory, output=None, input=None, profile=None, max_steps=None,
+              timeout=None):
+    """Step through the code utilizing provided memory.
+
+    Output goes to a brainf.streams.Output or a binary sink, which is
+    standard output by default. Likewise, input comes from an Input or
+    a binary source, which is standard input by default. Executions of
+    every instruction are counted in a brainf.profiler.Profile if given.
+    Raise brainf.LimitExceeded when the program takes more than max_steps
+    jumps back to the start of a loop or runs longer than timeout seconds.
+    """
 
+    output = open_output(output)
+    input = open_input(input)
+    counts = None if profile is None else profile.attach(code)
+    budget = Budget(max_steps, timeout)
+    steps, limit = 0, budget.limit
+
+    try:
+        i = 0
+        while i < len(code):
+
+            instruction = code[i]
+            if counts is not None:
+                counts[i] += 1
+
+            if instruction == '+':
+                memory.incr()
+            elif instruction == '-':
+                memory.decr()
+            elif instruction == '>':
+                memory.movf()
+            elif instruction == '<':
+                memory.movb()
+            elif instruction == '.':
+                put_char(memory, output)
+            elif instruction == ',':
+                if output.flush_on_input:
+                    output.flush()
+                get_char(memory, input)
+            elif instruction == '[':
+                if memory.cell == 0:
+                    i = code.jumps[i]
+            elif instruction == ']':
+                steps += 1
+                if steps >= limit:
+                    limit = budget.check(steps)
+                i = code.jumps[i]
+                continue
 
-def interpret(code, memory):
-    """Step through the code utilizing provided memory."""
+            i += 1
+    finally:
+        output.flush()
 
-    i = 0
-    while i < len(code):
 
-        instruction = code[i]
+def execute(program, memory, output=None, input=None, stats=None, max_steps=None,
+            timeout=None, checkpoint=None, resume=None):
+    """Run compiled program utilizing provided memory.
 
-        if instruction == '+':
-            memory.incr()
-        elif instruction == '-':
-            memory.decr()
-        elif instruction == '>':
-            memory.movf()
-        elif instruction == '<':
-            memory.movb()
-        elif instruction == '.':
-            put_char(memory)
-        elif instruction == ',':
-            get_char(memory)
-        elif instruction == '[':
-            if memory.cell == 0:
-                i = code.jumps[i]
-        elif instruction == ']':
-            i = code.jumps[i]
-            continue
+    Operations run in the dispatch loop of brainf.dispatch. I/O streams
+    and limits are the same as in interpret(). Given a limit, record the
+    number of steps executed in stats.
+    Given a brainf.snapshot.Checkpoint, save snapshots at the end of loops
+    when due. Given a brainf.snapshot.Snapshot, resume from it.
+    """
 
-        i += 1
+    output = open_output(output)
+    input = open_input(input)
+    counter, steps = 0, 0
+    if resume is not None:
+        resume.restore(program, memory, output, input)
+        counter, steps = resume.counter, resume.steps
+    budget = Budget(max_steps, timeout, None if checkpoint is None else checkpoint.interval)
+    try:
+        for _ in dispatch.run(program, memory, output, input, budget, counter=counter,
+                              steps=steps, checkpoint=checkpoint):
+            pass
+    finally:
+        if stats is not None and budget.limited:
+            stats['steps'] = budget.steps
 
 
-def put_char(memory):
-    """Print current cell's ASCII character on stdout."""
-    if memory.cell == ord('\n'):
-        print()  # produce platform specific newline
-    else:
-        print(chr(memory.cell), end='')
+def put_char(memory, output):
+    """Write current cell's value to the output."""
+    output.write(memory.cell)
 
 
-def get_char(memory):
-    """Read next character from stdin and store it in memory.
+def get_char(memory, input):
+    """Read next byte from the input and store it in memory.
 
-    Return immediately when EOF.
-    Skip extra newline characters, e.g. carriage return.
-    Convert OS-specific newline to line feed.
+    Leave the cell unchanged when the input has no value for EOF.
     """
-
-    char = sys.stdin.buffer.read(1)
-
-    if len(char) > 0:
-        if char in ('\r', '\n'):
-            for _ in range(len(os.linesep) - 1):
-                sys.stdin.buffer.read(1)
-            char = '\n'
-        memory.cell = ord(char)
+    value = input.read()
+    if value is not None:
+        memory.cell = value
+
+
+ENGINES = {
+    'ir': execute,
+    'python': codegen.execute,
+    'c': transpiler.execute,
+    'jit': jit.execute,
+    'tiered': tiered.execute,
+}
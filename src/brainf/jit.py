@@ -0,0 +1,386 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Engine which assembles compiled programs into x86-64 machine code.
+
+The code is written to a memory map, which is made executable afterwards,
+and called through ctypes with the same signature and callbacks as the C
+engine:
+
+int64_t run(uint8_t *cells, int64_t size, int64_t *position,
+            write_t write, read_t read)
+
+Registers hold the state for the duration of the call:
+
+rbx - address of the first cell
+r12 - address of the current cell
+r13 - address past the extent
+r14 - write callback
+r15 - read callback
+rbp - position, which holds the pointer and the extent
+
+The address past the last cell is kept on the stack. Moving past the
+extent calls a routine which extends it, or jumps to an error.
+"""
+
+import ctypes
+import itertools
+import mmap
+import os
+import platform
+import struct
+import sys
+import time
+
+from brainf import codegen
+from brainf.compiler import ADD, MOVE, OUT, IN, OPEN, CLOSE, SET, MUL, SCAN, CHECK
+from brainf.streams import open_input, open_output
+from brainf.transpiler import WRITE, READ, OVERFLOW, UNDERFLOW, ABORTED
+
+FUNCTION = ctypes.CFUNCTYPE(ctypes.c_int64, ctypes.c_void_p, ctypes.c_int64,
+                            ctypes.POINTER(ctypes.c_int64), WRITE, READ)
+
+PROLOGUE = bytes.fromhex(
+    '55'            # push rbp
+    '53'            # push rbx
+    '4154'          # push r12
+    '4155'          # push r13
+    '4156'          # push r14
+    '4157'          # push r15
+    '4883ec08'      # sub rsp, 8
+    '4889fb'        # mov rbx, rdi
+    '488d0437'      # lea rax, [rdi + rsi]
+    '48890424'      # mov [rsp], rax
+    '488b4208'      # mov rax, [rdx + 8]
+    '4c8d2c07'      # lea r13, [rdi + rax]
+    '488b02'        # mov rax, [rdx]
+    '4c8d2407'      # lea r12, [rdi + rax]
+    '4889d5'        # mov rbp, rdx
+    '4989ce'        # mov r14, rcx
+    '4d89c7'        # mov r15, r8
+)
+
+EPILOGUE = bytes.fromhex(
+    '4c89e1'        # mov rcx, r12
+    '4829d9'        # sub rcx, rbx
+    '48894d00'      # mov [rbp], rcx
+    '4c89e9'        # mov rcx, r13
+    '4829d9'        # sub rcx, rbx
+    '48894d08'      # mov [rbp + 8], rcx
+    '4883c408'      # add rsp, 8
+    '415f'          # pop r15
+    '415e'          # pop r14
+    '415d'          # pop r13
+    '415c'          # pop r12
+    '5b'            # pop rbx
+    '5d'            # pop rbp
+    'c3'            # ret
+)
+
+# Extends the extent to cover the address in rdx, doubling it up to the
+# address past the last cell, which is above the return address
+EXTEND = bytes.fromhex(
+    '4c89ee'        # mov rsi, r13
+    '4829de'        # sub rsi, rbx
+    '4801f6'        # add rsi, rsi
+    '4801de'        # add rsi, rbx
+    '488d5201'      # lea rdx, [rdx + 1]
+    '4839d6'        # cmp rsi, rdx
+    '480f42f2'      # cmovb rsi, rdx
+    '483b742408'    # cmp rsi, [rsp + 8]
+    '480f47742408'  # cmova rsi, [rsp + 8]
+    '4989f5'        # mov r13, rsi
+    'c3'            # ret
+)
+
+JE, JNE, JB, JAE, JS = 0x84, 0x85, 0x82, 0x83, 0x88
+
+
+def is_supported():
+    """Return True if machine code can be run on this platform."""
+    return sys.platform.startswith('linux') and platform.machine() in ('x86_64', 'AMD64')
+
+
+def execute(program, memory, output=None, input=None, stats=None, max_steps=None,
+            timeout=None):
+    """Run compiled program utilizing provided memory.
+
+    Fall back to the Python code generator on other platforms, for cells
+    wider than eight bits, for resizable memory, when executable memory
+    cannot be mapped or when there is a step or time limit, which the
+    machine code doesn't check. Record the time spent on assembly and the code size in stats.
+    """
+    try:
+        itemsize = memoryview(memory.cells).itemsize
+    except TypeError:
+        itemsize = None
+    if (not is_supported() or itemsize != 1 or memory.resizable
+            or max_steps is not None or timeout is not None):
+        codegen.execute(program, memory, output, input, stats, max_steps, timeout)
+        return
+    started = time.perf_counter()
+    try:
+        machine_code = assemble(program)
+        code = load(machine_code)
+    except OSError:
+        codegen.execute(program, memory, output, input, stats, max_steps, timeout)
+        return
+    if stats is not None:
+        stats['compile_time'] = time.perf_counter() - started
+        stats['code_size'] = len(machine_code)
+
+    output = open_output(output)
+    input = open_input(input)
+    errors = []
+
+    @WRITE
+    def write(value):
+        try:
+            output.write(value)
+            return 0
+        except BaseException as ex:
+            errors.append(ex)
+            return 1
+
+    @READ
+    def read(value):
+        try:
+            if output.flush_on_input:
+                output.flush()
+            new_value = input.read()
+            return value if new_value is None else new_value & memory.mask
+        except BaseException as ex:
+            errors.append(ex)
+            return -1
+
+    cells = ctypes.c_char.from_buffer(memory.cells)
+    memory.ensure(0, 0)
+    position = (ctypes.c_int64 * 2)(memory.pointer, memory.extent)
+    try:
+        status = code.function(ctypes.addressof(cells), len(memory.cells), position,
+                               write, read)
+    finally:
+        del cells
+        memory.pointer, memory.extent = position
+        output.flush()
+    if status == OVERFLOW:
+        raise MemoryError('not enough memory')
+    if status == UNDERFLOW:
+        raise MemoryError('negative memory address')
+    if status == ABORTED:
+        raise errors[0]
+
+
+class Code:
+    """Machine code loaded into executable memory."""
+
+    def __init__(self, memory_map):
+        """Keep the memory map alive as long as the function."""
+        self.memory_map = memory_map
+        self.buffer = ctypes.c_char.from_buffer(memory_map)
+        self.function = FUNCTION(ctypes.addressof(self.buffer))
+
+
+def load(machine_code):
+    """Return Code with the machine code copied into executable memory.
+
+    The pages are mapped writable, filled in and only then made executable
+    instead, so that they are never both at once. Raise OSError if they
+    cannot be protected.
+    """
+    size = max(len(machine_code), 1)
+    memory_map = mmap.mmap(-1, size, mmap.MAP_PRIVATE, mmap.PROT_READ | mmap.PROT_WRITE)
+    memory_map.write(machine_code)
+    code = Code(memory_map)
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.mprotect.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int]
+    if libc.mprotect(ctypes.addressof(code.buffer), size, mmap.PROT_READ | mmap.PROT_EXEC):
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+    return code
+
+
+def assemble(program):
+    """Return x86-64 machine code of a function running the program."""
+    assembler = Assembler()
+    assembler.emit(PROLOGUE)
+    for opcode, offset, argument in program.ops:
+        assembler.assemble(opcode, offset, argument)
+    assembler.emit(bytes.fromhex('31c0'))  # xor eax, eax
+    assembler.jump('done')
+    assembler.label('extend')
+    assembler.emit(bytes.fromhex('483b542408'))  # cmp rdx, [rsp + 8]
+    assembler.jump('unwind', JAE)
+    assembler.emit(EXTEND)
+    assembler.label('unwind')
+    assembler.emit(bytes.fromhex('4883c408'))  # add rsp, 8
+    for label, status in (('overflow', OVERFLOW), ('underflow', UNDERFLOW), ('aborted', ABORTED)):
+        assembler.label(label)
+        assembler.emit(b'\xb8' + struct.pack('<i', status))  # mov eax, status
+        assembler.jump('done')
+    assembler.label('done')
+    assembler.emit(EPILOGUE)
+    return assembler.link()
+
+
+class Assembler:
+    """Accumulates machine code and resolves jumps to labels."""
+
+    def __init__(self):
+        """Start with empty code."""
+        self.code = bytearray()
+        self.labels = {}
+        self.fixups = []
+        self.loops = []
+        self.names = itertools.count()
+
+    def emit(self, code):
+        """Append raw machine code."""
+        self.code += code
+
+    def label(self, name):
+        """Mark the current position with a label."""
+        self.labels[name] = len(self.code)
+
+    def jump(self, name, condition=None):
+        """Append a jump with 32-bit displacement to the given label."""
+        if condition is None:
+            self.emit(b'\xe9')
+        else:
+            self.emit(bytes([0x0f, condition]))
+        self.emit(b'\0\0\0\0')
+        self.fixups.append((len(self.code), name))
+
+    def call(self, name):
+        """Append a call with 32-bit displacement to the given label."""
+        self.emit(b'\xe8\0\0\0\0')
+        self.fixups.append((len(self.code), name))
+
+    def link(self):
+        """Return machine code with jump displacements filled in."""
+        for end, name in self.fixups:
+            self.code[end - 4:end] = struct.pack('<i', self.labels[name] - end)
+        return bytes(self.code)
+
+    def assemble(self, opcode, offset, argument):
+        """Append machine code of a single operation."""
+        if opcode == ADD:
+            self.emit(b'\x41\x80\x84\x24' + _disp(offset) + _imm8(argument))
+        elif opcode == MOVE:
+            self.emit(b'\x49\x81\xc4' + struct.pack('<i', argument))
+            self.check_pointer(argument)
+        elif opcode == OPEN:
+            name = next(self.names)
+            self.loops.append(name)
+            self.compare_cell()
+            self.jump(f'break{name}', JE)
+            self.label(f'body{name}')
+        elif opcode == CLOSE:
+            name = self.loops.pop()
+            self.compare_cell()
+            self.jump(f'body{name}', JNE)
+            self.label(f'break{name}')
+        elif opcode == SET:
+            self.emit(b'\x41\xc6\x84\x24' + _disp(offset) + _imm8(argument))
+        elif opcode == MUL:
+            name = next(self.names)
+            self.emit(b'\x41\x0f\xb6\x84\x24' + _disp(0))  # movzx eax, byte [r12]
+            self.emit(b'\x85\xc0')  # test eax, eax
+            self.jump(f'skip{name}', JE)
+            self.emit(b'\x49\x8d\x8c\x24' + _disp(offset))  # lea rcx, [r12 + offset]
+            if offset > 0:
+                self.emit(b'\x4c\x39\xe9')  # cmp rcx, r13
+                self.extend(b'\x48\x89\xca')  # mov rdx, rcx
+            else:
+                self.emit(b'\x48\x39\xd9')  # cmp rcx, rbx
+                self.jump('underflow', JB)
+            self.emit(b'\x69\xc0' + struct.pack('<i', argument))  # imul eax, eax, argument
+            self.emit(b'\x41\x00\x84\x24' + _disp(offset))  # add [r12 + offset], al
+            self.label(f'skip{name}')
+        elif opcode == CHECK:
+            self.emit(b'\x49\x8d\x84\x24' + _disp(argument))  # lea rax, [r12 + highest]
+            self.emit(b'\x4c\x39\xe8')  # cmp rax, r13
+            self.extend(b'\x48\x89\xc2')  # mov rdx, rax
+            self.emit(b'\x49\x8d\x84\x24' + _disp(offset))  # lea rax, [r12 + lowest]
+            self.emit(b'\x48\x39\xd8')  # cmp rax, rbx
+            self.jump('underflow', JB)
+        elif opcode == SCAN:
+            name = next(self.names)
+            self.label(f'scan{name}')
+            self.compare_cell()
+            self.jump(f'found{name}', JE)
+            self.emit(b'\x49\x81\xc4' + struct.pack('<i', argument))  # add r12, stride
+            self.check_pointer(argument)
+            self.jump(f'scan{name}')
+            self.label(f'found{name}')
+        elif opcode == OUT:
+            self.emit(b'\x41\x0f\xb6\xbc\x24' + _disp(offset))  # movzx edi, byte [r12 + offset]
+            self.emit(b'\x41\xff\xd6')  # call r14
+            self.emit(b'\x85\xc0')  # test eax, eax
+            self.jump('aborted', JNE)
+        elif opcode == IN:
+            self.emit(b'\x41\x0f\xb6\xbc\x24' + _disp(offset))  # movzx edi, byte [r12 + offset]
+            self.emit(b'\x41\xff\xd7')  # call r15
+            self.emit(b'\x48\x85\xc0')  # test rax, rax
+            self.jump('aborted', JS)
+            self.emit(b'\x41\x88\x84\x24' + _disp(offset))  # mov [r12 + offset], al
+        else:
+            raise ValueError(f'unknown opcode: {opcode}')
+
+    def compare_cell(self):
+        """Append comparison of the current cell with zero."""
+        self.emit(b'\x41\x80\xbc\x24' + _disp(0) + b'\0')  # cmp byte [r12], 0
+
+    def check_pointer(self, direction):
+        """Append jump to an error if the pointer moved out of range.
+
+        Moving past the extent extends it.
+        """
+        if direction > 0:
+            self.emit(b'\x4d\x39\xec')  # cmp r12, r13
+            self.extend(b'\x4c\x89\xe2')  # mov rdx, r12
+        else:
+            self.emit(b'\x49\x39\xdc')  # cmp r12, rbx
+            self.jump('underflow', JB)
+
+    def extend(self, move):
+        """Append a call extending the extent unless below it.
+
+        The address last compared with it is moved into rdx by the given
+        instruction first.
+        """
+        name = next(self.names)
+        self.jump(f'within{name}', JB)
+        self.emit(move)
+        self.call('extend')
+        self.label(f'within{name}')
+
+
+def _disp(offset):
+    """Return 32-bit displacement."""
+    return struct.pack('<i', offset)
+
+
+def _imm8(value):
+    """Return 8-bit immediate value wrapped around."""
+    return bytes([value & 0xff])
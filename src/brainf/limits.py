@@ -0,0 +1,100 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Step and time limits of running programs.
+
+Engines count steps, which are jumps back to the start of a loop, since
+only loops can keep a program running indefinitely. Counting them costs
+an addition and a comparison per iteration, while the budget itself is
+consulted only once the count reaches a limit it handed out earlier,
+which also spaces out reading the clock.
+"""
+
+import time
+
+UNLIMITED = 2**63 - 1
+
+# Same as that of timeout(1)
+EXIT_STATUS = 124
+
+CLOCK_INTERVAL = 2**16
+
+
+class LimitExceeded(Exception):
+    """
+    Program ran out of steps or time.
+    """
+
+    def __init__(self, message, steps):
+        """Keep the number of steps executed until the limit was hit."""
+        super().__init__(message)
+        self.steps = steps
+
+
+class Budget:
+    """
+    Maximum number of steps and running time of a program.
+    """
+
+    def __init__(self, max_steps=None, timeout=None, interval=None):
+        """Start the clock, if there is a timeout, and hand out the first limit.
+
+        Given an interval, limits are at most that many steps apart, so that
+        engines get a chance to do something else, such as saving snapshots.
+        """
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.interval = interval
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.steps = 0
+        self.limit = self.check(0)
+
+    @property
+    def limited(self):
+        """Return True if there is a step or time limit."""
+        return self.max_steps is not None or self.timeout is not None
+
+    def check(self, steps):
+        """Record steps executed so far and return the count to check at next.
+
+        Steps include the one about to be taken. Raise
+        brainf.limits.LimitExceeded if either limit was exceeded, in which
+        case that step is not taken and neither recorded nor reported.
+        """
+        if self.max_steps is not None and steps > self.max_steps:
+            self._exceed(f'exceeded the limit of {self.max_steps} steps', steps)
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self._exceed(f'exceeded the timeout of {self.timeout} seconds', steps)
+        self.steps = steps
+        limit = UNLIMITED if self.deadline is None else steps + CLOCK_INTERVAL
+        if self.interval is not None:
+            limit = min(limit, steps + self.interval)
+        if self.max_steps is not None:
+            limit = min(limit, self.max_steps + 1)
+        self.limit = limit
+        return limit
+
+    def _exceed(self, message, steps):
+        """Record steps executed before the limit and raise LimitExceeded."""
+        self.steps = max(steps - 1, 0)
+        raise LimitExceeded(message, self.steps)
@@ -24,14 +24,56 @@
 Memory used for the execution of Brainfuck programs.
 """
 
+import mmap
+import warnings
+from array import array
+
+TYPECODES = {
+    16: 'H',
+    32: 'I',
+}
+
+PAGE_BITS = 12
+
+PAGE_SIZE = 2**PAGE_BITS
+
+# Initial extent of fixed memory, which doubles as cells get touched
+EXTENT = 16
+
+
+def allocate(num_cells, cell_bits):
+    """Return zeroed cells of the given width.
+
+    Eight-bit cells are backed by bytearray, wider ones by array.
+    """
+    if cell_bits == 8:
+        return bytearray(num_cells)
+    if cell_bits in TYPECODES:
+        return array(TYPECODES[cell_bits], [0]) * num_cells
+    raise ValueError(f'unsupported cell width: {cell_bits}')
+
 
 class Memory:
     """Fixed size virtual memory comprised of cells."""
 
-    def __init__(self, num_bytes=2**16):
-        """Initialize memory with zeros."""
-        self.cells = [0] * num_bytes
+    resizable = False
+
+    def __init__(self, num_cells=2**16, cell_bits=8, num_bytes=None):
+        """Initialize memory with zeros.
+
+        Cells are unsigned integers of the given width which wrap around
+        on overflow. The num_bytes argument is a deprecated alias of
+        num_cells.
+        """
+        if num_bytes is not None:
+            warnings.warn('num_bytes is deprecated, use num_cells instead',
+                          DeprecationWarning, stacklevel=2)
+            num_cells = num_bytes
+        self.cells = allocate(num_cells, cell_bits)
+        self.mask = 2**cell_bits - 1
         self.pointer = 0
+        self.origin = 0
+        self.extent = min(num_cells, EXTENT)
 
     @property
     def cell(self):
@@ -40,8 +82,45 @@ class Memory:
 
     @cell.setter
     def cell(self, value):
-        """Assign value to the current cell."""
-        self.cells[self.pointer] = value
+        """Assign value to the current cell modulo its width."""
+        self.cells[self.pointer] = value & self.mask
+
+    @property
+    def allocated(self):
+        """Return the number of cells held without allocating more.
+
+        That is the whole tape of fixed and mapped memory, even though the
+        operating system only backs pages of a map which were touched.
+        """
+        return len(self.cells)
+
+    @property
+    def high_water_mark(self):
+        """Return the number of cells which may have been touched.
+
+        That is the extent, which doubles as the pointer moves past it, so
+        the count is rounded up to at most twice the cells touched.
+        """
+        return self.extent
+
+    def close(self):
+        """Release resources other than cells, if any."""
+
+    def ensure(self, lowest, highest):
+        """Make cells at the given offsets from the pointer addressable.
+
+        Engines call it when an address falls outside of the cells, or
+        outside of the extent, which is the number of leading cells that
+        may have been touched, and reload the pointer afterwards. Fixed
+        memory cannot grow, so raise MemoryError instead, but the extent
+        can, doubling up to the number of cells.
+        """
+        if self.pointer + highest >= len(self.cells):
+            raise MemoryError('not enough memory')
+        if self.pointer + lowest < 0:
+            raise MemoryError('negative memory address')
+        if self.pointer + highest >= self.extent:
+            self.extent = min(len(self.cells), max(self.pointer + highest + 1, 2 * self.extent))
 
     def incr(self):
         """Increment value at the current cell."""
@@ -54,11 +133,226 @@ class Memory:
     def movf(self):
         """Move pointer forward or raise MemoryError."""
         self.pointer = self.pointer + 1
-        if self.pointer >= len(self.cells):
-            raise MemoryError('not enough memory')
+        if self.pointer >= self.extent:
+            self.ensure(0, 0)
 
     def movb(self):
         """Move pointer backwards or raise MemoryError."""
         self.pointer = self.pointer - 1
         if self.pointer < 0:
-            raise MemoryError('negative memory address')
+            self.ensure(0, 0)
+
+    def scan(self, stride):
+        """Move pointer by stride until it hits a zero cell.
+
+        Search bytes directly with find() or rfind() when the stride
+        is one. Otherwise look for zero in slices of the tape which double
+        in size, so that the cost stays proportional to the distance
+        travelled. Running off the tape is the same as a sequence of movf()
+        or movb(), which either raises MemoryError or lands on a new zero
+        cell. Landing beyond the extent extends it.
+        """
+        if stride in (1, -1) and isinstance(self.cells, (bytearray, mmap.mmap)):
+            if stride > 0:
+                index = self.cells.find(b'\0', self.pointer)
+                self.pointer = len(self.cells) if index < 0 else index
+            else:
+                self.pointer = self.cells.rfind(b'\0', 0, self.pointer + 1)
+            if not 0 <= self.pointer < self.extent:
+                self.ensure(0, 0)
+            return
+        window = 16
+        while True:
+            stop = self.pointer + window * stride
+            chunk = self.cells[self.pointer:stop if stop >= 0 else None:stride]
+            if isinstance(chunk, memoryview):
+                chunk = chunk.tolist()
+            try:
+                self.pointer += chunk.index(0) * stride
+                break
+            except ValueError:
+                self.pointer += len(chunk) * stride
+            if not 0 <= self.pointer < len(self.cells):
+                self.ensure(0, 0)
+                return
+            window *= 2
+        if self.pointer >= self.extent:
+            self.ensure(0, 0)
+
+
+class GrowableMemory(Memory):
+    """Memory which grows in both directions on demand.
+
+    Cells start at the given number and double in size whenever the
+    pointer runs off either end, up to max_cells. Growing to the left
+    shifts existing cells, so the pointer and the origin, which is the
+    index of the initial cell, move along with them.
+    """
+
+    resizable = True
+
+    def __init__(self, num_cells=16, cell_bits=8, max_cells=2**32):
+        """Initialize a small memory with zeros."""
+        super().__init__(num_cells, cell_bits)
+        self.max_cells = max_cells
+        self.extent = num_cells
+
+    def ensure(self, lowest, highest):
+        """Make cells at the given offsets from the pointer addressable.
+
+        Grow in place, so that engines holding the cells see the change,
+        or raise MemoryError beyond max_cells.
+        """
+        size = len(self.cells)
+        before = max(0, -(self.pointer + lowest))
+        after = max(0, self.pointer + highest + 1 - size)
+        if before == after == 0:
+            return
+        needed = size + before + after
+        if needed > self.max_cells:
+            raise MemoryError('not enough memory')
+        new_size = max(size, 1)
+        while new_size < needed:
+            new_size *= 2
+        spare = min(new_size, self.max_cells) - needed
+        cell_bits = self.mask.bit_length()
+        if before:
+            self.cells[:0] = allocate(before + spare, cell_bits)
+            self.pointer += before + spare
+            self.origin += before + spare
+        if after:
+            self.cells.extend(allocate(after + (0 if before else spare), cell_bits))
+        self.extent = len(self.cells)
+
+
+class Pages:
+    """Cells split into pages, which are only allocated when written to."""
+
+    def __init__(self, num_cells, cell_bits):
+        """Initialize cells without allocating any pages."""
+        self.num_cells = num_cells
+        self.cell_bits = cell_bits
+        self.pages = {}
+
+    def __len__(self):
+        """Return the number of addressable cells."""
+        return self.num_cells
+
+    def __getitem__(self, address):
+        """Return value of the cell, which is zero on missing pages."""
+        page = self.pages.get(address >> PAGE_BITS)
+        if page is None:
+            return 0
+        return page[address & PAGE_SIZE - 1]
+
+    def __setitem__(self, address, value):
+        """Assign value to the cell, allocating its page unless zero."""
+        page = self.pages.get(address >> PAGE_BITS)
+        if page is None:
+            if value == 0:
+                return
+            page = self.pages[address >> PAGE_BITS] = allocate(PAGE_SIZE, self.cell_bits)
+        page[address & PAGE_SIZE - 1] = value
+
+
+class PagedMemory(Memory):
+    """Sparse memory which only takes up pages of cells actually used.
+
+    The pointer starts in the middle of a large address space, so that
+    programs can move far in either direction. Every access looks up a
+    page, which makes it slower than contiguous memory.
+    """
+
+    resizable = True
+
+    def __init__(self, num_cells=2**32, cell_bits=8):
+        """Initialize memory without allocating any pages."""
+        super().__init__(0, cell_bits)
+        self.cells = Pages(num_cells, cell_bits)
+        self.pointer = self.origin = num_cells // 2
+        self.extent = num_cells
+
+    @property
+    def allocated(self):
+        """Return the number of cells in allocated pages only."""
+        return len(self.cells.pages) * PAGE_SIZE
+
+    @property
+    def high_water_mark(self):
+        """Return the number of cells in pages which were written to."""
+        return self.allocated
+
+    def scan(self, stride):
+        """Move pointer by stride until it hits a zero cell.
+
+        Missing pages are all zeros, so only search allocated ones.
+        """
+        pages = self.cells.pages
+        while True:
+            page = pages.get(self.pointer >> PAGE_BITS)
+            if page is None:
+                return
+            chunk = page[self.pointer & PAGE_SIZE - 1::stride]
+            try:
+                self.pointer += chunk.index(0) * stride
+                return
+            except ValueError:
+                self.pointer += len(chunk) * stride
+            if not 0 <= self.pointer < len(self.cells):
+                self.ensure(0, 0)
+
+
+class MappedMemory(Memory):
+    """Fixed size memory mapped from anonymous pages or a file.
+
+    The operating system provides pages of zeros on first access and can
+    swap them out, so a large memory only takes up what is actually used.
+    Cells wider than eight bits are a typed view of the map. Both expose
+    the buffer protocol to native engines. Given a path, the cells are
+    saved to that file, which is created or truncated first.
+    """
+
+    def __init__(self, num_cells=2**30, cell_bits=8, path=None):
+        """Map memory of zeros."""
+        super().__init__(0, cell_bits)
+        size = num_cells * (cell_bits // 8)
+        if path is None:
+            self.map = mmap.mmap(-1, size)
+        else:
+            with open(path, 'w+b') as file_object:
+                file_object.truncate(size)
+                self.map = mmap.mmap(file_object.fileno(), size)
+        self.path = path
+        if cell_bits == 8:
+            self.cells = self.map
+        else:
+            self.cells = memoryview(self.map).cast(TYPECODES[cell_bits])
+        self.extent = min(num_cells, EXTENT)
+
+    def close(self):
+        """Write cells to the file, if any, and unmap them."""
+        if isinstance(self.cells, memoryview):
+            self.cells.release()
+        if self.path is not None:
+            self.map.flush()
+        self.map.close()
+
+
+TAPES = {
+    'fixed': Memory,
+    'growable': GrowableMemory,
+    'paged': PagedMemory,
+    'mapped': MappedMemory,
+}
+
+
+def open_memory(tape='fixed', cell_bits=8, path=None):
+    """Return memory of the given kind from TAPES.
+
+    Only mapped memory can be saved to a file at the given path.
+    """
+    if path is None:
+        return TAPES[tape](cell_bits=cell_bits)
+    if tape != 'mapped':
+        raise ValueError(f'{tape} tape cannot be saved to a file')
+    return MappedMemory(cell_bits=cell_bits, path=path)
@@ -0,0 +1,117 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Execution profile of source code run by the reference interpreter.
+
+Counts how many times every instruction was executed. Loop statistics
+follow from the counts of their brackets: each pass through the body ends
+at the closing bracket, while the opening bracket runs once more per entry.
+"""
+
+import collections
+import itertools
+import math
+
+HEAT = ' .:-=+*#%@'
+
+Loop = collections.namedtuple('Loop', 'start end line column entries iterations executed')
+
+
+class Profile:
+    """
+    Execution counts of instructions, filled in by brainf.interpret().
+    """
+
+    def __init__(self):
+        """Create an empty profile."""
+        self.code = None
+        self.counts = []
+
+    def attach(self, code):
+        """Reset counts for the given source code and return them."""
+        self.code = code
+        self.counts = [0] * len(code)
+        return self.counts
+
+    @property
+    def executed(self):
+        """Return the total number of executed instructions."""
+        return sum(self.counts)
+
+    def loops(self):
+        """Return loops sorted by the number of instructions executed inside."""
+        positions = self.code.positions
+        totals = [0, *itertools.accumulate(self.counts)]
+        loops = []
+        for start, end in self.code.jumps.items():
+            if start < end:
+                iterations = self.counts[end]
+                loops.append(Loop(start, end, *positions[start],
+                                  self.counts[start] - iterations, iterations,
+                                  totals[end + 1] - totals[start]))
+        return sorted(loops, key=lambda loop: (-loop.executed, loop.start))
+
+    def report(self, limit=10):
+        """Return a table of the hottest loops with their source positions."""
+        executed = self.executed
+        lines = [f'{executed} instructions executed', '',
+                 f'{"line:col":>10} {"executed":>12} {"share":>6} {"entries":>10} '
+                 f'{"iterations":>12}  source']
+        for loop in self.loops()[:limit]:
+            source = self.code.instructions[loop.start:loop.end + 1]
+            if len(source) > 32:
+                source = source[:29] + '...'
+            share = loop.executed / executed if executed else 0
+            lines.append(f'{loop.line:>6}:{loop.column:<3} {loop.executed:>12} {share:>6.1%} '
+                         f'{loop.entries:>10} {loop.iterations:>12}  {source}')
+        return '\n'.join(lines)
+
+    def heatmap(self):
+        """Return source code annotated with executions per line.
+
+        Lines are shaded on a logarithmic scale relative to the hottest one.
+        """
+        per_line = collections.Counter()
+        for (line, _), count in zip(self.code.positions, self.counts):
+            per_line[line] += count
+        hottest = max(per_line.values(), default=0)
+        lines = []
+        for number, text in enumerate(self.code.text.split('\n'), 1):
+            if number in per_line:
+                count = per_line[number]
+                level = math.log1p(count) / math.log1p(hottest) if hottest else 0
+                heat = HEAT[round(level * (len(HEAT) - 1))]
+                lines.append(f'{count:>12} {heat} | {text}')
+            else:
+                lines.append(f'{"":>12}   | {text}')
+        return '\n'.join(lines)
+
+    def to_json(self):
+        """Return a dict with counts and loops which can be serialized."""
+        return {
+            'executed': self.executed,
+            'instructions': self.code.instructions,
+            'positions': self.code.positions,
+            'counts': self.counts,
+            'loops': [loop._asdict() for loop in self.loops()],
+        }
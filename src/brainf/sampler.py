@@ -0,0 +1,149 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Statistical profiler which samples the program counter of a running engine.
+
+A wall-clock interval timer interrupts the engine with SIGALRM, whose handler
+finds the interpreter loop among the interrupted frames and reads its
+current operation. Nothing is added to the loop itself, so the overhead
+is limited to the handler running once per interval. Samples are mapped
+back to source positions through the compiled program and aggregated
+into collapsed stacks of enclosing loops, which flame graph tools such
+as flamegraph.pl or speedscope read directly.
+"""
+
+import collections
+import signal
+
+from brainf import dispatch
+from brainf.compiler import OPEN, CLOSE
+
+INTERVAL = 0.001
+
+OPNAMES = 'ADD MOVE OUT IN OPEN CLOSE SET MUL SCAN CHECK'.split()
+
+
+class Sampler:
+    """
+    Samples of operations being executed, collected while started.
+    """
+
+    def __init__(self, interval=INTERVAL):
+        """Create a sampler firing every interval seconds.
+
+        The timer runs on wall-clock time, whose resolution is finer than
+        that of the CPU-time timers on most systems.
+        """
+        self.interval = interval
+        self.program = None
+        self.samples = collections.Counter()
+        self._handler = None
+
+    def start(self, program):
+        """Reset samples for the given program and start the timer."""
+        self.program = program
+        self.samples.clear()
+        self._handler = signal.signal(signal.SIGALRM, self._sample)
+        signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+
+    def stop(self):
+        """Stop the timer and restore the previous signal handler."""
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, self._handler)
+
+    def _sample(self, signum, frame):
+        """Count the operation being executed by the interrupted engine."""
+        self.samples[find_counter(frame)] += 1
+
+    @property
+    def total(self):
+        """Return the total number of samples."""
+        return sum(self.samples.values())
+
+    def stacks(self, locations=None):
+        """Return a Counter of stacks, each a tuple of frame names.
+
+        Frames name the enclosing loops, outermost first, followed by the
+        sampled operation. They show the line and column of the source
+        instruction given its locations, or its index otherwise. Samples
+        taken outside of any operation get an empty stack.
+        """
+        opcodes = self.program.opcodes
+        parents = nesting(self.program.ops)
+        stacks = collections.Counter()
+        for counter, count in self.samples.items():
+            if counter is None or counter >= len(opcodes):
+                stacks[()] += count
+                continue
+            stack = [f'{OPNAMES[opcodes[counter]]}@{self._where(counter, locations)}']
+            loop = counter if opcodes[counter] == OPEN else parents[counter]
+            while loop is not None:
+                stack.append(f'loop@{self._where(loop, locations)}')
+                loop = parents[loop]
+            stacks[tuple(reversed(stack))] += count
+        return stacks
+
+    def collapsed(self, root='program', locations=None):
+        """Return stacks in the collapsed format, one 'a;b;c count' per line."""
+        return '\n'.join(f'{";".join((root, *stack))} {count}'
+                         for stack, count in sorted(self.stacks(locations).items()))
+
+    def _where(self, counter, locations):
+        """Return source position of the operation at the given index."""
+        if self.program.positions is None:
+            return f'#{counter}'
+        position = self.program.positions[counter]
+        if locations is None:
+            return str(position)
+        return '{}:{}'.format(*locations[position])
+
+
+def find_counter(frame):
+    """Return index of the operation executed in the given stack or None.
+
+    The tiered engine runs compiled loops in functions named after
+    the index of their OPEN, so samples taken there land on it.
+    """
+    while frame is not None:
+        code = frame.f_code
+        if code is dispatch.run.__code__:
+            return frame.f_locals.get('i')
+        if code.co_filename == '<brainf>' and code.co_name.startswith('loop'):
+            return int(code.co_name[4:])
+        frame = frame.f_back
+    return None
+
+
+def nesting(ops):
+    """Return index of the OPEN of the innermost loop around each op or None.
+
+    A CLOSE belongs to its own loop, whereas an OPEN to the enclosing one.
+    """
+    parents, stack = [], []
+    for i, (opcode, _, _) in enumerate(ops):
+        parents.append(stack[-1] if stack else None)
+        if opcode == OPEN:
+            stack.append(i)
+        elif opcode == CLOSE:
+            stack.pop()
+    return parents
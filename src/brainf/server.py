@@ -0,0 +1,241 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Daemon which runs programs in a pool of warm worker processes.
+
+The daemon listens on a Unix socket and forks workers after importing
+everything, so that they accept connections with no start-up cost. A
+client sends its command line arguments and working directory along with
+its stdin, stdout and stderr file descriptors passed as SCM_RIGHTS. The
+worker runs the command with those streams and replies with the exit
+status, or aborts it if the client hangs up first. Workers keep compiled
+programs in memory between requests, so an unchanged file is neither
+parsed nor hashed again.
+"""
+
+import array
+import contextlib
+import json
+import os
+import select
+import signal
+import socket
+import sys
+import threading
+import traceback
+
+import brainf.client
+
+MAX_REQUEST = 2**16
+
+BACKLOG = 128
+
+
+def serve(path, workers=None):
+    """Listen on a Unix socket and run commands in a pool of workers.
+
+    Workers are forked once the command line interface and the engines
+    have been imported. Workers which exit are replaced. Stop them and
+    remove the socket on SIGTERM or KeyboardInterrupt.
+    """
+    import brainf.cli
+    workers = workers or os.cpu_count() or 1
+    # Workers run commands on behalf of clients and must not forward them
+    os.environ.pop(brainf.client.SOCKET_VARIABLE, None)
+    server = listen(path)
+    pids = set()
+    handler = signal.signal(signal.SIGTERM, _terminate)
+    try:
+        while True:
+            while len(pids) < workers:
+                pids.add(spawn(server))
+            pid, _ = os.wait()
+            pids.discard(pid)
+    finally:
+        signal.signal(signal.SIGTERM, handler)
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        server.close()
+        os.unlink(path)
+
+
+def listen(path):
+    """Return a socket listening on the given path, replacing a stale one."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    server.bind(path)
+    server.listen(BACKLOG)
+    return server
+
+
+def spawn(server):
+    """Fork a worker which accepts connections until it is terminated."""
+    pid = os.fork()
+    if pid == 0:
+        status = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            # Hangups abort commands with SIGINT, even if the daemon ignores it
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+            work(server)
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+        finally:
+            os._exit(status)
+    return pid
+
+
+def work(server, programs=None):
+    """Accept connections and run one command at a time until closed.
+
+    KeyboardInterrupt aborts the current command, whether its client hung
+    up or Ctrl+C was pressed in the daemon's terminal, after which the
+    daemon stops workers with SIGTERM anyway.
+    """
+    programs = {} if programs is None else programs
+    while True:
+        try:
+            serve_connection(server, programs)
+        except KeyboardInterrupt:
+            continue
+        except OSError:
+            if server.fileno() == -1:
+                return
+            raise
+
+
+def serve_connection(server, programs):
+    """Accept a connection and run the requested command."""
+    connection, _ = server.accept()
+    with connection:
+        try:
+            argv, cwd, fds = receive_request(connection)
+        except (OSError, ValueError):
+            return
+        with interrupt_on_hangup(connection):
+            status = handle(argv, cwd, fds, programs)
+        try:
+            connection.sendall(f'{status}\n'.encode('ascii'))
+        except OSError:
+            pass
+
+
+def handle(argv, cwd, fds, programs):
+    """Run command line arguments with the given standard streams.
+
+    Return the exit status, which is 1 when the command failed with an
+    exception, printed on the client's stderr. The descriptors are closed.
+    """
+    import brainf.cli
+    streams = sys.stdin, sys.stdout, sys.stderr
+    sys.stdin = open(fds[0], 'r')
+    sys.stdout = open(fds[1], 'w')
+    sys.stderr = open(fds[2], 'w')
+    try:
+        os.chdir(cwd)
+        status = brainf.cli.main(argv, programs)
+    except SystemExit as error:
+        status = error.code
+    except Exception:
+        traceback.print_exc()
+        status = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr, sys.stdin):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        sys.stdin, sys.stdout, sys.stderr = streams
+    if status is None:
+        return 0
+    return status if isinstance(status, int) else 1
+
+
+@contextlib.contextmanager
+def interrupt_on_hangup(connection):
+    """Raise KeyboardInterrupt in the main thread if the client hangs up.
+
+    Clients send nothing after the request, so the connection only becomes
+    readable when they close it. A thread waits for that while the body of
+    the with statement runs, interrupting blocking calls with SIGINT.
+    """
+    done, wake = os.pipe()
+    thread = threading.Thread(target=_watch, args=(connection, done), daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        os.write(wake, b'\0')
+        thread.join()
+        os.close(done)
+        os.close(wake)
+
+
+def receive_request(connection):
+    """Return arguments, working directory and descriptors of a request.
+
+    Raise ValueError if the request is malformed, in which case any
+    received descriptors are closed.
+    """
+    fds = array.array('i')
+    data, ancdata, _, _ = connection.recvmsg(
+        MAX_REQUEST, socket.CMSG_LEN(3 * fds.itemsize))
+    for level, kind, payload in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(payload[:len(payload) - len(payload) % fds.itemsize])
+    try:
+        while data and not data.endswith(b'\n') and len(data) < MAX_REQUEST:
+            chunk = connection.recv(MAX_REQUEST)
+            if not chunk:
+                break
+            data += chunk
+        if len(fds) != 3:
+            raise ValueError('expected stdin, stdout and stderr descriptors')
+        request = json.loads(data.decode('utf-8'))
+        return request['argv'], request['cwd'], list(fds)
+    except (ValueError, KeyError, TypeError):
+        for fd in fds:
+            os.close(fd)
+        raise ValueError('malformed request') from None
+
+
+def _watch(connection, done):
+    """Send SIGINT to the main thread once the connection is hung up."""
+    poller = select.poll()
+    poller.register(connection, select.POLLIN | getattr(select, 'POLLRDHUP', 0))
+    poller.register(done, select.POLLIN)
+    if done not in dict(poller.poll()):
+        signal.pthread_kill(threading.main_thread().ident, signal.SIGINT)
+
+
+def _terminate(signum, frame):
+    """Stop serving on SIGTERM."""
+    sys.exit(0)
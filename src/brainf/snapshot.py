@@ -0,0 +1,239 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Snapshots of programs run by the ir engine, which can be resumed later.
+
+A snapshot holds everything needed to carry on from where the program
+was: the index of the next operation, steps executed so far, the pointer,
+cells up to the last non-zero one or the pointer, the number of input
+bytes consumed and output which has yet to be written out. Only cells
+within the memory's extent, which the engine may have touched, are
+searched for the last non-zero one. Snapshots are taken at the end of
+loop iterations, either every so many steps or when a signal arrives,
+after which the program stops.
+"""
+
+import hashlib
+import os
+import signal
+import struct
+import tempfile
+
+from brainf.memory import TAPES
+
+MAGIC = b'BFS\x01'
+HEADER = struct.Struct('<16s8sBqqqqqqq')
+BLOCK_SIZE = 2**16
+
+# Same as EX_TEMPFAIL of sysexits.h, which asks to try again later
+EXIT_STATUS = 75
+
+POLL_INTERVAL = 2**16
+
+
+class Suspended(Exception):
+    """
+    Program stopped after saving a snapshot.
+    """
+
+    def __init__(self, path, steps):
+        """Keep the path of the snapshot and the number of steps executed."""
+        super().__init__(f'saved snapshot to {path} after {steps} steps')
+        self.path = path
+        self.steps = steps
+
+
+class Snapshot:
+    """
+    Execution state of a compiled program.
+    """
+
+    @classmethod
+    def capture(cls, program, memory, counter, steps, output, input):
+        """Return a snapshot referring to, rather than copying, the cells.
+
+        Raise ValueError for memory which isn't a contiguous buffer.
+        """
+        tapes = {memory_type: name for name, memory_type in TAPES.items()}
+        try:
+            view = memoryview(memory.cells)
+        except TypeError:
+            raise ValueError('memory without a buffer cannot be saved') from None
+        count = max(high_water_mark(view[:memory.extent]), memory.pointer + 1)
+        return cls(fingerprint(program), tapes.get(type(memory), 'fixed'),
+                   memory.mask.bit_length(), counter, steps, memory.pointer,
+                   memory.origin, input.offset, output.pending, view[:count])
+
+    @classmethod
+    def load(cls, path):
+        """Return snapshot read from the given file.
+
+        Raise ValueError if the file isn't a snapshot.
+        """
+        with open(path, 'rb') as file_object:
+            if file_object.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'not a snapshot: {path}')
+            header = file_object.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f'truncated snapshot: {path}')
+            (digest, tape, cell_bits, counter, steps, pointer, origin, input_offset,
+             output_size, cells_size) = HEADER.unpack(header)
+            output = file_object.read(output_size)
+            cells = file_object.read(cells_size)
+            if len(output) != output_size or len(cells) != cells_size:
+                raise ValueError(f'truncated snapshot: {path}')
+        return cls(digest, tape.rstrip(b'\0').decode('ascii'), cell_bits, counter,
+                   steps, pointer, origin, input_offset, output, cells)
+
+    def __init__(self, digest, tape, cell_bits, counter, steps, pointer, origin,
+                 input_offset, output, cells):
+        """Keep state, with cells as a bytes-like object."""
+        self.digest = digest
+        self.tape = tape
+        self.cell_bits = cell_bits
+        self.counter = counter
+        self.steps = steps
+        self.pointer = pointer
+        self.origin = origin
+        self.input_offset = input_offset
+        self.output = output
+        self.cells = cells
+
+    def save(self, path):
+        """Write snapshot to the given file, replacing it atomically.
+
+        Cells are written straight from memory without copying.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        try:
+            with open(fd, 'wb') as file_object:
+                file_object.write(MAGIC)
+                file_object.write(HEADER.pack(
+                    self.digest, self.tape.encode('ascii'), self.cell_bits, self.counter,
+                    self.steps, self.pointer, self.origin, self.input_offset,
+                    len(self.output), memoryview(self.cells).nbytes))
+                file_object.write(self.output)
+                file_object.write(self.cells)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def restore(self, program, memory, output, input):
+        """Put saved state into memory, output and input.
+
+        Raise ValueError if the snapshot was taken of another program or
+        with cells of another width, and MemoryError if the cells don't
+        fit in memory.
+        """
+        if self.digest != fingerprint(program):
+            raise ValueError('snapshot was taken of a different program')
+        if memory.mask != 2**self.cell_bits - 1:
+            raise ValueError(f'snapshot was taken with {self.cell_bits}-bit cells')
+        data = memoryview(self.cells).cast('B')
+        memory.pointer = 0
+        memory.ensure(0, data.nbytes // (self.cell_bits // 8) - 1)
+        memoryview(memory.cells).cast('B')[:data.nbytes] = data
+        memory.pointer = self.pointer
+        memory.origin = self.origin
+        output.extend(self.output)
+        input.skip(self.input_offset)
+
+
+class Checkpoint:
+    """
+    Trigger for saving snapshots while a program runs.
+
+    Snapshots go to the given path every so many steps, if given, and when
+    one of the given signals arrives, in which case the program stops by
+    raising Suspended. Signals are only noticed at the end of loops, so
+    engines are asked to look at least every POLL_INTERVAL steps.
+    """
+
+    def __init__(self, path, every=None, signals=(signal.SIGTERM,)):
+        """Schedule the first snapshot without handling signals yet."""
+        self.path = path
+        self.every = every
+        self.signals = signals
+        self.interval = POLL_INTERVAL if every is None else min(every, POLL_INTERVAL)
+        self.next = every
+        self.requested = False
+        self.handlers = {}
+
+    def start(self):
+        """Handle signals by requesting a snapshot."""
+        for signum in self.signals:
+            self.handlers[signum] = signal.signal(signum, self._request)
+
+    def stop(self):
+        """Restore previous handlers of signals."""
+        for signum, handler in self.handlers.items():
+            signal.signal(signum, handler)
+        self.handlers.clear()
+
+    def due(self, steps):
+        """Return True if a snapshot should be saved now."""
+        return self.requested or (self.next is not None and steps >= self.next)
+
+    def save(self, program, memory, counter, steps, output, input):
+        """Save snapshot of the program about to run operation at counter.
+
+        Raise Suspended if requested by a signal, leaving the pending
+        output to the snapshot instead of writing it out.
+        """
+        Snapshot.capture(program, memory, counter, steps, output, input).save(self.path)
+        if self.every is not None:
+            self.next = steps + self.every
+        if self.requested:
+            output.buffer.clear()
+            raise Suspended(self.path, steps)
+
+    def _request(self, signum, frame):
+        """Note that a snapshot was requested by a signal."""
+        self.requested = True
+
+
+def fingerprint(program):
+    """Return a digest of the compiled operations."""
+    digest = hashlib.blake2b(digest_size=16)
+    for values in (program.opcodes, program.offsets, program.arguments):
+        digest.update(values)
+    return digest.digest()
+
+
+def high_water_mark(view):
+    """Return the number of cells up to the last non-zero one.
+
+    Trailing zeros are stripped a block at a time, so that no more than
+    one block is copied at once.
+    """
+    data = view.cast('B')
+    stop = data.nbytes
+    while stop > 0:
+        start = max(0, stop - BLOCK_SIZE)
+        size = len(data[start:stop].tobytes().rstrip(b'\0'))
+        if size:
+            return -(-(start + size) // view.itemsize)
+        stop = start
+    return 0
@@ -0,0 +1,224 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Buffered streams used by Brainfuck programs for I/O.
+"""
+
+import mmap
+import os
+import sys
+
+
+class Output:
+    """
+    Binary sink which collects bytes printed by the program.
+
+    The buffer is written out when it reaches buffer_size, on newline if
+    line buffered, before reading input if flush_on_input is set, and on
+    flush(). Line buffering defaults to whether the sink is a terminal.
+    Only the lowest byte of wider cells is written.
+    """
+
+    def __init__(self, sink=None, buffer_size=8192, line_buffering=None,
+                 flush_on_input=True):
+        """Wrap a binary sink, standard output by default."""
+        self.sink = sys.stdout.buffer if sink is None else sink
+        self.buffer = bytearray()
+        self.buffer_size = buffer_size
+        if line_buffering is None:
+            line_buffering = _isatty(self.sink)
+        self.line_buffering = line_buffering
+        self.flush_on_input = flush_on_input
+
+    @property
+    def pending(self):
+        """Return bytes in the buffer, which have yet to be written out."""
+        return bytes(self.buffer)
+
+    def extend(self, data):
+        """Append bytes to the buffer as if they were printed."""
+        self.buffer.extend(data)
+
+    def write(self, value):
+        """Append a single cell value to the buffer."""
+        self.buffer.append(value & 0xff)
+        if len(self.buffer) >= self.buffer_size or (
+                value == 10 and self.line_buffering):
+            self.flush()
+
+    def flush(self):
+        """Write the buffer out to the sink."""
+        if self.buffer:
+            self.sink.write(self.buffer)
+            self.buffer.clear()
+        self.sink.flush()
+
+
+class TextOutput(Output):
+    """
+    Text sink which translates newlines to the platform's convention.
+
+    Cell values are treated as Unicode code points.
+    """
+
+    def __init__(self, sink=None, buffer_size=8192, line_buffering=None,
+                 flush_on_input=True):
+        """Wrap a text sink, standard output by default."""
+        super().__init__(sys.stdout if sink is None else sink,
+                         buffer_size, line_buffering, flush_on_input)
+        self.buffer = []
+
+    @property
+    def pending(self):
+        """Return characters in the buffer encoded as UTF-8."""
+        return ''.join(self.buffer).encode('utf-8', 'surrogatepass')
+
+    def extend(self, data):
+        """Append characters encoded as UTF-8 to the buffer."""
+        self.buffer.extend(data.decode('utf-8', 'surrogatepass'))
+
+    def write(self, value):
+        """Append a single character to the buffer."""
+        self.buffer.append(chr(value))
+        if len(self.buffer) >= self.buffer_size or (
+                value == 10 and self.line_buffering):
+            self.flush()
+
+    def flush(self):
+        """Write the buffer out to the sink."""
+        if self.buffer:
+            self.sink.write(''.join(self.buffer))
+            self.buffer.clear()
+        self.sink.flush()
+
+
+class Input:
+    """
+    Binary source which serves bytes from blocks read in bulk.
+
+    Blocks come from a single read1() call where available, so that
+    interactive input is served as soon as a line is typed. At the end of
+    input read() returns the eof value, where None means that the cell
+    should be left unchanged. In text mode the platform's newline is
+    translated to a line feed.
+    """
+
+    @classmethod
+    def from_file(cls, path, eof=None, text=False):
+        """Return an Input serving the contents of a memory-mapped file."""
+        with open(path, 'rb') as file_object:
+            instance = cls(file_object, eof, text=text)
+            if os.fstat(file_object.fileno()).st_size > 0:
+                data = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+                instance.view = memoryview(instance._translate(data, final=True))
+            instance.source = None
+        return instance
+
+    def __init__(self, source=None, eof=None, block_size=2**16, text=False):
+        """Wrap a binary source, standard input by default."""
+        self.source = sys.stdin.buffer if source is None else source
+        self.eof = eof
+        self.block_size = block_size
+        self.linesep = os.linesep.encode('ascii') if text else b'\n'
+        self.pending = b''
+        self.view = memoryview(b'')
+        self.cursor = 0
+        self.consumed = 0
+
+    @property
+    def offset(self):
+        """Return the number of bytes served so far."""
+        return self.consumed + self.cursor
+
+    @property
+    def blocking(self):
+        """Return True if the next read() has to read from the source."""
+        return self.cursor == len(self.view) and self.source is not None
+
+    def skip(self, count):
+        """Discard up to count bytes, as if they were read."""
+        while count > 0 and (self.cursor < len(self.view) or self._fill()):
+            step = min(count, len(self.view) - self.cursor)
+            self.cursor += step
+            count -= step
+
+    def read(self):
+        """Return the next byte or the eof value."""
+        if self.cursor == len(self.view) and not self._fill():
+            return self.eof
+        value = self.view[self.cursor]
+        self.cursor += 1
+        return value
+
+    def _fill(self):
+        """Read the next non-empty block and return False at the end."""
+        while self.source is not None:
+            read = getattr(self.source, 'read1', self.source.read)
+            data = read(self.block_size)
+            if not data:
+                self.source = None
+            data = self._translate(data, final=self.source is None)
+            if data:
+                self.consumed += len(self.view)
+                self.view, self.cursor = memoryview(data), 0
+                return True
+        return False
+
+    def _translate(self, data, final):
+        """Return data with newlines translated, holding back a split one."""
+        if self.linesep == b'\n':
+            return data
+        data = self.pending + data
+        self.pending = b''
+        if not final and len(self.linesep) > 1 and data.endswith(self.linesep[:1]):
+            data, self.pending = data[:-1], data[-1:]
+        return data.replace(self.linesep, b'\n')
+
+
+def open_output(output=None, text=False):
+    """Return an Output wrapping the given sink or standard output.
+
+    Fall back to text mode when standard output has no binary buffer.
+    """
+    if isinstance(output, Output):
+        return output
+    if text:
+        return TextOutput(output)
+    if output is None and not hasattr(sys.stdout, 'buffer'):
+        return TextOutput()
+    return Output(output)
+
+
+def open_input(input=None, text=False, eof=None):
+    """Return an Input wrapping the given source or standard input."""
+    if isinstance(input, Input):
+        return input
+    return Input(input, eof, text=text)
+
+
+def _isatty(stream):
+    """Return True if the stream is connected to a terminal."""
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
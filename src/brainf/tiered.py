@@ -0,0 +1,80 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Tiered engine which promotes hot loops to compiled Python functions.
+
+Programs start in the dispatch loop of the ir engine, which counts how
+many times each loop header is executed, both on entry and on every
+iteration. Once a loop reaches the threshold, its OPEN is replaced
+by a call to a function generated by brainf.codegen, which runs the rest
+of the loop there and then, and the whole loop from then on.
+"""
+
+import time
+
+from brainf import codegen, dispatch
+from brainf.dispatch import CALL
+from brainf.limits import Budget
+from brainf.streams import open_input, open_output
+
+THRESHOLD = 1000
+
+
+def execute(program, memory, output=None, input=None, stats=None, threshold=THRESHOLD,
+            max_steps=None, timeout=None):
+    """Run compiled program utilizing provided memory.
+
+    Record the threshold, the number of compiled loops, the time spent
+    compiling them and, given a limit, the number of steps executed in
+    stats, if given.
+    """
+
+    output = open_output(output)
+    input = open_input(input)
+    ops = program.ops
+    counts = [0] * len(ops)
+    budget = Budget(max_steps, timeout)
+    tier_ups, compile_time = 0, 0.0
+
+    def tier(i):
+        """Count execution of a loop header and compile the loop when hot."""
+        nonlocal tier_ups, compile_time
+        counts[i] += 1
+        if counts[i] < threshold:
+            return False
+        started = time.perf_counter()
+        ops[i] = (CALL, ops[i][2], codegen.translate(program, i, budget.limited))
+        compile_time += time.perf_counter() - started
+        tier_ups += 1
+        return True
+
+    try:
+        for _ in dispatch.run(program, memory, output, input, budget, ops, tier=tier):
+            pass
+    finally:
+        if stats is not None:
+            stats['threshold'] = threshold
+            stats['tier_ups'] = tier_ups
+            stats['compile_time'] = compile_time
+            if budget.limited:
+                stats['steps'] = budget.steps
@@ -0,0 +1,310 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+Engine which transpiles compiled programs into C.
+
+The C source is built with the system compiler into a shared library,
+which is cached under a name derived from the hash of its source, and
+loaded with ctypes. I/O goes through callbacks into the Python streams.
+The pointer and the memory's extent are passed in and out through an
+array of two integers, with the extent doubling as the pointer moves
+past it, the same way as in brainf.memory.Memory.ensure().
+"""
+
+import ctypes
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from brainf import codegen
+from brainf.cache import cache_directory, evict
+from brainf.compiler import ADD, MOVE, OUT, IN, OPEN, CLOSE, SET, MUL, SCAN, CHECK
+from brainf.limits import Budget
+from brainf.streams import open_input, open_output
+
+CELL_TYPES = {
+    1: ('uint8_t', ctypes.c_uint8),
+    2: ('uint16_t', ctypes.c_uint16),
+    4: ('uint32_t', ctypes.c_uint32),
+}
+
+WRITE = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_int64)
+READ = ctypes.CFUNCTYPE(ctypes.c_int64, ctypes.c_int64)
+CHECK_BUDGET = ctypes.CFUNCTYPE(ctypes.c_int64, ctypes.c_int64)
+
+OVERFLOW, UNDERFLOW, ABORTED = 1, 2, 3
+
+MAX_CACHE_SIZE = 64 * 2**20
+
+HEADER = '''\
+#include <stdint.h>
+#include <string.h>
+
+typedef {cell} cell;
+typedef int (*write_t)(int64_t);
+typedef int64_t (*read_t)(int64_t);
+typedef int64_t (*check_t)(int64_t);
+
+static int64_t extend(int64_t extent, int64_t needed, int64_t size)
+{{
+    extent = 2 * extent > needed ? 2 * extent : needed;
+    return extent < size ? extent : size;
+}}
+
+int run(cell *cells, int64_t size, int64_t *position, write_t write, read_t read,
+        check_t check, int64_t *counters)
+{{
+    int64_t pointer = position[0], extent = position[1];
+    int64_t steps = counters[0], limit = counters[1];
+    int64_t value;
+    int status = 0;
+'''
+
+FOOTER = '''\
+    goto done;
+overflow:
+    status = 1;
+    goto done;
+underflow:
+    status = 2;
+    goto done;
+aborted:
+    status = 3;
+done:
+    position[0] = pointer;
+    position[1] = extent;
+    counters[0] = steps;
+    return status;
+}
+'''
+
+
+def execute(program, memory, output=None, input=None, stats=None, max_steps=None,
+            timeout=None):
+    """Run compiled program utilizing provided memory.
+
+    Fall back to the Python code generator when there is no C compiler
+    or the memory is resizable or not backed by a contiguous buffer. Steps are only
+    counted when there is a limit. Record the time spent on building,
+    whether the library was cached and the number of steps executed, if
+    counted, in stats.
+    """
+    compiler = find_compiler()
+    try:
+        itemsize = memoryview(memory.cells).itemsize
+    except TypeError:
+        itemsize = None
+    if compiler is None or itemsize not in CELL_TYPES or memory.resizable:
+        codegen.execute(program, memory, output, input, stats, max_steps, timeout)
+        return
+
+    output = open_output(output)
+    input = open_input(input)
+    budget = Budget(max_steps, timeout)
+    started = time.perf_counter()
+    library, cached = build(generate(program, itemsize, budget.limited), compiler)
+    if stats is not None:
+        stats['compile_time'] = time.perf_counter() - started
+        stats['cached'] = cached
+    errors = []
+
+    @WRITE
+    def write(value):
+        try:
+            output.write(value)
+            return 0
+        except BaseException as ex:
+            errors.append(ex)
+            return 1
+
+    @READ
+    def read(value):
+        try:
+            if output.flush_on_input:
+                output.flush()
+            new_value = input.read()
+            return value if new_value is None else new_value & memory.mask
+        except BaseException as ex:
+            errors.append(ex)
+            return -1
+
+    @CHECK_BUDGET
+    def check(steps):
+        try:
+            return budget.check(steps)
+        except BaseException as ex:
+            errors.append(ex)
+            return -1
+
+    cells = (CELL_TYPES[itemsize][1] * len(memory.cells)).from_buffer(memory.cells)
+    memory.ensure(0, 0)
+    position = (ctypes.c_int64 * 2)(memory.pointer, memory.extent)
+    counters = (ctypes.c_int64 * 2)(budget.steps, budget.limit)
+    try:
+        status = library.run(cells, len(memory.cells), position, write, read,
+                             check, counters)
+    finally:
+        del cells
+        memory.pointer, memory.extent = position
+        output.flush()
+        budget.steps = counters[0]
+        if stats is not None and budget.limited:
+            stats['steps'] = budget.steps
+    if status == OVERFLOW:
+        raise MemoryError('not enough memory')
+    if status == UNDERFLOW:
+        raise MemoryError('negative memory address')
+    if status == ABORTED:
+        raise errors[0]
+
+
+def find_compiler():
+    """Return path to the C compiler named by $CC or cc, if any."""
+    return shutil.which(os.environ.get('CC', 'cc'))
+
+
+def build(source, compiler):
+    """Return the shared library built from C source, compiling if needed.
+
+    Also return whether the library was found in the cache, which keeps
+    libraries up to MAX_CACHE_SIZE, evicting the least recently used ones.
+    """
+    directory = cache_directory()
+    digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+    path = os.path.join(directory, f'brainf-{digest}.so')
+    cached = os.path.exists(path)
+    if cached:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    else:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=directory) as temp:
+            source_path = os.path.join(temp, 'program.c')
+            library_path = os.path.join(temp, 'program.so')
+            with open(source_path, 'w') as file_object:
+                file_object.write(source)
+            subprocess.run([compiler, '-O2', '-shared', '-fPIC', '-o',
+                            library_path, source_path], check=True)
+            os.replace(library_path, path)
+    library = ctypes.CDLL(path)
+    if not cached:
+        evict(directory, MAX_CACHE_SIZE, 'brainf-*.so')
+    library.run.restype = ctypes.c_int
+    library.run.argtypes = [ctypes.c_void_p, ctypes.c_int64,
+                            ctypes.POINTER(ctypes.c_int64), WRITE, READ, CHECK_BUDGET,
+                            ctypes.POINTER(ctypes.c_int64)]
+    return library, cached
+
+
+def generate(program, itemsize=1, count_steps=False):
+    """Return C source code of a function running the program.
+
+    Given count_steps, loop iterations are counted and the budget is
+    consulted through a callback whenever the count reaches the limit.
+    """
+    lines = [HEADER.format(cell=CELL_TYPES[itemsize][0])]
+    depth = 1
+    for i, (opcode, offset, argument) in enumerate(program.ops):
+        if opcode == CLOSE:
+            depth -= 1
+        indent = '    ' * depth
+        if opcode == OPEN:
+            lines.append(f'{indent}while (cells[pointer]) {{')
+            depth += 1
+        elif opcode == CLOSE:
+            if count_steps:
+                lines.append(f'{indent}    if (++steps >= limit && (limit = check(steps)) < 0) '
+                             f'{{ steps--; goto aborted; }}')
+            lines.append(f'{indent}}}')
+        else:
+            lines.extend(indent + line for line in _generate_op(opcode, offset, argument, itemsize))
+    lines.append(FOOTER)
+    return '\n'.join(lines)
+
+
+def _generate_op(opcode, offset, argument, itemsize):
+    """Return lines of C code for a single operation."""
+    address = f'pointer + {offset}' if offset else 'pointer'
+    if opcode == ADD:
+        return [f'cells[{address}] += {argument};']
+    if opcode == MOVE:
+        return _check(argument, argument) + [f'pointer += {argument};']
+    if opcode == SET:
+        return [f'cells[{address}] = (cell){argument};']
+    if opcode == MUL:
+        return [
+            'if (cells[pointer]) {',
+            *('    ' + line for line in _check(offset, offset)),
+            # Unsigned, since cells narrower than int would be promoted to
+            # a signed int, which must not overflow
+            f'    cells[{address}] += (cell)((uint32_t)cells[pointer] * (uint32_t){argument});',
+            '}',
+        ]
+    if opcode == CHECK:
+        return _check(offset, argument)
+    if opcode == SCAN:
+        if argument == 1 and itemsize == 1:
+            return [
+                'if (cells[pointer]) {',
+                '    cell *zero = memchr(cells + pointer, 0, size - pointer);',
+                '    if (!zero) { pointer = size; goto overflow; }',
+                '    pointer = zero - cells;',
+                '    if (pointer >= extent) extent = extend(extent, pointer + 1, size);',
+                '}',
+            ]
+        return [
+            'while (cells[pointer]) {',
+            *('    ' + line for line in _check(argument, argument)),
+            f'    pointer += {argument};',
+            '}',
+        ]
+    if opcode == OUT:
+        return [f'if (write(cells[{address}])) goto aborted;']
+    if opcode == IN:
+        return [
+            f'value = read(cells[{address}]);',
+            'if (value < 0) goto aborted;',
+            f'cells[{address}] = (cell)value;',
+        ]
+    raise ValueError(f'unknown opcode: {opcode}')
+
+
+def _check(lowest, highest):
+    """Return lines jumping to an error if the offsets are out of range.
+
+    Offsets within range but past the extent extend it.
+    """
+    lines = []
+    if highest > 0:
+        lines.append(f'if (pointer + {highest} >= extent) {{')
+        lines.append(f'    if (pointer + {highest} >= size) goto overflow;')
+        lines.append(f'    extent = extend(extent, pointer + {highest + 1}, size);')
+        lines.append('}')
+    if lowest < 0:
+        lines.append(f'if (pointer + {lowest} < 0) goto underflow;')
+    return lines
@@ -0,0 +1,165 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import asyncio
+import unittest
+
+import brainf
+
+
+class Writer:
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    async def drain(self):
+        pass
+
+
+class TestRunAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+
+    def test_should_batch_output(self):
+
+        # given
+        code = brainf.SourceCode('++++++++++[>++++++<-]>+++++...')
+        writer = Writer()
+
+        # when
+        self.loop.run_until_complete(brainf.run_async(code, None, writer))
+
+        # then
+        self.assertEqual([b'AAA'], writer.chunks)
+
+    def test_should_read_input_until_eof(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode(',[.,]'))
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'abc')
+        reader.feed_eof()
+        writer = Writer()
+
+        # when
+        self.loop.run_until_complete(brainf.run_async(program, reader, writer, eof=0))
+
+        # then
+        self.assertEqual(b'abc', b''.join(writer.chunks))
+
+    def test_should_batch_output_while_input_is_buffered(self):
+
+        # given
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'abc')
+        reader.feed_eof()
+        writer = Writer()
+
+        # when
+        self.loop.run_until_complete(
+            brainf.run_async(brainf.SourceCode(',[.,]'), reader, writer, eof=0))
+
+        # then
+        self.assertEqual([b'abc'], writer.chunks)
+
+    def test_should_write_output_before_waiting_for_input(self):
+
+        # given
+        reader = asyncio.StreamReader()
+        writer = Writer()
+        memory = brainf.Memory()
+        task = self.loop.create_task(
+            brainf.run_async(brainf.SourceCode('+++.>,.'), reader, writer, memory))
+
+        # when
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+        # then
+        self.assertFalse(task.done())
+        self.assertEqual([b'\x03'], writer.chunks)
+
+        # when
+        reader.feed_data(b'x')
+        self.loop.run_until_complete(task)
+
+        # then
+        self.assertEqual([b'\x03', b'x'], writer.chunks)
+        self.assertEqual(1, memory.pointer)
+
+    def test_should_yield_to_other_sessions(self):
+
+        # given
+        spinning = self.loop.create_task(
+            brainf.run_async(brainf.SourceCode('+[]'), None, Writer(), interval=100))
+        writer = Writer()
+
+        # when
+        self.loop.run_until_complete(
+            brainf.run_async(brainf.SourceCode('+++.'), None, writer))
+
+        # then
+        self.assertEqual([b'\x03'], writer.chunks)
+        self.assertFalse(spinning.done())
+        spinning.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(spinning)
+
+    def test_should_write_output_when_yielding(self):
+
+        # given
+        writer = Writer()
+        stats = {}
+
+        # then
+        with self.assertRaises(brainf.LimitExceeded):
+            # when
+            self.loop.run_until_complete(brainf.run_async(
+                brainf.SourceCode('+[.]'), None, writer, stats=stats, max_steps=250,
+                interval=100))
+
+        # then
+        self.assertEqual([b'\x01' * 100, b'\x01' * 100, b'\x01' * 51], writer.chunks)
+        self.assertEqual(250, stats['steps'])
+
+    def test_should_grow_memory(self):
+
+        # given
+        memory = brainf.GrowableMemory(16)
+        writer = Writer()
+
+        # when
+        self.loop.run_until_complete(brainf.run_async(
+            brainf.SourceCode('<' * 20 + '+' + '>' * 40 + '++[-<+>]<.'), None, writer, memory))
+
+        # then
+        self.assertEqual([b'\x02'], writer.chunks)
+        self.assertGreaterEqual(memory.allocated, 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
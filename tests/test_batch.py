@@ -0,0 +1,185 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import os
+import tempfile
+
+import brainf.batch
+import brainf.limits
+import brainf.memory
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        patcher = patch.dict('os.environ', XDG_CACHE_HOME=temp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.directory = temp.name
+        for name, content in [('a.b', '++++++++[>++++++++<-]>+.'),
+                              ('cat.b', ',[.,]'),
+                              ('bad.b', '[[]'),
+                              ('loop.b', '+.[]'),
+                              ('input.txt', 'xyz')]:
+            with open(self.path(name), 'w') as file_object:
+                file_object.write(content)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+
+class TestReadManifest(TestBatch):
+
+    def test_should_read_jobs_relative_to_manifest(self):
+
+        # given
+        with open(self.path('manifest.txt'), 'w') as file_object:
+            file_object.write('cat.b input.txt\n\n# comment\na.b\n')
+
+        # when
+        jobs = brainf.batch.read_manifest(self.path('manifest.txt'))
+
+        # then
+        self.assertEqual([brainf.batch.Job(self.path('cat.b'), self.path('input.txt')),
+                          brainf.batch.Job(self.path('a.b'), None)], jobs)
+
+    def test_should_reject_too_many_fields(self):
+
+        # given
+        with open(self.path('manifest.txt'), 'w') as file_object:
+            file_object.write('cat.b input.txt extra\n')
+
+        # then
+        with self.assertRaises(ValueError):
+            # when
+            brainf.batch.read_manifest(self.path('manifest.txt'))
+
+
+class TestRunJob(TestBatch):
+
+    def test_should_capture_output(self):
+
+        # given
+        job = brainf.batch.Job(self.path('cat.b'), self.path('input.txt'))
+
+        # when
+        result = brainf.batch.run_job(7, job, eof=0)
+
+        # then
+        self.assertEqual(7, result['index'])
+        self.assertEqual(0, result['status'])
+        self.assertEqual('xyz', result['stdout'])
+        self.assertEqual('', result['stderr'])
+
+    def test_should_report_error(self):
+
+        # given
+        job = brainf.batch.Job(self.path('bad.b'), None)
+
+        # when
+        result = brainf.batch.run_job(0, job)
+
+        # then
+        self.assertEqual(1, result['status'])
+        self.assertEqual('SyntaxError: unbalanced brackets at position 0', result['stderr'])
+
+    def test_should_report_exceeded_limit(self):
+
+        # given
+        job = brainf.batch.Job(self.path('loop.b'), None)
+
+        # when
+        result = brainf.batch.run_job(0, job, max_steps=1000)
+
+        # then
+        self.assertEqual(brainf.limits.EXIT_STATUS, result['status'])
+        self.assertEqual('\x01', result['stdout'])
+        self.assertEqual('LimitExceeded: exceeded the limit of 1000 steps', result['stderr'])
+        self.assertEqual(1000, result['steps'])
+
+    def test_should_parse_shared_source_once(self):
+
+        # given
+        job = brainf.batch.Job(self.path('a.b'), None)
+        brainf.batch._programs.clear()
+        self.addCleanup(brainf.batch._programs.clear)
+
+        # when
+        with patch('brainf.cache.key', wraps=brainf.cache.key) as mock_key:
+            results = [brainf.batch.run_job(i, job) for i in range(3)]
+
+        # then
+        mock_key.assert_called_once()
+        self.assertEqual(1, len(brainf.batch._programs))
+        self.assertEqual(['A'] * 3, [result['stdout'] for result in results])
+
+    def test_should_close_tape(self):
+
+        # given
+        job = brainf.batch.Job(self.path('a.b'), None)
+        close = brainf.memory.MappedMemory.close
+
+        # when
+        with patch.object(brainf.memory.MappedMemory, 'close', autospec=True,
+                          side_effect=close) as mock_close:
+            result = brainf.batch.run_job(0, job, tape='mapped')
+
+        # then
+        mock_close.assert_called_once()
+        self.assertEqual('A', result['stdout'])
+
+
+class TestRun(TestBatch):
+
+    def test_should_run_jobs_in_order(self):
+
+        # given
+        jobs = [brainf.batch.Job(self.path(name), self.path('input.txt'))
+                for name in ('cat.b', 'bad.b', 'a.b') * 3]
+
+        # when
+        results = list(brainf.batch.run(jobs, max_workers=2, ordered=True, eof=0))
+
+        # then
+        self.assertEqual(list(range(9)), [result['index'] for result in results])
+        self.assertEqual(['xyz', '', 'A'] * 3, [result['stdout'] for result in results])
+        self.assertEqual([0, 1, 0] * 3, [result['status'] for result in results])
+
+    def test_should_run_jobs_in_completion_order(self):
+
+        # given
+        jobs = [brainf.batch.Job(self.path('a.b'), None)] * 4
+
+        # when
+        results = list(brainf.batch.run(jobs, max_workers=2))
+
+        # then
+        self.assertEqual(list(range(4)), sorted(result['index'] for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch, Mock
+
+import io
+import os
+import tempfile
+
+import brainf
+import brainf.bench
+
+
+class TestCorpus(unittest.TestCase):
+
+    def test_should_compile_every_benchmark(self):
+        for name, benchmark in brainf.bench.BENCHMARKS.items():
+            with self.subTest(name=name):
+
+                # when
+                program = brainf.Program(brainf.SourceCode.from_file(benchmark.path))
+
+                # then
+                self.assertEqual(name, benchmark.name)
+                self.assertGreater(len(program), 0)
+                self.assertIsInstance(benchmark.input(), bytes)
+
+    def test_should_run_rot13_filter(self):
+
+        # given
+        benchmark = brainf.bench.BENCHMARKS['rot13']
+        program = brainf.Program(brainf.SourceCode.from_file(benchmark.path))
+        output = io.BytesIO()
+
+        # when
+        brainf.execute(program, brainf.Memory(), output, io.BytesIO(b'Hello, World!\n'))
+
+        # then
+        self.assertEqual(b'Uryyb, Jbeyq!\n', output.getvalue())
+
+
+class TestAvailableEngines(unittest.TestCase):
+
+    @patch('brainf.transpiler.find_compiler', return_value=None)
+    @patch('brainf.jit.is_supported', return_value=False)
+    def test_should_skip_engines_which_fall_back(self, mock_is_supported, mock_find_compiler):
+
+        # when
+        engines = brainf.bench.available_engines()
+
+        # then
+        self.assertNotIn('c', engines)
+        self.assertNotIn('jit', engines)
+        self.assertIn('ir', engines)
+
+
+class TestMeasure(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        path = os.path.join(temp.name, 'echo.b')
+        with open(path, 'w') as file_object:
+            file_object.write(',[.[-],]')
+        self.benchmark = brainf.bench.Benchmark('echo', path, lambda: b'abc', 13)
+
+    def test_should_measure_trials(self):
+
+        # when
+        result = brainf.bench.measure(self.benchmark, 'ir', warmup=2, repeat=4)
+
+        # then
+        self.assertEqual('echo', result['benchmark'])
+        self.assertEqual('ir', result['engine'])
+        self.assertEqual(4, len(result['times']))
+        self.assertEqual(min(result['times']), result['best'])
+        self.assertAlmostEqual(13 / result['best'], result['instructions_per_second'])
+
+    def test_should_run_warmup_trials(self):
+
+        # when
+        with patch.dict('brainf.bench.ENGINES', ir=Mock()):
+            brainf.bench.measure(self.benchmark, 'ir', warmup=2, repeat=3)
+
+            # then
+            self.assertEqual(5, brainf.bench.ENGINES['ir'].call_count)
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_should_pair_matching_results(self):
+
+        # given
+        previous = {'results': [{'benchmark': 'a', 'engine': 'ir', 'best': 2.0},
+                                {'benchmark': 'b', 'engine': 'ir', 'best': 1.0}]}
+        current = {'results': [{'benchmark': 'a', 'engine': 'ir', 'best': 1.5},
+                               {'benchmark': 'a', 'engine': 'jit', 'best': 0.1}]}
+
+        # when
+        pairs = list(brainf.bench.compare(previous, current))
+
+        # then
+        self.assertEqual([('a', 'ir', 2.0, 1.5)], pairs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import os
+import tempfile
+
+import brainf
+import brainf.cache
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        patcher = patch.dict('os.environ', XDG_CACHE_HOME=temp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = os.path.join(temp.name, 'program.b')
+        with open(self.path, 'w') as file_object:
+            file_object.write('++[>+++[>+<-]<-] print 6\n[-]>>.')
+
+
+class TestLoad(TestCache):
+
+    def test_should_compile_program(self):
+
+        # given
+        stats = {}
+
+        # when
+        program = brainf.cache.load(self.path, stats=stats)
+
+        # then
+        expected = brainf.Program(brainf.SourceCode.from_file(self.path))
+        self.assertEqual(expected.ops, program.ops)
+        self.assertFalse(stats['program_cached'])
+
+    def test_should_reuse_cached_program(self):
+
+        # given
+        brainf.cache.load(self.path)
+        stats = {}
+
+        # when
+        with patch('brainf.Program.from_file') as mock_from_file:
+            program = brainf.cache.load(self.path, stats=stats)
+
+        # then
+        mock_from_file.assert_not_called()
+        expected = brainf.Program(brainf.SourceCode.from_file(self.path))
+        self.assertEqual(expected.ops, program.ops)
+        self.assertTrue(stats['program_cached'])
+
+    def test_should_key_by_optimization_level(self):
+
+        # when
+        optimized = brainf.cache.load(self.path)
+        unoptimized = brainf.cache.load(self.path, optimize=False)
+
+        # then
+        self.assertNotEqual(optimized.ops, unoptimized.ops)
+        self.assertEqual(2, len(os.listdir(brainf.cache.program_directory())))
+
+    def test_should_keep_programs_in_memory(self):
+
+        # given
+        programs = {}
+        program = brainf.cache.load(self.path, programs=programs)
+        stats = {}
+
+        # when
+        with patch('brainf.cache.read') as mock_read:
+            reused = brainf.cache.load(self.path, stats=stats, programs=programs)
+
+        # then
+        mock_read.assert_not_called()
+        self.assertIs(program, reused)
+        self.assertTrue(stats['program_cached'])
+
+    def test_should_reload_modified_program(self):
+
+        # given
+        programs = {}
+        program = brainf.cache.load(self.path, programs=programs)
+        with open(self.path, 'a') as file_object:
+            file_object.write('+')
+
+        # when
+        reloaded = brainf.cache.load(self.path, programs=programs)
+
+        # then
+        self.assertNotEqual(program.ops, reloaded.ops)
+        self.assertEqual(2, len(programs))
+
+    @patch('brainf.cache.MAX_PROGRAMS', 1)
+    def test_should_bound_programs_in_memory(self):
+
+        # given
+        programs = {}
+        other_path = os.path.join(os.path.dirname(self.path), 'other.b')
+        with open(other_path, 'w') as file_object:
+            file_object.write('+.')
+        brainf.cache.load(self.path, programs=programs)
+
+        # when
+        program = brainf.cache.load(other_path, programs=programs)
+
+        # then
+        self.assertEqual([program], list(programs.values()))
+
+    @patch('os.utime', side_effect=PermissionError)
+    def test_should_reuse_program_from_read_only_cache(self, _):
+
+        # given
+        brainf.cache.load(self.path)
+        stats = {}
+
+        # when
+        brainf.cache.load(self.path, stats=stats)
+
+        # then
+        self.assertTrue(stats['program_cached'])
+
+    def test_should_recompile_invalid_program(self):
+
+        # given
+        brainf.cache.load(self.path)
+        [name] = os.listdir(brainf.cache.program_directory())
+        with open(os.path.join(brainf.cache.program_directory(), name), 'wb') as file_object:
+            file_object.write(b'garbage')
+
+        # when
+        program = brainf.cache.load(self.path)
+
+        # then
+        expected = brainf.Program(brainf.SourceCode.from_file(self.path))
+        self.assertEqual(expected.ops, program.ops)
+
+    def test_should_raise_syntax_error(self):
+
+        # given
+        with open(self.path, 'w') as file_object:
+            file_object.write('[[]')
+
+        # then
+        with self.assertRaises(SyntaxError):
+            # when
+            brainf.cache.load(self.path)
+
+    @patch('brainf.cache.write', side_effect=PermissionError)
+    def test_should_ignore_unwritable_cache(self, mock_write):
+
+        # when
+        program = brainf.cache.load(self.path)
+
+        # then
+        mock_write.assert_called_once()
+        self.assertEqual(12, len(program))
+
+
+class TestSerialization(unittest.TestCase):
+
+    def test_should_round_trip_program(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[->>+++<<]>[>]<[-]-.,[.,]'))
+
+        # when
+        data = brainf.cache.dumps(program)
+
+        # then
+        self.assertEqual(program.ops, brainf.cache.loads(data).ops)
+        self.assertEqual(program.positions, brainf.cache.loads(data).positions)
+
+    def test_should_reject_truncated_data(self):
+
+        # given
+        data = brainf.cache.dumps(brainf.Program(brainf.SourceCode('+[-]')))
+
+        # then
+        with self.assertRaises(ValueError):
+            # when
+            brainf.cache.loads(data[:-1])
+
+
+class TestEvict(TestCache):
+
+    def test_should_remove_least_recently_used_programs(self):
+
+        # given
+        directory = brainf.cache.program_directory()
+        os.makedirs(directory)
+        for i, name in enumerate(['a', 'b', 'c']):
+            path = os.path.join(directory, f'{name}.bfc')
+            with open(path, 'wb') as file_object:
+                file_object.write(bytes(100))
+            os.utime(path, (i, i))
+
+        # when
+        brainf.cache.evict(directory, max_size=250)
+
+        # then
+        self.assertEqual(['b.bfc', 'c.bfc'], sorted(os.listdir(directory)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,10 @@
 import unittest
 from unittest.mock import patch, mock_open
 
+import os
+import tempfile
+import threading
+
 import brainf.code
 
 
@@ -33,6 +37,64 @@ class TestNormalize(unittest.TestCase):
         self.assertEqual('].<[-,>+', brainf.code.normalize(plain_text))
 
 
+class TestReadInstructions(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.path = os.path.join(temp.name, 'program.b')
+
+    def test_should_filter_instructions_of_mapped_file(self):
+
+        # given
+        with open(self.path, 'w', encoding='utf-8') as file_object:
+            file_object.write('zażółć +[\n>.<-] gęślą, jaźń')
+
+        # when
+        chunks = list(brainf.code.read_instructions(self.path, chunk_size=4))
+
+        # then
+        self.assertEqual('+[>.<-],', ''.join(chunks))
+        self.assertGreater(len(chunks), 1)
+
+    def test_should_read_empty_file(self):
+
+        # given
+        open(self.path, 'w').close()
+
+        # when
+        chunks = list(brainf.code.read_instructions(self.path))
+
+        # then
+        self.assertEqual([], chunks)
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'requires named pipes')
+    def test_should_read_pipe_in_chunks(self):
+
+        # given
+        os.mkfifo(self.path)
+
+        def write():
+            with open(self.path, 'w') as file_object:
+                file_object.write('a+b-c' * 1000)
+        writer = threading.Thread(target=write)
+        writer.start()
+
+        # when
+        chunks = list(brainf.code.read_instructions(self.path, chunk_size=1024))
+        writer.join()
+
+        # then
+        self.assertEqual('+-' * 1000, ''.join(chunks))
+
+
+class TestLocate(unittest.TestCase):
+
+    def test_should_return_line_and_column_of_instructions(self):
+        self.assertEqual([(1, 4), (2, 1), (2, 3), (4, 2)],
+                         brainf.code.locate('ab +\n[ ]\n\n\t.'))
+
+
 class TestParse(unittest.TestCase):
 
     def test_should_return_bidirectional_map_of_loop_jumps(self):
@@ -64,16 +126,43 @@ class TestParse(unittest.TestCase):
         with self.assertRaises(SyntaxError):
             brainf.code.parse(']')
 
-    @unittest.skip("Not yet implemented")  # TODO
     def test_should_raise_syntax_error_on_missing_closing_bracket(self):
         with self.assertRaises(SyntaxError):
             brainf.code.parse('[')
 
-    @unittest.skip("Not yet implemented")  # TODO
     def test_should_raise_syntax_error_on_incorrectly_nested_brackets(self):
-        with self.assertRaises(SyntaxError):
+        with self.assertRaisesRegex(SyntaxError, 'position 0$'):
             brainf.code.parse('[[[]')
 
+    @patch('brainf.code.numpy', None)
+    def test_should_parse_long_instructions_without_numpy(self):
+        instructions = '+[-]' * brainf.code.VECTORIZE_THRESHOLD
+        self.assertEqual(2 * brainf.code.VECTORIZE_THRESHOLD, len(brainf.code.parse(instructions)))
+
+
+@unittest.skipIf(brainf.code.numpy is None, 'requires NumPy')
+class TestParseVectorized(unittest.TestCase):
+
+    def test_should_return_same_jumps_as_parse(self):
+        instructions = '+++[>++++[>++>+++>+++>+<<<<-]>+>+>->>+[<]<-]>>.' * 100 + '[[][[]]]'
+        with patch('brainf.code.numpy', None):
+            expected = brainf.code.parse(instructions)
+        self.assertDictEqual(expected, brainf.code.parse_vectorized(instructions))
+
+    def test_should_return_no_jumps_without_brackets(self):
+        self.assertDictEqual({}, brainf.code.parse_vectorized('+-.,<>'))
+        self.assertDictEqual({}, brainf.code.parse_vectorized(''))
+
+    def test_should_report_same_position_as_parse(self):
+        for instructions in ('+]', '[]][', '[[[]', '+[]+[+[]', '[[]]]]'):
+            with self.subTest(instructions=instructions):
+                with patch('brainf.code.numpy', None):
+                    with self.assertRaises(SyntaxError) as expected:
+                        brainf.code.parse(instructions)
+                with self.assertRaises(SyntaxError) as actual:
+                    brainf.code.parse_vectorized(instructions)
+                self.assertEqual(str(expected.exception), str(actual.exception))
+
 
 class TestSourceCode(unittest.TestCase):
 
@@ -0,0 +1,141 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+
+import io
+
+import brainf
+import brainf.codegen
+
+
+class TestGenerate(unittest.TestCase):
+
+    def test_should_generate_loops_as_while_statements(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[>+<-.]'), optimize=False)
+
+        # when
+        source = brainf.codegen.generate(program)
+
+        # then
+        self.assertIn('    while cells[pointer]:\n', source)
+        self.assertIn('        write(cells[pointer])\n', source)
+
+    def test_should_address_cells_by_offset(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('>+>++'))
+
+        # when
+        source = brainf.codegen.generate(program)
+
+        # then
+        self.assertIn('cells[pointer - 1] = (cells[pointer - 1] + 1) & mask', source)
+
+    def test_should_generate_empty_loop(self):
+        program = brainf.Program(brainf.SourceCode('[]'))
+        self.assertIn('pass', brainf.codegen.generate(program))
+
+    def test_should_count_steps_at_the_end_of_loops(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[.-]'))
+
+        # when
+        source = brainf.codegen.generate(program, count_steps=True)
+
+        # then
+        self.assertIn('        steps += 1\n'
+                      '        if steps >= limit:\n'
+                      '            limit = budget.check(steps)\n'
+                      '    budget.steps = steps\n', source)
+
+    def test_should_move_deeply_nested_loops_to_functions(self):
+
+        # given
+        depth = brainf.codegen.MAX_DEPTH * 3
+        program = brainf.Program(brainf.SourceCode('[>' * depth + ']' * depth))
+
+        # when
+        source = brainf.codegen.generate(program)
+
+        # then
+        self.assertEqual(2, source.count('def loop'))
+        compile(source, '<test>', 'exec')
+
+
+class TestExecute(unittest.TestCase):
+
+    def test_should_execute_program(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('++++++++++[>++++++<-]>+++++.,[>+<-]'))
+        memory = brainf.Memory()
+        output = io.BytesIO()
+
+        # when
+        brainf.codegen.execute(program, memory, output, io.BytesIO(b'z'))
+
+        # then
+        self.assertEqual(b'A', output.getvalue())
+        self.assertEqual(1, memory.pointer)
+        self.assertEqual([0, 0, 122], list(memory.cells[:3]))
+
+    def test_should_execute_deeply_nested_loops(self):
+
+        # given
+        depth = brainf.codegen.MAX_DEPTH * 2
+        program = brainf.Program(brainf.SourceCode('+' + '[>+' * depth + '[-]' + '<-]' * depth))
+        memory = brainf.Memory()
+
+        # when
+        brainf.codegen.execute(program, memory, io.BytesIO())
+
+        # then
+        self.assertEqual(0, memory.pointer)
+        self.assertEqual(0, sum(memory.cells))
+
+    def test_should_raise_memory_error_on_underflow(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[<-]'))
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'negative memory address'):
+            # when
+            brainf.codegen.execute(program, brainf.Memory(), io.BytesIO())
+
+    def test_should_raise_memory_error_on_overflow(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[>+]'))
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'not enough memory'):
+            # when
+            brainf.codegen.execute(program, brainf.Memory(8), io.BytesIO())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,366 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+
+import array
+import os
+import pickle
+import tempfile
+
+import brainf
+import brainf.compiler
+from brainf.compiler import ADD, MOVE, OUT, IN, OPEN, CLOSE, SET, MUL, SCAN, CHECK
+
+
+class TestLower(unittest.TestCase):
+
+    def test_should_fold_runs_of_arithmetic(self):
+        self.assertListEqual([(ADD, 0, 3)], brainf.compiler.lower('+++'))
+        self.assertListEqual([(ADD, 0, -2)], brainf.compiler.lower('--'))
+
+    def test_should_fold_runs_of_moves(self):
+        self.assertListEqual([(MOVE, 0, 4)], brainf.compiler.lower('>>>>'))
+        self.assertListEqual([(MOVE, 0, -1)], brainf.compiler.lower('<'))
+
+    def test_should_merge_mixed_arithmetic_into_net_value(self):
+        self.assertListEqual([(ADD, 0, 1), (MOVE, 0, -2)], brainf.compiler.lower('++-+--+<<'))
+
+    def test_should_drop_arithmetic_which_cancels_out(self):
+        self.assertListEqual([(MOVE, 0, 1)], brainf.compiler.lower('+-+->'))
+
+    def test_should_keep_opposite_moves_apart(self):
+        self.assertListEqual([(MOVE, 0, 2), (MOVE, 0, -1)], brainf.compiler.lower('>><'))
+
+    def test_should_not_fold_other_instructions(self):
+        self.assertListEqual(
+            [(OUT, 0, 0), (OUT, 0, 0), (IN, 0, 0), (OPEN, 0, 0), (OPEN, 0, 0), (CLOSE, 0, 0), (CLOSE, 0, 0)],
+            brainf.compiler.lower('..,[[]]'))
+
+
+class TestLowerChunks(unittest.TestCase):
+
+    def test_should_join_runs_spanning_chunks(self):
+        instructions = '++-[>>><<<-]++--.>>[-]<<+'
+        expected = brainf.compiler.tag_brackets(brainf.compiler.lower(instructions), instructions)
+        for size in range(1, len(instructions) + 1):
+            with self.subTest(size=size):
+                chunks = [instructions[i:i + size] for i in range(0, len(instructions), size)]
+                self.assertListEqual(expected, brainf.compiler.lower_chunks(chunks))
+
+    def test_should_keep_moves_apart_across_cancelled_adds(self):
+        for chunks in (['[>', '+', '-', '>['], ['[>+', '->]'], ['>', '+-', '', '>']):
+            with self.subTest(chunks=chunks):
+                instructions = ''.join(chunks)
+                expected = brainf.compiler.tag_brackets(brainf.compiler.lower(instructions),
+                                                        instructions)
+                self.assertListEqual(expected, brainf.compiler.lower_chunks(chunks))
+
+
+class TestFoldLoops(unittest.TestCase):
+
+    def test_should_replace_clear_loop(self):
+        for instructions in ('[-]', '[+]'):
+            with self.subTest(instructions=instructions):
+                ops = brainf.compiler.lower(instructions)
+                self.assertListEqual([(SET, 0, 0)], brainf.compiler.fold_loops(ops))
+
+    def test_should_replace_copy_loop(self):
+        ops = brainf.compiler.lower('[->+<]')
+        self.assertListEqual(
+            [(MUL, 1, 1), (SET, 0, 0)],
+            brainf.compiler.fold_loops(ops))
+
+    def test_should_replace_multiply_loop(self):
+        ops = brainf.compiler.lower('[->++>+++<<]')
+        self.assertListEqual(
+            [(MUL, 1, 2), (MUL, 2, 3), (SET, 0, 0)],
+            brainf.compiler.fold_loops(ops))
+
+    def test_should_negate_factors_of_loop_counting_upwards(self):
+        ops = brainf.compiler.lower('[<-->+]')
+        self.assertListEqual(
+            [(MUL, -1, 2), (SET, 0, 0)],
+            brainf.compiler.fold_loops(ops))
+
+    def test_should_replace_scan_loop(self):
+        for instructions, stride in (('[>]', 1), ('[<]', -1), ('[>>>]', 3), ('[<<]', -2)):
+            with self.subTest(instructions=instructions):
+                ops = brainf.compiler.lower(instructions)
+                self.assertListEqual([(SCAN, 0, stride)], brainf.compiler.fold_loops(ops))
+
+    def test_should_replace_innermost_loops_only(self):
+        ops = brainf.compiler.lower('+[>[-]<-]')
+        self.assertListEqual([
+            (ADD, 0, 1),
+            (OPEN, 0, 0),
+            (MOVE, 0, 1),
+            (SET, 0, 0),
+            (MOVE, 0, -1),
+            (ADD, 0, -1),
+            (CLOSE, 0, 0),
+        ], brainf.compiler.fold_loops(ops))
+
+    def test_should_keep_loops_which_cannot_be_replaced(self):
+        for instructions in ('[]', '[><]', '[-.]', '[,-]', '[-->+<]', '[->+]', '[>+<]', '[->>+<<<>]'):
+            with self.subTest(instructions=instructions):
+                ops = brainf.compiler.lower(instructions)
+                self.assertListEqual(ops, brainf.compiler.fold_loops(ops))
+
+
+class TestDeferMoves(unittest.TestCase):
+
+    def test_should_address_cells_relative_to_final_pointer(self):
+        ops = brainf.compiler.lower('>+>++.')
+        self.assertListEqual([
+            (MOVE, 0, 2),
+            (ADD, -1, 1),
+            (ADD, 0, 2),
+            (OUT, 0, 0),
+        ], brainf.compiler.defer_moves(ops))
+
+    def test_should_check_range_of_block_without_net_movement(self):
+        ops = brainf.compiler.lower('>+>++<<-')
+        self.assertListEqual([
+            (CHECK, 0, 2),
+            (ADD, 1, 1),
+            (ADD, 2, 2),
+            (ADD, 0, -1),
+        ], brainf.compiler.defer_moves(ops))
+
+    def test_should_check_range_of_block_beyond_final_pointer(self):
+        ops = brainf.compiler.lower('<<+>>>+<<,')
+        self.assertListEqual([
+            (CHECK, -2, 1),
+            (MOVE, 0, -1),
+            (ADD, -1, 1),
+            (ADD, 2, 1),
+            (IN, 0, 0),
+        ], brainf.compiler.defer_moves(ops))
+
+    def test_should_end_block_at_io(self):
+        ops = brainf.compiler.lower('>+.>>>,<')
+        self.assertListEqual([
+            (MOVE, 0, 1),
+            (ADD, 0, 1),
+            (OUT, 0, 0),
+            (MOVE, 0, 3),
+            (IN, 0, 0),
+            (MOVE, 0, -1),
+        ], brainf.compiler.defer_moves(ops))
+
+    def test_should_merge_arithmetic_on_the_same_cell(self):
+        ops = brainf.compiler.lower('+>+<+>-<+')
+        self.assertListEqual([
+            (CHECK, 0, 1),
+            (ADD, 0, 3),
+        ], brainf.compiler.defer_moves(ops))
+
+    def test_should_not_merge_arithmetic_across_io(self):
+        ops = brainf.compiler.lower('+.+,+')
+        self.assertListEqual([
+            (ADD, 0, 1),
+            (OUT, 0, 0),
+            (ADD, 0, 1),
+            (IN, 0, 0),
+            (ADD, 0, 1),
+        ], brainf.compiler.defer_moves(ops))
+
+    def test_should_merge_arithmetic_into_preceding_set(self):
+        ops = [(SET, 0, 0), (ADD, 0, 5)]
+        self.assertListEqual([(SET, 0, 5)], brainf.compiler.defer_moves(ops))
+
+    def test_should_check_range_of_moves_without_access(self):
+        ops = brainf.compiler.lower('>>><<')
+        self.assertListEqual([
+            (CHECK, 0, 3),
+            (MOVE, 0, 1),
+        ], brainf.compiler.defer_moves(ops))
+
+    def test_should_flush_pointer_before_loops(self):
+        ops = brainf.compiler.lower('>>[<]>')
+        self.assertListEqual([
+            (MOVE, 0, 2),
+            (OPEN, 0, 0),
+            (MOVE, 0, -1),
+            (CLOSE, 0, 0),
+            (MOVE, 0, 1),
+        ], brainf.compiler.defer_moves(ops))
+
+
+class TestLink(unittest.TestCase):
+
+    def test_should_resolve_bracket_targets(self):
+
+        # given
+        ops = brainf.compiler.lower('+[>[-]<-]')
+
+        # when
+        linked = brainf.compiler.link(ops)
+
+        # then
+        self.assertListEqual([
+            (ADD, 0, 1),
+            (OPEN, 0, 8),
+            (MOVE, 0, 1),
+            (OPEN, 0, 5),
+            (ADD, 0, -1),
+            (CLOSE, 0, 3),
+            (MOVE, 0, -1),
+            (ADD, 0, -1),
+            (CLOSE, 0, 1),
+        ], linked)
+
+    def test_should_raise_syntax_error_on_missing_opening_bracket(self):
+        with self.assertRaisesRegex(SyntaxError, 'at position 7$'):
+            brainf.compiler.link([(CLOSE, 0, 7)])
+
+    def test_should_raise_syntax_error_on_missing_closing_bracket(self):
+        with self.assertRaisesRegex(SyntaxError, 'at position 3$'):
+            brainf.compiler.link([(OPEN, 0, 3), (OPEN, 0, 5), (CLOSE, 0, 6)])
+
+
+class TestLocate(unittest.TestCase):
+
+    def test_should_map_ops_to_source_instructions(self):
+
+        # given
+        instructions = '+[>[-]<-]>.'
+        ops = brainf.compiler.tag_brackets(brainf.compiler.lower(instructions), instructions)
+
+        # when
+        positions = brainf.compiler.locate(brainf.compiler.fold_loops(ops))
+
+        # then
+        self.assertListEqual([0, 1, 2, 2, 2, 2, 8, 9, 9], positions)
+
+
+class TestProgram(unittest.TestCase):
+
+    def test_should_lower_source_code(self):
+
+        # given
+        code = brainf.SourceCode('foo: ++++[>+++<-]>++.')
+
+        # when
+        program = brainf.Program(code, optimize=False)
+
+        # then
+        self.assertEqual(10, len(program))
+        self.assertEqual((OPEN, 0, 6), program[1])
+
+    def test_should_optimize_by_default(self):
+
+        # given
+        code = brainf.SourceCode('foo: ++++[>+++<-]>++.')
+
+        # when
+        program = brainf.Program(code)
+
+        # then
+        self.assertListEqual([
+            (ADD, 0, 4),
+            (MUL, 1, 3),
+            (MOVE, 0, 1),
+            (SET, -1, 0),
+            (ADD, 0, 2),
+            (OUT, 0, 0),
+        ], program.ops)
+
+    def test_should_compile_file(self):
+
+        # given
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        path = os.path.join(temp.name, 'program.b')
+        with open(path, 'w') as file_object:
+            file_object.write('print 6\n++[>+++[>+<-]<-]>>.')
+
+        # when
+        program = brainf.Program.from_file(path)
+
+        # then
+        expected = brainf.Program(brainf.SourceCode.from_file(path))
+        self.assertListEqual(expected.ops, program.ops)
+        self.assertEqual(expected.positions, program.positions)
+
+    def test_should_report_unbalanced_bracket_in_file(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        path = os.path.join(temp.name, 'program.b')
+        for source in ('+[[-]>]]', '[[-]', '>[<[-]'):
+            with self.subTest(source=source):
+
+                # given
+                with open(path, 'w') as file_object:
+                    file_object.write(source)
+                with self.assertRaises(SyntaxError) as expected:
+                    brainf.code.parse(source)
+
+                # then
+                with self.assertRaisesRegex(SyntaxError, f'^{expected.exception}$'):
+                    # when
+                    brainf.Program.from_file(path)
+
+    def test_should_store_ops_in_parallel_arrays(self):
+
+        # given
+        code = brainf.SourceCode('+[>[-]<-]>.')
+
+        # when
+        program = brainf.Program(code)
+
+        # then
+        self.assertEqual(array.array('B', [ADD, OPEN, CHECK, SET, ADD, CLOSE, MOVE, OUT]),
+                         program.opcodes)
+        self.assertEqual((OPEN, 0, 5), program[1])
+        self.assertEqual(5, program.arguments[1])
+        self.assertFalse(hasattr(program, '__dict__'))
+
+    def test_should_pickle_program(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[>[-]<-]>.'))
+
+        # when
+        unpickled = pickle.loads(pickle.dumps(program))
+
+        # then
+        self.assertListEqual(program.ops, unpickled.ops)
+        self.assertEqual(program.positions, unpickled.positions)
+
+    def test_should_map_optimized_ops_to_source_instructions(self):
+
+        # given
+        code = brainf.SourceCode('+[>[-]<-]>.')
+
+        # when
+        program = brainf.Program(code)
+
+        # then
+        self.assertEqual(len(program), len(program.positions))
+        self.assertEqual(1, program.positions[1])
+        self.assertEqual(8, program.positions[program[1][2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,44 +21,145 @@
 # THE SOFTWARE.
 
 import unittest
-from unittest.mock import patch, mock_open, PropertyMock
+from unittest.mock import patch, mock_open, Mock, PropertyMock
 
 import io
+import tempfile
 
 import brainf
 import brainf.interpreter
+import brainf.profiler
+import brainf.streams
 
 
 @patch('builtins.open', mock_open())
 class TestRun(unittest.TestCase):
 
-    @patch('brainf.interpreter.interpret')
-    def test_should_create_default_memory(self, mock_interpret):
+    def setUp(self):
+        patcher = patch('brainf.cache.load', return_value=brainf.Program(brainf.SourceCode('')))
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    def test_should_create_default_memory(self):
 
         # when
         brainf.interpreter.run('/fake/path/to/file.b')
 
         # then
-        (code, memory), kwargs = mock_interpret.call_args
+        (program, memory, output, input, stats), kwargs = brainf.interpreter.ENGINES['ir'].call_args
         self.assertEqual(65536, len(memory.cells))
 
-    @patch('brainf.SourceCode.from_file')
-    def test_should_load_source_code_from_file(self, mock_from_file):
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    @patch('brainf.Program.from_file')
+    def test_should_compile_program_from_file(self, mock_from_file):
 
         # when
-        brainf.interpreter.run('/fake/path/to/file.b')
+        brainf.interpreter.run('/fake/path/to/file.b', use_cache=False)
 
         # then
         mock_from_file.assert_called_once_with('/fake/path/to/file.b')
+        self.mock_load.assert_not_called()
 
-    @patch('brainf.interpreter.interpret')
-    def test_should_run_interpreter(self, mock_interpret):
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    def test_should_load_program_from_cache(self):
+
+        # when
+        brainf.interpreter.run('/fake/path/to/file.b')
+
+        # then
+        self.mock_load.assert_called_once_with('/fake/path/to/file.b', stats=None,
+                                               programs=None)
+        (program, *_), kwargs = brainf.interpreter.ENGINES['ir'].call_args
+        self.assertIs(self.mock_load.return_value, program)
+
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    def test_should_run_compiled_program(self):
 
         # when
         brainf.interpreter.run('/fake/path/to/file.b')
 
         # then
-        mock_interpret.assert_called_once()
+        brainf.interpreter.ENGINES['ir'].assert_called_once()
+
+    @patch.dict('brainf.interpreter.ENGINES', python=Mock())
+    def test_should_run_selected_engine(self):
+
+        # when
+        brainf.interpreter.run('/fake/path/to/file.b', engine='python')
+
+        # then
+        brainf.interpreter.ENGINES['python'].assert_called_once()
+
+    @patch.dict('brainf.interpreter.ENGINES', tiered=Mock())
+    def test_should_pass_options_to_engine(self):
+
+        # when
+        brainf.interpreter.run('/fake/path/to/file.b', engine='tiered', threshold=5)
+
+        # then
+        args, kwargs = brainf.interpreter.ENGINES['tiered'].call_args
+        self.assertEqual({'threshold': 5}, kwargs)
+
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    @patch('brainf.interpreter.interpret')
+    @patch('brainf.SourceCode.from_file')
+    def test_should_interpret_source_code_when_profiling(self, mock_from_file, mock_interpret):
+
+        # given
+        profile = brainf.profiler.Profile()
+
+        # when
+        brainf.interpreter.run('/fake/path/to/file.b', profile=profile)
+
+        # then
+        brainf.interpreter.ENGINES['ir'].assert_not_called()
+        (code, memory, output, input, actual_profile), _ = mock_interpret.call_args
+        self.assertIs(mock_from_file.return_value, code)
+        self.assertIs(profile, actual_profile)
+
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    def test_should_sample_engine(self):
+
+        # given
+        sampler = Mock()
+
+        # when
+        brainf.interpreter.run('/fake/path/to/file.b', sampler=sampler)
+
+        # then
+        sampler.start.assert_called_once_with(self.mock_load.return_value)
+        sampler.stop.assert_called_once_with()
+
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    def test_should_record_stats(self):
+
+        # given
+        stats = {}
+
+        # when
+        brainf.interpreter.run('/fake/path/to/file.b', stats=stats)
+
+        # then
+        self.assertEqual('ir', stats['engine'])
+        self.assertEqual(0, stats['ops'])
+        self.assertIn('time', stats)
+        self.assertEqual(65536, stats['capacity'])
+        self.assertEqual(16, stats['high_water_mark'])
+
+    @patch.dict('brainf.interpreter.ENGINES', ir=Mock())
+    def test_should_run_on_selected_tape(self):
+
+        # given
+        stats = {}
+
+        # when
+        brainf.interpreter.run('/fake/path/to/file.b', stats=stats, tape='growable')
+
+        # then
+        (program, memory, *_), _ = brainf.interpreter.ENGINES['ir'].call_args
+        self.assertIsInstance(memory, brainf.GrowableMemory)
+        self.assertEqual(16, stats['capacity'])
 
 
 class TestInterpret(unittest.TestCase):
@@ -78,33 +179,247 @@ class TestInterpret(unittest.TestCase):
         self.assertEqual(1, memory.pointer)
         self.assertEqual(65, memory.cells[1])
 
+    def test_should_count_instructions_in_profile(self):
+
+        # given
+        code = brainf.SourceCode('++[-]')
+        profile = brainf.profiler.Profile()
+
+        # when
+        brainf.interpret(code, brainf.Memory(), io.BytesIO(), io.BytesIO(), profile)
+
+        # then
+        self.assertIs(code, profile.code)
+        self.assertEqual([1, 1, 3, 2, 2], profile.counts)
+
+    def test_should_write_output_to_binary_sink(self):
+
+        # given
+        code = brainf.SourceCode('-.+++++++++++.')
+        sink = io.BytesIO()
+
+        # when
+        brainf.interpret(code, brainf.Memory(), sink)
+
+        # then
+        self.assertEqual(b'\xff\n', sink.getvalue())
+
+
+class TestExecute(unittest.TestCase):
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_should_execute_program(self, mock_stdout):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('++++++++++[>++++++<-]>+++++.'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.execute(program, memory)
+
+        # then
+        self.assertEqual('A', mock_stdout.getvalue())
+        self.assertEqual(1, memory.pointer)
+        self.assertEqual(65, memory.cells[1])
+
+    def test_should_write_output_to_binary_sink(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('-.+++++++++++.'))
+        sink = io.BytesIO()
+
+        # when
+        brainf.execute(program, brainf.Memory(), sink)
+
+        # then
+        self.assertEqual(b'\xff\n', sink.getvalue())
+
+    def test_should_read_input_from_binary_source(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode(',>,>,'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.execute(program, memory, io.BytesIO(), io.BytesIO(b'ab'))
+
+        # then
+        self.assertEqual([97, 98, 0], list(memory.cells[:3]))
+
+    def test_should_flush_output_before_reading_input(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+.,'))
+        output = brainf.streams.Output(io.BytesIO())
+        source = Mock(read1=Mock(side_effect=lambda size: output.sink.getvalue()))
+
+        # when
+        brainf.execute(program, brainf.Memory(), output, source)
+
+        # then
+        source.read1.assert_called_once()
+        self.assertEqual(b'\x01', output.sink.getvalue())
+
+    def test_should_skip_loop_when_cell_is_zero(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('[>+++<-]>>++'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.execute(program, memory)
+
+        # then
+        self.assertEqual(2, memory.pointer)
+        self.assertEqual([0, 0, 2], list(memory.cells[:3]))
+
+    def test_should_raise_memory_error_on_underflow(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('>><<<'))
+        memory = brainf.Memory()
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'negative memory address'):
+            # when
+            brainf.execute(program, memory)
+
+    def test_should_execute_multiply_loop(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+++++[->++>+++<<]'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.execute(program, memory)
+
+        # then
+        self.assertEqual([0, 10, 15], list(memory.cells[:3]))
+
+    def test_should_wrap_around_cell_values(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('->+[->+++<]>[->++<]'))
+        memory = brainf.Memory(cell_bits=16)
+
+        # when
+        brainf.execute(program, memory)
+
+        # then
+        self.assertEqual([65535, 0, 0, 6], list(memory.cells[:4]))
+
+    def test_should_not_touch_memory_in_skipped_multiply_loop(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('[-<+>]'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.execute(program, memory)
+
+        # then
+        self.assertEqual(0, memory.cells[-1])
+
+    def test_should_raise_memory_error_in_multiply_loop(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[-<+>]'))
+        memory = brainf.Memory()
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'negative memory address'):
+            # when
+            brainf.execute(program, memory)
+
+    def test_should_execute_scan_loop(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('>+>+>+>+<<<[>]'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.execute(program, memory)
+
+        # then
+        self.assertEqual(5, memory.pointer)
+
+    def test_should_raise_memory_error_when_block_reaches_beyond_tape(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('>>+<<<+>'))
+        memory = brainf.Memory()
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'negative memory address'):
+            # when
+            brainf.execute(program, memory)
+
+        self.assertEqual(0, memory.cells[-1])
+
+    def test_should_print_output_before_running_out_of_memory(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        code = brainf.SourceCode('+.>+.>+.>+.')
+        program = brainf.Program(code)
+        reference = io.BytesIO()
+        with self.assertRaises(MemoryError):
+            brainf.interpret(code, brainf.Memory(3), reference)
+        for name, engine in brainf.interpreter.ENGINES.items():
+            with self.subTest(engine=name), \
+                    patch.dict('os.environ', XDG_CACHE_HOME=temp.name):
+
+                # given
+                output = io.BytesIO()
+
+                # then
+                with self.assertRaises(MemoryError):
+                    # when
+                    engine(program, brainf.Memory(3), output)
+
+                self.assertEqual(reference.getvalue(), output.getvalue())
+
+    def test_should_raise_memory_error_on_overflow(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('>>>>'))
+        memory = brainf.Memory(4)
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'not enough memory'):
+            # when
+            brainf.execute(program, memory)
+
 
-@patch('sys.stdout', new_callable=io.StringIO)
 class TestPutChar(unittest.TestCase):
 
-    def test_should_print_regular_character(self, mock_stdout):
+    def setUp(self):
+        self.output = brainf.streams.Output(io.BytesIO())
+
+    def test_should_write_regular_character(self):
 
         # given
         memory = brainf.Memory()
         memory.cell = 65
 
         # when
-        brainf.interpreter.put_char(memory)
+        brainf.interpreter.put_char(memory, self.output)
+        self.output.flush()
 
         # then
-        self.assertEqual('A', mock_stdout.getvalue())
+        self.assertEqual(b'A', self.output.sink.getvalue())
 
-    def test_should_print_newline(self, mock_stdout):
+    def test_should_write_newline(self):
 
         # given
         memory = brainf.Memory()
         memory.cell = 10
 
         # when
-        brainf.interpreter.put_char(memory)
+        brainf.interpreter.put_char(memory, self.output)
+        self.output.flush()
 
         # then
-        self.assertEqual('\n', mock_stdout.getvalue())
+        self.assertEqual(b'\n', self.output.sink.getvalue())
 
 
 class TestGetChar(unittest.TestCase):
@@ -112,53 +427,59 @@ class TestGetChar(unittest.TestCase):
     def setUp(self):
         self.memory = brainf.Memory()
 
-    @patch('sys.stdin.buffer.read', return_value='')
-    def test_should_do_nothing_on_end_of_file(self, _):
+    def test_should_do_nothing_on_end_of_file(self):
 
         # given
         self.memory.cell = 127
 
         # when
-        brainf.interpreter.get_char(self.memory)
+        brainf.interpreter.get_char(self.memory, brainf.streams.Input(io.BytesIO()))
 
         # then
         self.assertEqual(127, self.memory.cell)
 
-    @patch('sys.stdin.buffer.read', side_effect=['\r', '\n'])
+    def test_should_store_eof_value(self):
+
+        # given
+        self.memory.cell = 127
+
+        # when
+        brainf.interpreter.get_char(self.memory, brainf.streams.Input(io.BytesIO(), eof=-1))
+
+        # then
+        self.assertEqual(255, self.memory.cell)
+
     @patch('os.linesep', '\r\n')
-    def test_should_handle_newline_on_windows(self, _):
+    def test_should_handle_newline_on_windows(self):
 
         # when
-        brainf.interpreter.get_char(self.memory)
+        brainf.interpreter.get_char(self.memory, brainf.streams.Input(io.BytesIO(b'\r\n'), text=True))
 
         # then
         self.assertEqual(10, self.memory.cell)
 
-    @patch('sys.stdin.buffer.read', side_effect=['\r'])
     @patch('os.linesep', '\r')
-    def test_should_handle_newline_on_mac(self, _):
+    def test_should_handle_newline_on_mac(self):
 
         # when
-        brainf.interpreter.get_char(self.memory)
+        brainf.interpreter.get_char(self.memory, brainf.streams.Input(io.BytesIO(b'\r'), text=True))
 
         # then
         self.assertEqual(10, self.memory.cell)
 
-    @patch('sys.stdin.buffer.read', side_effect=['\n'])
     @patch('os.linesep', '\n')
-    def test_should_handle_newline_on_linux(self, _):
+    def test_should_handle_newline_on_linux(self):
 
         # when
-        brainf.interpreter.get_char(self.memory)
+        brainf.interpreter.get_char(self.memory, brainf.streams.Input(io.BytesIO(b'\n'), text=True))
 
         # then
         self.assertEqual(10, self.memory.cell)
 
-    @patch('sys.stdin.buffer.read', return_value='A')
-    def test_should_handle_regular_character(self, _):
+    def test_should_handle_regular_character(self):
 
         # when
-        brainf.interpreter.get_char(self.memory)
+        brainf.interpreter.get_char(self.memory, brainf.streams.Input(io.BytesIO(b'A')))
 
         # then
         self.assertEqual(65, self.memory.cell)
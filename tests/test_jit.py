@@ -0,0 +1,169 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import ctypes
+import glob
+import io
+import os
+
+import brainf
+import brainf.jit
+
+SAMPLES = os.path.join(os.path.dirname(__file__), os.pardir, 'samples')
+
+
+class TestAssembler(unittest.TestCase):
+
+    def test_should_resolve_forward_and_backward_jumps(self):
+
+        # given
+        assembler = brainf.jit.Assembler()
+        assembler.label('start')
+        assembler.jump('end')
+        assembler.jump('start', brainf.jit.JNE)
+        assembler.label('end')
+
+        # when
+        code = assembler.link()
+
+        # then
+        self.assertEqual(bytes.fromhex('e906000000' '0f85f5ffffff'), code)
+
+    def test_should_wrap_immediate_values(self):
+
+        # given
+        assembler = brainf.jit.Assembler()
+
+        # when
+        assembler.assemble(brainf.compiler.ADD, -1, -2)
+
+        # then
+        self.assertEqual(bytes.fromhex('41808424' 'ffffffff' 'fe'), assembler.link())
+
+
+@unittest.skipUnless(brainf.jit.is_supported(), 'requires Linux on x86-64')
+class TestExecute(unittest.TestCase):
+
+    def test_should_match_interpreter_on_samples(self):
+        for path in glob.glob(os.path.join(SAMPLES, '*.b')):
+            with self.subTest(path=os.path.basename(path)):
+
+                # given
+                code = brainf.SourceCode.from_file(path)
+                expected, actual = io.BytesIO(), io.BytesIO()
+
+                # when
+                brainf.interpret(code, brainf.Memory(), expected, io.BytesIO())
+                brainf.jit.execute(brainf.Program(code), brainf.Memory(), actual, io.BytesIO())
+
+                # then
+                self.assertEqual(expected.getvalue(), actual.getvalue())
+
+    def test_should_execute_program(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('-[>+<-]>[>+>+<<-]>.,[-]+++[>>]<<<[-<+>]'))
+        memory = brainf.Memory(16)
+        output = io.BytesIO()
+
+        # when
+        brainf.jit.execute(program, memory, output, io.BytesIO(b'z'))
+
+        # then
+        self.assertEqual(b'\xff', output.getvalue())
+        self.assertEqual([0, 0, 3, 255], list(memory.cells[:4]))
+        self.assertEqual(1, memory.pointer)
+
+    @unittest.skipUnless(brainf.jit.is_supported(), 'requires Linux on x86-64')
+    def test_should_not_leave_code_writable(self):
+
+        # given
+        code = brainf.jit.load(bytes.fromhex('c3'))
+        address = ctypes.addressof(code.buffer)
+
+        # when
+        with open('/proc/self/maps') as file_object:
+            permissions = [fields[1][:3] for fields in map(str.split, file_object)
+                           if int(fields[0].split('-')[0], 16) <= address
+                           < int(fields[0].split('-')[1], 16)]
+
+        # then
+        self.assertEqual(['r-x'], permissions)
+
+    def test_should_raise_memory_error(self):
+        for instructions, message in (('+[>+]', 'not enough memory'),
+                                      ('+[<+]', 'negative memory address'),
+                                      ('+[->>>>>>>>>+<<<<<<<<<]', 'not enough memory'),
+                                      ('>>-[<<<+>>>+]', 'negative memory address')):
+            with self.subTest(instructions=instructions):
+                program = brainf.Program(brainf.SourceCode(instructions))
+                with self.assertRaisesRegex(MemoryError, message):
+                    brainf.jit.execute(program, brainf.Memory(8), io.BytesIO())
+
+    def test_should_propagate_errors_raised_by_streams(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode(',.'))
+        source = io.BytesIO()
+
+        # then
+        with patch.object(source, 'read1', side_effect=ValueError('closed')):
+            with self.assertRaisesRegex(ValueError, 'closed'):
+                # when
+                brainf.jit.execute(program, brainf.Memory(), io.BytesIO(), source)
+
+
+class TestFallback(unittest.TestCase):
+
+    @patch('brainf.jit.is_supported', return_value=False)
+    @patch('brainf.codegen.execute')
+    def test_should_fall_back_to_python_on_other_platforms(self, mock_execute, _):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.jit.execute(program, memory)
+
+        # then
+        mock_execute.assert_called_once_with(program, memory, None, None, None, None, None)
+
+    @patch('brainf.codegen.execute')
+    def test_should_fall_back_to_python_for_wide_cells(self, mock_execute):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+'))
+        memory = brainf.Memory(cell_bits=16)
+
+        # when
+        brainf.jit.execute(program, memory)
+
+        # then
+        mock_execute.assert_called_once_with(program, memory, None, None, None, None, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
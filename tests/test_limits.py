@@ -0,0 +1,178 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import io
+import tempfile
+
+import brainf
+import brainf.codegen
+import brainf.limits
+import brainf.tiered
+import brainf.transpiler
+
+
+class TestBudget(unittest.TestCase):
+
+    def test_should_not_limit_by_default(self):
+
+        # when
+        budget = brainf.limits.Budget()
+
+        # then
+        self.assertFalse(budget.limited)
+        self.assertEqual(brainf.limits.UNLIMITED, budget.limit)
+
+    def test_should_hand_out_limit_past_max_steps(self):
+
+        # given
+        budget = brainf.limits.Budget(max_steps=10)
+
+        # when
+        limit = budget.check(5)
+
+        # then
+        self.assertTrue(budget.limited)
+        self.assertEqual(11, limit)
+        self.assertEqual(5, budget.steps)
+
+    def test_should_raise_when_steps_exceed_limit(self):
+
+        # given
+        budget = brainf.limits.Budget(max_steps=10)
+
+        # then
+        with self.assertRaisesRegex(brainf.LimitExceeded, 'limit of 10 steps') as context:
+            # when
+            budget.check(11)
+        self.assertEqual(10, context.exception.steps)
+
+    def test_should_hand_out_limits_at_intervals(self):
+
+        # given
+        budget = brainf.limits.Budget(max_steps=1000, interval=300)
+
+        # when
+        limits = [budget.check(0), budget.check(800)]
+
+        # then
+        self.assertEqual([300, 1001], limits)
+        self.assertTrue(budget.limited)
+
+    @patch('time.monotonic', side_effect=[100.0, 100.0, 100.5, 102.0])
+    def test_should_read_clock_at_intervals(self, _):
+
+        # given
+        budget = brainf.limits.Budget(timeout=1.5)
+
+        # when
+        limit = budget.check(1)
+
+        # then
+        self.assertEqual(1 + brainf.limits.CLOCK_INTERVAL, limit)
+        with self.assertRaisesRegex(brainf.LimitExceeded, 'timeout of 1.5 seconds'):
+            budget.check(limit)
+
+
+class TestEngines(unittest.TestCase):
+
+    ENGINES = {
+        'ir': brainf.execute,
+        'python': brainf.codegen.execute,
+        'c': brainf.transpiler.execute,
+        'tiered': brainf.tiered.execute,
+    }
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        patcher = patch.dict('os.environ', XDG_CACHE_HOME=temp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_should_stop_infinite_loop_after_max_steps(self):
+        program = brainf.Program(brainf.SourceCode('+.[]'))
+        for name, engine in self.ENGINES.items():
+            with self.subTest(engine=name):
+
+                # given
+                output, stats = io.BytesIO(), {}
+
+                # when
+                with self.assertRaises(brainf.LimitExceeded) as context:
+                    engine(program, brainf.Memory(), output, io.BytesIO(), stats, max_steps=5000)
+
+                # then
+                self.assertEqual(5000, context.exception.steps)
+                self.assertEqual(5000, stats['steps'])
+                self.assertEqual(b'\x01', output.getvalue())
+
+    def test_should_stop_infinite_loop_after_timeout(self):
+        program = brainf.Program(brainf.SourceCode('+[>+<]'))
+        for name, engine in self.ENGINES.items():
+            with self.subTest(engine=name):
+                with self.assertRaisesRegex(brainf.LimitExceeded, 'timeout'):
+                    engine(program, brainf.Memory(), io.BytesIO(), io.BytesIO(), timeout=0.01)
+
+    def test_should_count_loop_iterations(self):
+        program = brainf.Program(brainf.SourceCode('+++[>+++[>.<-]<-]'))
+        for name, engine in self.ENGINES.items():
+            with self.subTest(engine=name):
+
+                # given
+                stats = {}
+
+                # when
+                engine(program, brainf.Memory(), io.BytesIO(), io.BytesIO(), stats,
+                       max_steps=100)
+
+                # then
+                self.assertEqual(12, stats['steps'])
+
+    def test_should_not_count_steps_without_limits(self):
+        program = brainf.Program(brainf.SourceCode('+++[>+++[>.<-]<-]'))
+        for name, engine in self.ENGINES.items():
+            with self.subTest(engine=name):
+
+                # given
+                stats = {}
+
+                # when
+                engine(program, brainf.Memory(), io.BytesIO(), io.BytesIO(), stats)
+
+                # then
+                self.assertNotIn('steps', stats)
+
+
+class TestInterpret(unittest.TestCase):
+
+    def test_should_stop_infinite_loop_after_max_steps(self):
+        with self.assertRaises(brainf.LimitExceeded) as context:
+            brainf.interpret(brainf.SourceCode('+[]'), brainf.Memory(), io.BytesIO(),
+                             io.BytesIO(), max_steps=100)
+        self.assertEqual(100, context.exception.steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
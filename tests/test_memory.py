@@ -20,8 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import io
+import os
+import tempfile
 import unittest
+from array import array
+from unittest.mock import patch
 
+import brainf
 import brainf.memory
 
 
@@ -37,6 +43,22 @@ class TestMemory(unittest.TestCase):
         memory = brainf.memory.Memory(16)
         self.assertEqual(16, len(memory.cells))
 
+    def test_should_accept_deprecated_num_bytes(self):
+        with self.assertWarns(DeprecationWarning):
+            memory = brainf.memory.Memory(num_bytes=16)
+        self.assertEqual(16, len(memory.cells))
+
+    def test_should_allocate_compact_cells(self):
+        for cell_bits, itemsize in ((8, 1), (16, 2), (32, 4)):
+            with self.subTest(cell_bits=cell_bits):
+                memory = brainf.memory.Memory(16, cell_bits)
+                self.assertEqual(16, len(memory.cells))
+                self.assertEqual(itemsize, memoryview(memory.cells).itemsize)
+
+    def test_should_reject_unsupported_cell_width(self):
+        with self.assertRaises(ValueError):
+            brainf.memory.Memory(16, 12)
+
     def test_should_init_pointer_at_zero(self):
         self.assertEqual(0, self.memory.pointer)
 
@@ -84,6 +106,33 @@ class TestMemory(unittest.TestCase):
         # then
         self.assertEqual(126, self.memory.cell)
 
+    def test_should_wrap_around_on_increment(self):
+        for cell_bits in (8, 16, 32):
+            with self.subTest(cell_bits=cell_bits):
+
+                # given
+                memory = brainf.memory.Memory(16, cell_bits)
+                memory.cell = 2**cell_bits - 1
+
+                # when
+                memory.incr()
+
+                # then
+                self.assertEqual(0, memory.cell)
+
+    def test_should_wrap_around_on_decrement(self):
+        for cell_bits in (8, 16, 32):
+            with self.subTest(cell_bits=cell_bits):
+
+                # given
+                memory = brainf.memory.Memory(16, cell_bits)
+
+                # when
+                memory.decr()
+
+                # then
+                self.assertEqual(2**cell_bits - 1, memory.cell)
+
     def test_should_move_pointer_forward(self):
 
         # given
@@ -126,6 +175,391 @@ class TestMemory(unittest.TestCase):
             # when
             self.memory.movb()
 
+    def test_should_scan_forward_for_zero(self):
+
+        # given
+        self.memory.cells[:100] = [1] * 100
+        self.memory.pointer = 5
+
+        # when
+        self.memory.scan(1)
+
+        # then
+        self.assertEqual(100, self.memory.pointer)
+
+    def test_should_scan_backwards_for_zero(self):
+
+        # given
+        self.memory.cells[11:100] = [1] * 89
+        self.memory.pointer = 99
+
+        # when
+        self.memory.scan(-1)
+
+        # then
+        self.assertEqual(10, self.memory.pointer)
+
+    def test_should_scan_with_stride(self):
+
+        # given
+        self.memory.cells[0:50] = [1] * 50
+        self.memory.pointer = 3
+
+        # when
+        self.memory.scan(3)
+
+        # then
+        self.assertEqual(51, self.memory.pointer)
+
+    def test_should_scan_wide_cells(self):
+
+        # given
+        memory = brainf.memory.Memory(cell_bits=16)
+        memory.cells[10:1000] = array('H', [1000] * 990)
+        memory.pointer = 999
+
+        # when
+        memory.scan(-1)
+
+        # then
+        self.assertEqual(9, memory.pointer)
+
+    def test_should_stay_in_place_when_scanning_zero_cell(self):
+
+        # given
+        self.memory.pointer = 42
+
+        # when
+        self.memory.scan(-1)
+
+        # then
+        self.assertEqual(42, self.memory.pointer)
+
+    def test_should_overflow_when_scanning(self):
+
+        # given
+        memory = brainf.memory.Memory(100)
+        memory.cells[:] = [1] * 100
+        memory.pointer = 1
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'not enough memory'):
+            # when
+            memory.scan(2)
+
+    def test_should_underflow_when_scanning(self):
+
+        # given
+        self.memory.cells[:100] = [1] * 100
+        self.memory.pointer = 98
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'negative memory address'):
+            # when
+            self.memory.scan(-2)
+
+
+class TestGrowableMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.memory = brainf.memory.GrowableMemory(16)
+
+    def test_should_start_small(self):
+        self.assertEqual(16, self.memory.allocated)
+
+    def test_should_double_when_moving_past_end(self):
+
+        # given
+        self.memory.pointer = 15
+        self.memory.cell = 42
+
+        # when
+        self.memory.movf()
+
+        # then
+        self.assertEqual(32, len(self.memory.cells))
+        self.assertEqual(16, self.memory.pointer)
+        self.assertEqual(42, self.memory.cells[15])
+
+    def test_should_grow_left_of_initial_cell(self):
+
+        # given
+        self.memory.cell = 42
+
+        # when
+        self.memory.movb()
+
+        # then
+        self.assertEqual(32, len(self.memory.cells))
+        self.assertEqual(16, self.memory.origin)
+        self.assertEqual(15, self.memory.pointer)
+        self.assertEqual(42, self.memory.cells[16])
+
+    def test_should_grow_in_place(self):
+
+        # given
+        cells = self.memory.cells
+
+        # when
+        self.memory.ensure(-1, 100)
+
+        # then
+        self.assertIs(cells, self.memory.cells)
+        self.assertEqual(128, len(cells))
+
+    def test_should_grow_wide_cells(self):
+
+        # given
+        memory = brainf.memory.GrowableMemory(16, 16)
+
+        # when
+        memory.ensure(-20, 0)
+
+        # then
+        self.assertEqual(64, len(memory.cells))
+        self.assertEqual('H', memory.cells.typecode)
+
+    def test_should_not_grow_beyond_max_cells(self):
+
+        # given
+        memory = brainf.memory.GrowableMemory(16, max_cells=64)
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'not enough memory'):
+            # when
+            memory.ensure(0, 64)
+
+    def test_should_grow_when_scanning(self):
+        for stride in (1, 3, -1, -3):
+            with self.subTest(stride=stride):
+
+                # given
+                memory = brainf.memory.GrowableMemory(16)
+                memory.cells[:] = bytes([1] * 16)
+                memory.pointer = 8
+
+                # when
+                memory.scan(stride)
+
+                # then
+                self.assertEqual(0, memory.cell)
+                self.assertEqual(1, memory.cells[memory.pointer - stride])
+
+
+class TestPagedMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.memory = brainf.memory.PagedMemory()
+
+    def test_should_start_without_pages(self):
+        self.assertEqual(0, self.memory.allocated)
+        self.assertEqual(0, self.memory.cell)
+
+    def test_should_start_in_the_middle(self):
+        self.assertEqual(2**31, self.memory.pointer)
+        self.assertEqual(2**31, self.memory.origin)
+
+    def test_should_allocate_pages_on_write(self):
+
+        # when
+        self.memory.cell = 42
+        self.memory.pointer += 10**9
+        self.memory.cell = 0
+        self.memory.incr()
+
+        # then
+        self.assertEqual(2 * brainf.memory.PAGE_SIZE, self.memory.allocated)
+        self.assertEqual(1, self.memory.cell)
+
+    def test_should_raise_outside_of_address_space(self):
+
+        # given
+        memory = brainf.memory.PagedMemory(2**16)
+        memory.pointer = 0
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'negative memory address'):
+            # when
+            memory.movb()
+
+    def test_should_scan_across_pages(self):
+        for stride in (1, 3, -1, -3):
+            with self.subTest(stride=stride):
+
+                # given
+                memory = brainf.memory.PagedMemory()
+                for i in range(10000):
+                    memory.cells[memory.pointer + i * stride] = 1
+
+                # when
+                memory.scan(stride)
+
+                # then
+                self.assertEqual(2**31 + 10000 * stride, memory.pointer)
+
+
+class TestMappedMemory(unittest.TestCase):
+
+    def test_should_map_large_memory(self):
+
+        # given
+        memory = brainf.memory.MappedMemory()
+        self.addCleanup(memory.close)
+
+        # when
+        memory.pointer = 2**30 - 1
+        memory.incr()
+
+        # then
+        self.assertEqual(2**30, memory.allocated)
+        self.assertEqual(1, memory.cells[2**30 - 1])
+
+    def test_should_map_wide_cells(self):
+        for cell_bits, itemsize in ((8, 1), (16, 2), (32, 4)):
+            with self.subTest(cell_bits=cell_bits):
+
+                # given
+                memory = brainf.memory.MappedMemory(16, cell_bits)
+                self.addCleanup(memory.close)
+
+                # when
+                memory.decr()
+
+                # then
+                self.assertEqual(16, len(memory.cells))
+                self.assertEqual(itemsize, memoryview(memory.cells).itemsize)
+                self.assertEqual(2**cell_bits - 1, memory.cell)
+
+    def test_should_save_cells_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+
+            # given
+            path = os.path.join(directory, 'tape')
+            memory = brainf.memory.MappedMemory(16, 16, path)
+            memory.pointer = 3
+            memory.cell = 258
+
+            # when
+            memory.close()
+
+            # then
+            with open(path, 'rb') as file_object:
+                self.assertEqual(array('H', [0, 0, 0, 258] + [0] * 12).tobytes(),
+                                 file_object.read())
+
+    def test_should_scan_mapped_cells(self):
+        for cell_bits in (8, 16):
+            for stride in (1, 3, -1, -3):
+                with self.subTest(cell_bits=cell_bits, stride=stride):
+
+                    # given
+                    memory = brainf.memory.MappedMemory(1000, cell_bits)
+                    self.addCleanup(memory.close)
+                    for i in range(100, 900):
+                        memory.cells[i] = 1
+                    memory.pointer = 500
+
+                    # when
+                    memory.scan(stride)
+
+                    # then
+                    self.assertEqual(0, memory.cell)
+                    self.assertEqual(1, memory.cells[memory.pointer - stride])
+
+    def test_should_extend_mapped_extent_on_demand(self):
+
+        # given
+        memory = brainf.memory.MappedMemory(2**20)
+        self.addCleanup(memory.close)
+        memory.pointer = 2**16 - 1
+
+        # when
+        memory.ensure(0, 1)
+
+        # then
+        self.assertEqual(2**16 + 1, memory.extent)
+        self.assertEqual(2**20, len(memory.cells))
+
+    def test_should_open_memory_by_name(self):
+        memory = brainf.memory.open_memory('growable', 16)
+        self.assertIsInstance(memory, brainf.memory.GrowableMemory)
+        self.assertEqual(2**16 - 1, memory.mask)
+
+    def test_should_only_save_mapped_memory(self):
+        with self.assertRaises(ValueError):
+            brainf.memory.open_memory('fixed', path='/fake/path/to/tape')
+
+
+class TestTapes(unittest.TestCase):
+
+    ENGINES = {
+        'ir': brainf.execute,
+        'python': brainf.codegen.execute,
+        'c': brainf.transpiler.execute,
+        'jit': brainf.jit.execute,
+        'tiered': brainf.tiered.execute,
+    }
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        patcher = patch.dict('os.environ', XDG_CACHE_HOME=temp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_should_run_far_flung_programs(self):
+        source = ('<' * 40 + '+++' + '>' * 440 + '++.' + '<' * 440 + '.'
+                  '[-' + '<' * 100 + '+' + '>' * 100 + ']' + '<' * 100 + '.')
+        program = brainf.Program(brainf.SourceCode(source))
+        for tape in (brainf.GrowableMemory, brainf.PagedMemory):
+            for name, engine in self.ENGINES.items():
+                with self.subTest(tape=tape.__name__, engine=name):
+
+                    # given
+                    output = io.BytesIO()
+
+                    # when
+                    engine(program, tape(), output, io.BytesIO())
+
+                    # then
+                    self.assertEqual(b'\x02\x03\x03', output.getvalue())
+
+    def test_should_track_high_water_mark(self):
+        program = brainf.Program(brainf.SourceCode('>' * 100 + '+[[>>+<<-]+>]'))
+        for cell_bits in (8, 16):
+            for name, engine in self.ENGINES.items():
+                with self.subTest(cell_bits=cell_bits, engine=name):
+
+                    # given
+                    memory = brainf.MappedMemory(2**20, cell_bits)
+                    self.addCleanup(memory.close)
+
+                    # when
+                    engine(program, memory, io.BytesIO(), io.BytesIO())
+
+                    # then
+                    self.assertEqual(101, memory.pointer)
+                    self.assertLessEqual(memory.pointer + 2, memory.high_water_mark)
+                    self.assertLessEqual(memory.high_water_mark, 2 * (memory.pointer + 2))
+
+    def test_should_run_on_mapped_memory(self):
+        program = brainf.Program(brainf.SourceCode('++[>+++[>+<-]<-]+[>]>.'))
+        for cell_bits in (8, 16):
+            for name, engine in self.ENGINES.items():
+                with self.subTest(cell_bits=cell_bits, engine=name):
+
+                    # given
+                    memory = brainf.MappedMemory(2**20, cell_bits)
+                    self.addCleanup(memory.close)
+                    output = io.BytesIO()
+
+                    # when
+                    engine(program, memory, output, io.BytesIO())
+
+                    # then
+                    self.assertEqual(b'\x06', output.getvalue())
+                    self.assertEqual(2, memory.pointer)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,89 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+
+import io
+
+import brainf
+import brainf.profiler
+
+
+class TestProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.code = brainf.SourceCode('set\n++[>+++\n[>+<-]<-]\n>>.')
+        self.profile = brainf.profiler.Profile()
+        brainf.interpret(self.code, brainf.Memory(), io.BytesIO(), io.BytesIO(), self.profile)
+
+    def test_should_count_executions_per_instruction(self):
+        self.assertEqual([1, 1, 3, 2, 2, 2, 2, 8, 6, 6, 6, 6, 6, 2, 2, 2, 1, 1, 1],
+                         self.profile.counts)
+        self.assertEqual(60, self.profile.executed)
+
+    def test_should_return_loops_sorted_by_executed_instructions(self):
+
+        # when
+        loops = self.profile.loops()
+
+        # then
+        self.assertEqual([
+            brainf.profiler.Loop(start=2, end=15, line=2, column=3, entries=1, iterations=2, executed=55),
+            brainf.profiler.Loop(start=7, end=12, line=3, column=1, entries=2, iterations=6, executed=38),
+        ], loops)
+
+    def test_should_report_hottest_loops(self):
+
+        # when
+        report = self.profile.report(limit=1)
+
+        # then
+        self.assertIn('60 instructions executed', report)
+        self.assertIn('     2:3             55  91.7%          1            2  [>+++[>+<-]<-]', report)
+        self.assertNotIn('3:1', report)
+
+    def test_should_annotate_source_lines(self):
+
+        # when
+        heatmap = self.profile.heatmap().split('\n')
+
+        # then
+        self.assertEqual(['               | set',
+                          '          13 * | ++[>+++',
+                          '          44 @ | [>+<-]<-]',
+                          '           3 - | >>.'], heatmap)
+
+    def test_should_serialize_to_json(self):
+
+        # when
+        data = self.profile.to_json()
+
+        # then
+        self.assertEqual(60, data['executed'])
+        self.assertEqual('++[>+++[>+<-]<-]>>.', data['instructions'])
+        self.assertEqual((2, 1), data['positions'][0])
+        self.assertEqual(2, len(data['loops']))
+        self.assertEqual(55, data['loops'][0]['executed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
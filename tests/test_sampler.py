@@ -0,0 +1,117 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+
+import collections
+import io
+
+import brainf
+import brainf.sampler
+from brainf.compiler import ADD, MOVE, OPEN, CLOSE
+
+
+class TestSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.code = brainf.SourceCode('set\n++[>+++\n[>.<-]<-]\n>>.')
+        self.sampler = brainf.sampler.Sampler()
+        self.sampler.program = brainf.Program(self.code)
+
+    def test_should_name_frames_after_enclosing_loops(self):
+
+        # given
+        self.sampler.samples.update({6: 3, 1: 2, 12: 1, None: 4})
+
+        # when
+        stacks = self.sampler.stacks(self.code.positions)
+
+        # then
+        self.assertEqual(collections.Counter({
+            ('loop@2:3', 'loop@3:1', 'OUT@3:2'): 3,
+            ('loop@2:3', 'OPEN@2:3'): 2,
+            ('loop@2:3', 'CLOSE@3:9'): 1,
+            (): 4,
+        }), stacks)
+
+    def test_should_fall_back_to_source_indices(self):
+
+        # given
+        self.sampler.samples.update({6: 3})
+
+        # when
+        stacks = self.sampler.stacks()
+
+        # then
+        self.assertEqual([('loop@2', 'loop@7', 'OUT@8')], list(stacks))
+
+    def test_should_format_collapsed_stacks(self):
+
+        # given
+        self.sampler.samples.update({6: 3, 1: 2, None: 4})
+
+        # when
+        collapsed = self.sampler.collapsed('file.b', self.code.positions)
+
+        # then
+        self.assertEqual('file.b 4\n'
+                         'file.b;loop@2:3;OPEN@2:3 2\n'
+                         'file.b;loop@2:3;loop@3:1;OUT@3:2 3', collapsed)
+
+    def test_should_sample_running_engine(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('-[>-[>-[>+<-]<-]<-]'))
+        sampler = brainf.sampler.Sampler(interval=0.0005)
+
+        # when
+        sampler.start(program)
+        try:
+            brainf.execute(program, brainf.Memory(), io.BytesIO(), io.BytesIO())
+        finally:
+            sampler.stop()
+
+        # then
+        self.assertGreater(sampler.total, 0)
+        stacks = sampler.stacks()
+        # Samples may also land just before the loop or outside of the engine
+        self.assertIn(('loop@1',), {stack[:1] for stack in stacks})
+        self.assertLessEqual({stack[:1] for stack in stacks}, {('loop@1',), ('ADD@0',), ()})
+
+
+class TestNesting(unittest.TestCase):
+
+    def test_should_return_innermost_loop_of_each_op(self):
+
+        # given
+        ops = brainf.compiler.link([(ADD, 0, 1), (OPEN, 0, 0), (OPEN, 0, 0), (MOVE, 0, 1),
+                                    (CLOSE, 0, 0), (CLOSE, 0, 0)])
+
+        # when
+        parents = brainf.sampler.nesting(ops)
+
+        # then
+        self.assertListEqual([None, None, 1, 2, 2, 1], parents)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import os
+import signal
+import socket
+import tempfile
+import threading
+
+import brainf.client
+import brainf.limits
+import brainf.server
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        patcher = patch.dict('os.environ', XDG_CACHE_HOME=temp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Workers change directory to that of the client
+        self.addCleanup(os.chdir, os.getcwd())
+        self.directory = temp.name
+        for name, content in [('a.b', '++++++++[>++++++++<-]>+.'),
+                              ('cat.b', ',[.,]'),
+                              ('loop.b', '+[]'),
+                              ('input.txt', 'xyz')]:
+            with open(self.path(name), 'w') as file_object:
+                file_object.write(content)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def open_streams(self, stdin='input.txt'):
+        """Return descriptors of stdin, stdout and stderr backed by files."""
+        streams = [open(self.path(stdin), 'rb'),
+                   open(self.path('stdout.txt'), 'wb'),
+                   open(self.path('stderr.txt'), 'wb')]
+        for stream in streams:
+            self.addCleanup(stream.close)
+        return [stream.fileno() for stream in streams]
+
+    def read(self, name):
+        with open(self.path(name)) as file_object:
+            return file_object.read()
+
+
+class TestRequest(TestServer):
+
+    def test_should_pass_arguments_and_descriptors(self):
+
+        # given
+        client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(client.close)
+        self.addCleanup(server.close)
+        fds = self.open_streams()
+
+        # when
+        brainf.client.send_request(client, ['--eof', '0', 'a.b'], self.directory, fds)
+        argv, cwd, received = brainf.server.receive_request(server)
+
+        # then
+        self.assertEqual(['--eof', '0', 'a.b'], argv)
+        self.assertEqual(self.directory, cwd)
+        self.assertEqual(3, len(received))
+        for fd, original in zip(received, fds):
+            self.assertNotEqual(original, fd)
+            self.assertEqual(os.fstat(original).st_ino, os.fstat(fd).st_ino)
+            os.close(fd)
+
+    def test_should_reject_request_without_descriptors(self):
+
+        # given
+        client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(client.close)
+        self.addCleanup(server.close)
+        client.sendall(b'{"argv": [], "cwd": "/"}\n')
+
+        # then
+        with self.assertRaisesRegex(ValueError, 'malformed request'):
+            # when
+            brainf.server.receive_request(server)
+
+
+class TestHandle(TestServer):
+
+    def test_should_run_command_with_given_streams(self):
+
+        # given
+        programs = {}
+
+        # when
+        status = brainf.server.handle(
+            ['--eof', '0', 'cat.b'], self.directory, self.duplicate(), programs)
+
+        # then
+        self.assertEqual(0, status)
+        self.assertEqual('xyz', self.read('stdout.txt'))
+        self.assertEqual(1, len(programs))
+
+    def test_should_reuse_programs(self):
+
+        # given
+        programs = {}
+        brainf.server.handle(['--stats', 'a.b'], self.directory, self.duplicate(), programs)
+
+        # when
+        with patch('brainf.cache.read') as mock_read:
+            brainf.server.handle(['--stats', 'a.b'], self.directory, self.duplicate(), programs)
+
+        # then
+        mock_read.assert_not_called()
+        self.assertIn('program_cached: True', self.read('stderr.txt'))
+
+    def test_should_return_exit_status(self):
+
+        # when
+        status = brainf.server.handle(
+            ['--max-steps', '10', 'loop.b'], self.directory, self.duplicate(), {})
+
+        # then
+        self.assertEqual(brainf.limits.EXIT_STATUS, status)
+        self.assertIn('exceeded the limit of 10 steps', self.read('stderr.txt'))
+
+    def test_should_interrupt_when_client_hangs_up(self):
+
+        # given
+        client, server = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(server.close)
+
+        # then
+        with self.assertRaises(KeyboardInterrupt):
+            # when
+            with brainf.server.interrupt_on_hangup(server):
+                client.close()
+                brainf.server.handle(['loop.b'], self.directory, self.duplicate(), {})
+
+    def test_should_report_invalid_arguments(self):
+
+        # when
+        status = brainf.server.handle(['--bogus'], self.directory, self.duplicate(), {})
+
+        # then
+        self.assertEqual(2, status)
+        self.assertIn('usage:', self.read('stderr.txt'))
+
+    def test_should_report_error(self):
+
+        # when
+        status = brainf.server.handle(['missing.b'], self.directory, self.duplicate(), {})
+
+        # then
+        self.assertEqual(1, status)
+        self.assertIn('FileNotFoundError', self.read('stderr.txt'))
+
+    def duplicate(self):
+        """Return copies of descriptors, which handle() takes ownership of."""
+        return [os.dup(fd) for fd in self.open_streams()]
+
+
+class TestSpawn(TestServer):
+
+    def test_should_abort_command_on_hangup_despite_ignored_sigint(self):
+
+        # given
+        server = brainf.server.listen(self.path('brainf.sock'))
+        self.addCleanup(server.close)
+        handler = signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            pid = brainf.server.spawn(server)
+        finally:
+            signal.signal(signal.SIGINT, handler)
+        self.addCleanup(os.waitpid, pid, 0)
+        self.addCleanup(os.kill, pid, signal.SIGTERM)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(self.path('brainf.sock'))
+            brainf.client.send_request(client, ['loop.b'], self.directory, self.open_streams())
+
+        # when
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(10)
+            client.connect(self.path('brainf.sock'))
+            brainf.client.send_request(client, ['a.b'], self.directory, self.open_streams())
+            reply = client.recv(64)
+
+        # then
+        self.assertEqual(b'0\n', reply)
+
+
+class TestForward(TestServer):
+
+    def test_should_return_none_without_daemon(self):
+        self.assertIsNone(brainf.client.forward(self.path('missing.sock'), ['a.b']))
+
+    def test_should_run_local_commands_here(self):
+        with patch.dict('os.environ', BRAINF_SOCKET=self.path('brainf.sock')):
+            self.assertIsNone(brainf.client.main(['batch', 'a.b']))
+
+    def test_should_hang_up_when_interrupted(self):
+
+        # given
+        server = brainf.server.listen(self.path('brainf.sock'))
+        self.addCleanup(server.close)
+        main = threading.main_thread().ident
+        timer = threading.Timer(0.1, signal.pthread_kill, (main, signal.SIGINT))
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        # when
+        status = brainf.client.forward(self.path('brainf.sock'), ['a.b'], self.open_streams())
+
+        # then
+        self.assertEqual(brainf.client.INTERRUPTED, status)
+        connection, _ = server.accept()
+        with connection:
+            argv, _, fds = brainf.server.receive_request(connection)
+            for fd in fds:
+                os.close(fd)
+            self.assertEqual(['a.b'], argv)
+            self.assertEqual(b'', connection.recv(1))
+
+    def test_should_run_command_by_worker(self):
+
+        # given
+        server = brainf.server.listen(self.path('brainf.sock'))
+        self.addCleanup(server.close)
+        worker = threading.Thread(target=brainf.server.work, args=(server,), daemon=True)
+        worker.start()
+
+        # when
+        status = brainf.client.forward(
+            self.path('brainf.sock'), ['--eof', '0', self.path('cat.b')], self.open_streams())
+
+        # then
+        self.assertEqual(0, status)
+        self.assertEqual('xyz', self.read('stdout.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
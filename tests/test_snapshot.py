@@ -0,0 +1,274 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import io
+import os
+import signal
+import tempfile
+import unittest
+
+import brainf
+import brainf.snapshot
+
+# Prints 200 bytes counting down from 199 and then reads a byte to print
+SOURCE = '++++++++[>+++++++++++++++++++++++++<-]>[-.]' + ',.'
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'state.bfs')
+        self.program = brainf.Program(brainf.SourceCode(SOURCE))
+
+    def capture(self, memory, counter=0, steps=0, output=None, input=None):
+        if output is None:
+            output = brainf.streams.Output(io.BytesIO())
+        if input is None:
+            input = brainf.streams.Input(io.BytesIO())
+        return brainf.snapshot.Snapshot.capture(self.program, memory, counter, steps,
+                                                output, input)
+
+    def test_should_refer_to_cells_up_to_last_non_zero_one(self):
+
+        # given
+        memory = brainf.Memory()
+        memory.ensure(0, 99)
+        memory.cells[99] = 1
+
+        # when
+        snapshot = self.capture(memory)
+
+        # then
+        self.assertEqual(100, len(snapshot.cells))
+        self.assertIs(memory.cells, snapshot.cells.obj)
+
+    def test_should_keep_cells_up_to_pointer(self):
+
+        # given
+        memory = brainf.Memory(cell_bits=16)
+        memory.cells[5] = 256
+        memory.pointer = 70000 // 2
+
+        # when
+        snapshot = self.capture(memory)
+
+        # then
+        self.assertEqual(35001, len(snapshot.cells))
+
+    def test_should_find_high_water_mark_in_last_block(self):
+        for cell_bits in (8, 16, 32):
+            with self.subTest(cell_bits=cell_bits):
+
+                # given
+                memory = brainf.Memory(2**18, cell_bits)
+                memory.cells[2**17 + 3] = 256 if cell_bits > 8 else 1
+
+                # when
+                count = brainf.snapshot.high_water_mark(memoryview(memory.cells))
+
+                # then
+                self.assertEqual(2**17 + 4, count)
+
+    def test_should_only_search_cells_within_extent(self):
+
+        # given
+        memory = brainf.MappedMemory(2**24)
+        self.addCleanup(memory.close)
+        memory.cells[3] = 1
+        memory.cells[2**20] = 1
+
+        # when
+        snapshot = self.capture(memory)
+
+        # then
+        self.assertEqual(4, len(snapshot.cells))
+
+    def test_should_save_and_load(self):
+
+        # given
+        memory = brainf.GrowableMemory(cell_bits=16)
+        memory.movb()
+        memory.cell = 1000
+        output = brainf.streams.Output(io.BytesIO())
+        output.write(33)
+        input = brainf.streams.Input(io.BytesIO(b'abc'))
+        input.read()
+
+        # when
+        self.capture(memory, 7, 42, output, input).save(self.path)
+        snapshot = brainf.snapshot.Snapshot.load(self.path)
+
+        # then
+        self.assertEqual('growable', snapshot.tape)
+        self.assertEqual(16, snapshot.cell_bits)
+        self.assertEqual((7, 42), (snapshot.counter, snapshot.steps))
+        self.assertEqual((15, 16), (snapshot.pointer, snapshot.origin))
+        self.assertEqual(1, snapshot.input_offset)
+        self.assertEqual(b'!', snapshot.output)
+        self.assertEqual(32, len(snapshot.cells))
+
+    def test_should_restore_state(self):
+
+        # given
+        memory = brainf.Memory(cell_bits=16)
+        memory.pointer = 3
+        memory.cell = 1000
+        output = brainf.streams.Output(io.BytesIO())
+        output.write(33)
+        self.capture(memory, output=output).save(self.path)
+        snapshot = brainf.snapshot.Snapshot.load(self.path)
+        memory = brainf.GrowableMemory(cell_bits=16)
+        output = brainf.streams.Output(io.BytesIO())
+        input = brainf.streams.Input(io.BytesIO(b'abc'))
+
+        # when
+        snapshot.restore(self.program, memory, output, input)
+
+        # then
+        self.assertEqual(3, memory.pointer)
+        self.assertEqual(1000, memory.cell)
+        self.assertEqual(b'!', output.pending)
+        self.assertEqual(0, input.offset)
+
+    def test_should_reject_different_program(self):
+
+        # given
+        snapshot = self.capture(brainf.Memory())
+        program = brainf.Program(brainf.SourceCode('+'))
+
+        # then
+        with self.assertRaisesRegex(ValueError, 'different program'):
+            # when
+            snapshot.restore(program, brainf.Memory(), None, None)
+
+    def test_should_reject_different_cell_width(self):
+
+        # given
+        snapshot = self.capture(brainf.Memory())
+
+        # then
+        with self.assertRaisesRegex(ValueError, '8-bit cells'):
+            # when
+            snapshot.restore(self.program, brainf.Memory(cell_bits=16), None, None)
+
+    def test_should_reject_memory_without_buffer(self):
+        with self.assertRaises(ValueError):
+            self.capture(brainf.PagedMemory())
+
+    def test_should_reject_other_files(self):
+
+        # given
+        with open(self.path, 'wb') as file_object:
+            file_object.write(b'BFS\x01')
+
+        # then
+        with self.assertRaisesRegex(ValueError, 'truncated'):
+            # when
+            brainf.snapshot.Snapshot.load(self.path)
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'state.bfs')
+        self.program = brainf.Program(brainf.SourceCode(SOURCE))
+
+    def test_should_save_snapshots_periodically(self):
+
+        # given
+        checkpoint = brainf.snapshot.Checkpoint(self.path, every=50)
+        output = io.BytesIO()
+
+        # when
+        brainf.execute(self.program, brainf.Memory(), output, io.BytesIO(b'!'),
+                       checkpoint=checkpoint)
+
+        # then
+        snapshot = brainf.snapshot.Snapshot.load(self.path)
+        self.assertEqual(200, snapshot.steps)
+        self.assertEqual(250, checkpoint.next)
+        self.assertEqual(bytes(range(199, -1, -1)) + b'!', output.getvalue())
+
+    def test_should_suspend_on_signal(self):
+
+        # given
+        checkpoint = brainf.snapshot.Checkpoint(self.path)
+        checkpoint.interval = 100
+        checkpoint.start()
+        self.addCleanup(checkpoint.stop)
+        output = io.BytesIO()
+
+        # when
+        os.kill(os.getpid(), signal.SIGTERM)
+        with self.assertRaises(brainf.snapshot.Suspended) as context:
+            brainf.execute(self.program, brainf.Memory(), output, io.BytesIO(b'!'),
+                           checkpoint=checkpoint)
+
+        # then
+        self.assertEqual(100, context.exception.steps)
+        self.assertEqual(b'', output.getvalue())
+        snapshot = brainf.snapshot.Snapshot.load(self.path)
+        self.assertEqual(bytes(range(199, 99, -1)), snapshot.output)
+
+    def test_should_resume_with_different_input(self):
+
+        # given
+        checkpoint = brainf.snapshot.Checkpoint(self.path, every=150)
+        brainf.execute(self.program, brainf.Memory(), io.BytesIO(), io.BytesIO(b'!'),
+                       checkpoint=checkpoint)
+        snapshot = brainf.snapshot.Snapshot.load(self.path)
+        outputs = []
+
+        # when
+        for data in (b'x', b'y'):
+            output = io.BytesIO()
+            brainf.execute(self.program, brainf.Memory(), output, io.BytesIO(data),
+                           resume=snapshot)
+            outputs.append(output.getvalue())
+
+        # then
+        self.assertEqual(bytes(range(199, -1, -1)) + b'x', outputs[0])
+        self.assertEqual(bytes(range(199, -1, -1)) + b'y', outputs[1])
+
+    def test_should_continue_counting_steps_after_resume(self):
+
+        # given
+        checkpoint = brainf.snapshot.Checkpoint(self.path, every=150)
+        brainf.execute(self.program, brainf.Memory(), io.BytesIO(), io.BytesIO(),
+                       checkpoint=checkpoint)
+        snapshot = brainf.snapshot.Snapshot.load(self.path)
+        stats = {}
+
+        # when
+        brainf.execute(self.program, brainf.Memory(), io.BytesIO(), io.BytesIO(), stats,
+                       max_steps=1000, resume=snapshot)
+
+        # then
+        self.assertEqual(200, stats['steps'])
+
+
+if __name__ == '__main__':
+    unittest.main()
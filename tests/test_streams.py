@@ -0,0 +1,295 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import io
+import os
+import tempfile
+
+import brainf.streams
+
+
+class TestOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.sink = io.BytesIO()
+
+    def test_should_buffer_until_flushed(self):
+
+        # given
+        output = brainf.streams.Output(self.sink)
+
+        # when
+        output.write(65)
+        output.write(10)
+
+        # then
+        self.assertEqual(b'', self.sink.getvalue())
+        output.flush()
+        self.assertEqual(b'A\n', self.sink.getvalue())
+
+    def test_should_flush_when_buffer_is_full(self):
+
+        # given
+        output = brainf.streams.Output(self.sink, buffer_size=3)
+
+        # when
+        for value in b'abcd':
+            output.write(value)
+
+        # then
+        self.assertEqual(b'abc', self.sink.getvalue())
+
+    def test_should_flush_on_newline_if_line_buffered(self):
+
+        # given
+        output = brainf.streams.Output(self.sink, line_buffering=True)
+
+        # when
+        for value in b'ab\ncd':
+            output.write(value)
+
+        # then
+        self.assertEqual(b'ab\n', self.sink.getvalue())
+
+    def test_should_line_buffer_terminal_by_default(self):
+        with patch.object(self.sink, 'isatty', return_value=True):
+            self.assertTrue(brainf.streams.Output(self.sink).line_buffering)
+        self.assertFalse(brainf.streams.Output(self.sink).line_buffering)
+
+    def test_should_write_lowest_byte_of_wide_cells(self):
+
+        # given
+        output = brainf.streams.Output(self.sink)
+
+        # when
+        output.write(0x141)
+        output.flush()
+
+        # then
+        self.assertEqual(b'A', self.sink.getvalue())
+
+
+    def test_should_restore_pending_bytes(self):
+
+        # given
+        output = brainf.streams.Output(io.BytesIO())
+        output.write(65)
+
+        # when
+        output.extend(output.pending + b'BC')
+
+        # then
+        self.assertEqual(b'AABC', output.pending)
+
+
+class TestTextOutput(unittest.TestCase):
+
+    def test_should_translate_newlines(self):
+
+        # given
+        sink = io.TextIOWrapper(io.BytesIO(), encoding='utf-8', newline='\r\n')
+        output = brainf.streams.TextOutput(sink)
+
+        # when
+        for value in b'a\nb':
+            output.write(value)
+        output.flush()
+
+        # then
+        self.assertEqual(b'a\r\nb', sink.buffer.getvalue())
+
+    def test_should_write_unicode_code_points(self):
+
+        # given
+        sink = io.StringIO()
+        output = brainf.streams.TextOutput(sink)
+
+        # when
+        output.write(0x141)
+        output.flush()
+
+        # then
+        self.assertEqual('Ł', sink.getvalue())
+
+
+    def test_should_encode_pending_characters(self):
+
+        # given
+        output = brainf.streams.TextOutput(io.StringIO())
+        output.write(321)
+
+        # when
+        output.extend(output.pending)
+
+        # then
+        self.assertEqual('ŁŁ'.encode('utf-8'), output.pending)
+
+
+class TestInput(unittest.TestCase):
+
+    def test_should_serve_bytes_in_order(self):
+
+        # given
+        input = brainf.streams.Input(io.BytesIO(b'abc'), block_size=2)
+
+        # when
+        values = [input.read() for _ in range(4)]
+
+        # then
+        self.assertEqual([97, 98, 99, None], values)
+
+    def test_should_read_in_blocks(self):
+
+        # given
+        source = io.BytesIO(b'x' * 10)
+        input = brainf.streams.Input(source, block_size=4)
+
+        # when
+        with patch.object(source, 'read1', wraps=source.read1) as mock_read1:
+            for _ in range(10):
+                input.read()
+
+        # then
+        self.assertEqual(3, mock_read1.call_count)
+
+    def test_should_count_bytes_served(self):
+
+        # given
+        input = brainf.streams.Input(io.BytesIO(b'abcdef'), block_size=4)
+
+        # when
+        for _ in range(5):
+            input.read()
+
+        # then
+        self.assertEqual(5, input.offset)
+
+    def test_should_skip_bytes_across_blocks(self):
+
+        # given
+        input = brainf.streams.Input(io.BytesIO(b'abcdefghij'), block_size=4)
+        input.read()
+
+        # when
+        input.skip(6)
+
+        # then
+        self.assertEqual(7, input.offset)
+        self.assertEqual([104, 105, 106, None], [input.read() for _ in range(4)])
+
+    def test_should_stop_skipping_at_end_of_input(self):
+
+        # given
+        input = brainf.streams.Input(io.BytesIO(b'abc'), eof=0)
+
+        # when
+        input.skip(10)
+
+        # then
+        self.assertEqual(3, input.offset)
+        self.assertEqual(0, input.read())
+
+    def test_should_return_eof_value_repeatedly(self):
+
+        # given
+        input = brainf.streams.Input(io.BytesIO(b''), eof=0)
+
+        # then
+        self.assertEqual([0, 0], [input.read(), input.read()])
+
+    @patch('os.linesep', '\r\n')
+    def test_should_translate_newline_split_across_blocks(self):
+
+        # given
+        input = brainf.streams.Input(io.BytesIO(b'a\r\nb\r'), block_size=2, text=True)
+
+        # when
+        values = [input.read() for _ in range(5)]
+
+        # then
+        self.assertEqual([97, 10, 98, 13, None], values)
+
+    @patch('os.linesep', '\r\n')
+    def test_should_not_translate_newlines_in_binary_mode(self):
+
+        # given
+        input = brainf.streams.Input(io.BytesIO(b'\r\n'))
+
+        # then
+        self.assertEqual([13, 10], [input.read(), input.read()])
+
+    def test_should_map_file(self):
+
+        # given
+        with tempfile.NamedTemporaryFile(delete=False) as file_object:
+            file_object.write(b'hi')
+        self.addCleanup(os.remove, file_object.name)
+
+        # when
+        input = brainf.streams.Input.from_file(file_object.name)
+
+        # then
+        self.assertEqual([104, 105, None], [input.read() for _ in range(3)])
+
+    def test_should_map_empty_file(self):
+
+        # given
+        with tempfile.NamedTemporaryFile(delete=False) as file_object:
+            pass
+        self.addCleanup(os.remove, file_object.name)
+
+        # when
+        input = brainf.streams.Input.from_file(file_object.name, eof=-1)
+
+        # then
+        self.assertEqual(-1, input.read())
+
+
+class TestOpenOutput(unittest.TestCase):
+
+    def test_should_return_output_unchanged(self):
+        output = brainf.streams.Output(io.BytesIO())
+        self.assertIs(output, brainf.streams.open_output(output))
+
+    def test_should_wrap_binary_sink(self):
+        sink = io.BytesIO()
+        output = brainf.streams.open_output(sink)
+        self.assertIsInstance(output, brainf.streams.Output)
+        self.assertIs(sink, output.sink)
+
+    def test_should_wrap_text_sink_in_text_mode(self):
+        sink = io.StringIO()
+        output = brainf.streams.open_output(sink, text=True)
+        self.assertIsInstance(output, brainf.streams.TextOutput)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    def test_should_fall_back_to_text_mode_without_binary_buffer(self, mock_stdout):
+        output = brainf.streams.open_output()
+        self.assertIsInstance(output, brainf.streams.TextOutput)
+        self.assertIs(mock_stdout, output.sink)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import io
+
+import brainf
+import brainf.codegen
+import brainf.tiered
+
+
+class TestExecute(unittest.TestCase):
+
+    def test_should_execute_program(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('++++++++++[>++++++<-]>+++++.,[>+<-]'))
+        memory = brainf.Memory()
+        output = io.BytesIO()
+
+        # when
+        brainf.tiered.execute(program, memory, output, io.BytesIO(b'z'), threshold=3)
+
+        # then
+        self.assertEqual(b'A', output.getvalue())
+        self.assertEqual(1, memory.pointer)
+        self.assertEqual([0, 0, 122], list(memory.cells[:3]))
+
+    def test_should_not_compile_cold_loops(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('++[>+++[>+<-]<-]'))
+        stats = {}
+
+        # when
+        with patch('brainf.codegen.translate') as mock_translate:
+            brainf.tiered.execute(program, brainf.Memory(), io.BytesIO(), stats=stats)
+
+        # then
+        mock_translate.assert_not_called()
+        self.assertEqual(0, stats['tier_ups'])
+
+    def test_should_compile_hot_loop_once(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('++++++++++[>++++++++++[>+<-]<-]>>.'))
+        memory = brainf.Memory()
+        output = io.BytesIO()
+        stats = {}
+
+        # when
+        with patch('brainf.codegen.translate', wraps=brainf.codegen.translate) as mock_translate:
+            brainf.tiered.execute(program, memory, output, stats=stats, threshold=5)
+
+        # then
+        mock_translate.assert_called_once_with(program, 1, False)
+        self.assertEqual(b'd', output.getvalue())
+        self.assertEqual(1, stats['tier_ups'])
+        self.assertEqual(5, stats['threshold'])
+
+    def test_should_raise_memory_error_in_compiled_loop(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[>+]'))
+
+        # then
+        with self.assertRaisesRegex(MemoryError, 'not enough memory'):
+            # when
+            brainf.tiered.execute(program, brainf.Memory(64), io.BytesIO(), threshold=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+# The MIT License (MIT)
+#
+# Copyright (c) 2018 Bartosz Zaczynski
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import unittest
+from unittest.mock import patch
+
+import io
+import os
+import tempfile
+
+import brainf
+import brainf.transpiler
+
+HAS_COMPILER = brainf.transpiler.find_compiler() is not None
+
+
+class TestGenerate(unittest.TestCase):
+
+    def test_should_generate_loops_as_while_statements(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+[>+<-.]'), optimize=False)
+
+        # when
+        source = brainf.transpiler.generate(program)
+
+        # then
+        self.assertIn('    while (cells[pointer]) {\n', source)
+        self.assertIn('        if (write(cells[pointer])) goto aborted;\n', source)
+
+    def test_should_declare_cell_type_of_given_width(self):
+        program = brainf.Program(brainf.SourceCode('+'))
+        self.assertIn('typedef uint16_t cell;', brainf.transpiler.generate(program, 2))
+
+    def test_should_search_memory_for_zero_in_scan_loop(self):
+        program = brainf.Program(brainf.SourceCode('[>]'))
+        self.assertIn('memchr', brainf.transpiler.generate(program))
+
+
+class TestExecute(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        patcher = patch.dict('os.environ', XDG_CACHE_HOME=temp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @unittest.skipUnless(HAS_COMPILER, 'no C compiler')
+    def test_should_execute_program(self):
+        for cell_bits in (8, 16, 32):
+            with self.subTest(cell_bits=cell_bits):
+
+                # given
+                program = brainf.Program(brainf.SourceCode('-[>+<-]>[>+>+<<-]>.,[-]+++[>>]'))
+                memory = brainf.Memory(16, cell_bits)
+                output = io.BytesIO()
+
+                # when
+                brainf.transpiler.execute(program, memory, output, io.BytesIO(b'z'))
+
+                # then
+                mask = 2**cell_bits - 1
+                self.assertEqual(bytes([mask & 0xff]), output.getvalue())
+                self.assertEqual([0, 0, 3, mask], list(memory.cells[:4]))
+                self.assertEqual(4, memory.pointer)
+
+    @unittest.skipUnless(HAS_COMPILER, 'no C compiler')
+    def test_should_raise_memory_error(self):
+        for instructions, message in (('+[>+]', 'not enough memory'),
+                                      ('+[<+]', 'negative memory address')):
+            with self.subTest(instructions=instructions):
+                program = brainf.Program(brainf.SourceCode(instructions))
+                with self.assertRaisesRegex(MemoryError, message):
+                    brainf.transpiler.execute(program, brainf.Memory(8), io.BytesIO())
+
+    @unittest.skipUnless(HAS_COMPILER, 'no C compiler')
+    def test_should_propagate_errors_raised_by_streams(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+.'))
+        output = brainf.streams.Output(io.BytesIO(), buffer_size=1)
+
+        # then
+        with patch.object(output.sink, 'write', side_effect=BrokenPipeError):
+            with self.assertRaises(BrokenPipeError):
+                # when
+                brainf.transpiler.execute(program, brainf.Memory(), output)
+
+    @unittest.skipUnless(HAS_COMPILER, 'no C compiler')
+    def test_should_reuse_cached_library(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+'))
+        brainf.transpiler.execute(program, brainf.Memory(), io.BytesIO())
+
+        # when
+        with patch('subprocess.run') as mock_run:
+            brainf.transpiler.execute(program, brainf.Memory(), io.BytesIO())
+
+        # then
+        mock_run.assert_not_called()
+        self.assertEqual(1, len(os.listdir(brainf.transpiler.cache_directory())))
+
+    @unittest.skipUnless(HAS_COMPILER, 'no C compiler')
+    def test_should_evict_least_recently_used_libraries(self):
+
+        # given
+        directory = brainf.transpiler.cache_directory()
+        brainf.transpiler.execute(brainf.Program(brainf.SourceCode('+')), brainf.Memory())
+        [name] = os.listdir(directory)
+        path = os.path.join(directory, name)
+        os.utime(path, (0, 0))
+
+        # when
+        with patch('brainf.transpiler.MAX_CACHE_SIZE', os.path.getsize(path)):
+            brainf.transpiler.execute(brainf.Program(brainf.SourceCode('-')), brainf.Memory())
+
+        # then
+        self.assertEqual(1, len(os.listdir(directory)))
+        self.assertFalse(os.path.exists(path))
+
+    @unittest.skipUnless(HAS_COMPILER, 'no C compiler')
+    def test_should_multiply_wide_cells_without_overflow(self):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('[->' + '+' * 200 + '<]'))
+        memory = brainf.Memory(16, 16)
+        memory.cells[0] = 60000
+
+        # when
+        brainf.transpiler.execute(program, memory, io.BytesIO())
+
+        # then
+        self.assertEqual(60000 * 200 % 2**16, memory.cells[1])
+
+    @patch('brainf.transpiler.find_compiler', return_value=None)
+    @patch('brainf.codegen.execute')
+    def test_should_fall_back_to_python_without_compiler(self, mock_execute, _):
+
+        # given
+        program = brainf.Program(brainf.SourceCode('+'))
+        memory = brainf.Memory()
+
+        # when
+        brainf.transpiler.execute(program, memory)
+
+        # then
+        mock_execute.assert_called_once_with(program, memory, None, None, None, None, None)
+
+
+if __name__ == '__main__':
+    unittest.main()